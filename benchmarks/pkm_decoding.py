@@ -0,0 +1,159 @@
+"""Decoding a full PC with PcPkm.from_bytes, against the per-field decoders
+that read every substructure field through read_int on a slice.
+
+    python benchmarks/pkm_decoding.py [SAVE_FILE]
+
+Without a save, a PC of random records is decoded.
+"""
+
+import importlib
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+data = importlib.import_module("pkm3-hex.data")
+utils = importlib.import_module("pkm3-hex.utils")
+Pkm = importlib.import_module("pkm3-hex.utils.Pkm")
+read_int = importlib.import_module("pkm3-hex.utils.bytes_handling").read_int
+
+PcPkm = utils.PcPkm
+Pc = importlib.import_module("pkm3-hex.utils.GameSaveBlock").Pc
+
+PC_SLOTS = 14 * Pc.Box.ROWS * Pc.Box.COLS
+REPEAT = 7
+
+
+def legacy_growth(buffer: bytes) -> Pkm.PkmGrowth:
+    return Pkm.PkmGrowth(
+        species=data.pkm_species[read_int(buffer[0x0:0x2])],
+        held_item=data.items[read_int(buffer[0x2:0x4])],
+        experience=read_int(buffer[0x4:0x8]),
+        friendship=buffer[0x9],
+        data=buffer,
+        pp_ups_byte=buffer[0x8],
+    )
+
+
+def legacy_attacks(buffer: bytes) -> Pkm.PkmAttacks:
+    return Pkm.PkmAttacks(
+        move1=data.moves[read_int(buffer[0x0:0x2])],
+        move2=data.moves[read_int(buffer[0x2:0x4])],
+        move3=data.moves[read_int(buffer[0x4:0x6])],
+        move4=data.moves[read_int(buffer[0x6:0x8])],
+        pp1=buffer[0x8],
+        pp2=buffer[0x9],
+        pp3=buffer[0xA],
+        pp4=buffer[0xB],
+        data=buffer,
+    )
+
+
+def legacy_evs_and_conditions(buffer: bytes) -> Pkm.PkmEvsAndConditions:
+    (
+        hp_evs,
+        atk_evs,
+        def_evs,
+        speed_evs,
+        sp_atk_evs,
+        sp_def_evs,
+        coolness,
+        beauty,
+        cuteness,
+        smartness,
+        toughness,
+        feel,
+    ) = (read_int(buffer[offset : offset + 1]) for offset in range(12))
+    return Pkm.PkmEvsAndConditions(
+        hp_evs=hp_evs,
+        atk_evs=atk_evs,
+        def_evs=def_evs,
+        speed_evs=speed_evs,
+        sp_atk_evs=sp_atk_evs,
+        sp_def_evs=sp_def_evs,
+        coolness=coolness,
+        beauty=beauty,
+        cuteness=cuteness,
+        smartness=smartness,
+        toughness=toughness,
+        feel=feel,
+        data=buffer,
+    )
+
+
+def legacy_misc(buffer: bytes) -> Pkm.PkmMisc:
+    return Pkm.PkmMisc(
+        pkrs_byte=buffer[0x0],
+        met_location=data.locations[buffer[0x1]],
+        origin=read_int(buffer[0x2:0x4]),
+        ivs_egg_ability=read_int(buffer[0x4:0x8]),
+        ribbons_obedience=read_int(buffer[0x8:]),
+        data=buffer,
+    )
+
+
+def legacy_from_bytes(record: bytes) -> PcPkm:
+    buffer = bytearray(record)
+    misc_flags = buffer[PcPkm.MISC_OFFSET]
+    substructures = PcPkm._Substructures.from_bytes(buffer, xor=True)
+    substructures.write_into(buffer)
+
+    checksum = read_int(buffer[PcPkm.CHECKSUM_OFFSET :], 2)
+    if substructures.data_sum() & 0xFF_FF != checksum:
+        buffer[PcPkm.MISC_OFFSET] |= 0x01
+
+    return PcPkm(
+        personality_value=substructures.pv,
+        original_trainer_id=substructures.otid,
+        nickname=buffer[PcPkm.NICKNAME_OFFSET : PcPkm.LANGUAGE_OFFSET],
+        language=buffer[PcPkm.LANGUAGE_OFFSET],
+        is_bad_egg=buffer[PcPkm.MISC_OFFSET] & 0x01 == 0x01,
+        misc_flags=misc_flags,
+        original_trainer_name=buffer[PcPkm.OT_NAME_OFFSET : PcPkm.MARKINGS_OFFSET],
+        markings=buffer[PcPkm.MARKINGS_OFFSET],
+        checksum=checksum,
+        substructure_order=substructures.order,
+        substructure_encryption_key=substructures.encryption_key,
+        growth=legacy_growth(substructures.get_substructure_bytes("G")),
+        attacks=legacy_attacks(substructures.get_substructure_bytes("A")),
+        evs_and_conditions=legacy_evs_and_conditions(
+            substructures.get_substructure_bytes("E")
+        ),
+        misc=legacy_misc(substructures.get_substructure_bytes("M")),
+        data=buffer,
+    )
+
+
+def pc_records(save_path: str | None) -> list[bytes]:
+    if save_path is None:
+        rng = random.Random(0)
+        return [rng.randbytes(PcPkm.SIZE) for _ in range(PC_SLOTS)]
+
+    save_block = utils.GameSaveBlock.open(Path(save_path))
+    return [
+        bytes(box.raw_pkm_bytes(row, col))
+        for box in save_block.pc.boxes
+        for row in range(Pc.Box.ROWS)
+        for col in range(Pc.Box.COLS)
+    ]
+
+
+def main(argv: list[str]) -> None:
+    records = pc_records(argv[0] if argv else None)
+    decoders = {"legacy": legacy_from_bytes, "layouts": PcPkm.from_bytes}
+
+    legacy, current = ([decode(r) for r in records] for decode in decoders.values())
+    if legacy != current:
+        raise SystemExit("decoders disagree")
+
+    for name, decode in decoders.items():
+        times = timeit.repeat(
+            lambda: [decode(record) for record in records], number=1, repeat=REPEAT
+        )
+        print(f"{name:>8}: {len(records)} records in {min(times) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
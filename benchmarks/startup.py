@@ -0,0 +1,75 @@
+"""Start-up time of short CLI commands and of importing the library, best and
+median of fresh interpreters with a warm bytecode cache.
+
+    python benchmarks/startup.py SAVE_FILE [CHECKOUT ...]
+
+Each checkout defaults to this one. To compare with an older commit:
+
+    git worktree add /tmp/before <commit>
+    python benchmarks/startup.py SAVE_FILE /tmp/before .
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RUNS = 21
+
+
+def commands(save_path: str) -> dict[str, list[str]]:
+    cli = ["-m", "pkm3-hex", "pc-pkm"]
+    return {
+        "pc-pkm dump": [
+            *cli,
+            "dump",
+            "1",
+            "1",
+            "1",
+            save_path,
+            os.devnull,
+            "--no-decrypt",
+        ],
+        "pc-pkm show": [*cli, "show", "1", "2", "1", save_path, os.devnull],
+        "import utils": [
+            "-c",
+            "import importlib, sys; sys.path.insert(0, '.'); "
+            "importlib.import_module('pkm3-hex.utils')",
+        ],
+    }
+
+
+def time_command(args: list[str], checkout: Path) -> list[float]:
+    # Bytecode has to be written for the first run to warm the cache
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    command = [sys.executable, *args]
+    subprocess.run(command, check=True, cwd=checkout, env=env)
+
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, cwd=checkout, env=env)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv: list[str]) -> None:
+    if not argv:
+        raise SystemExit(__doc__)
+
+    save_path = str(Path(argv[0]).resolve())
+    checkouts = [Path(c) for c in argv[1:]] or [Path(__file__).resolve().parent.parent]
+    for checkout in checkouts:
+        print(checkout)
+        for name, args in commands(save_path).items():
+            times = time_command(args, checkout)
+            print(
+                f"  {name:>12}: best {min(times) * 1000:.0f} ms, "
+                f"median {statistics.median(times) * 1000:.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,15 @@
-import typer
+from typing import Any
 
-std_stream_default_arg = typer.Argument(default="-")
-std_stream_default_opt = typer.Option(default="-")
+STD_STREAM_DEFAULTS = {"std_stream_default_arg", "std_stream_default_opt"}
+
+
+# Created on first use, so that using the library doesn't import typer
+def __getattr__(name: str) -> Any:
+    if name not in STD_STREAM_DEFAULTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import typer
+
+    parameter = typer.Argument if name == "std_stream_default_arg" else typer.Option
+    value = globals()[name] = parameter(default="-")
+    return value
@@ -3,11 +3,13 @@ import typer
 from .mail_words import app as mail_app
 from .pc_pkm import app as pc_pkm_app
 from .pkm import app as pkm_app
+from .scan import scan
 
 cli = typer.Typer()
 cli.add_typer(pkm_app, name="pkm")
 cli.add_typer(pc_pkm_app, name="pc-pkm")
 cli.add_typer(mail_app, name="mail-words")
+cli.command()(scan)
 
 if __name__ == "__main__":
     cli()
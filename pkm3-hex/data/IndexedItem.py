@@ -2,7 +2,7 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IndexedItem(metaclass=ABCMeta):
     name: str
     index: int
@@ -10,4 +10,4 @@ class IndexedItem(metaclass=ABCMeta):
     @property
     @abstractmethod
     def is_glitch(self) -> bool:
-        raise NotImplementedError(f"{type(self).name} does not implement is_glitch")
+        raise NotImplementedError(f"{type(self).__name__} does not implement is_glitch")
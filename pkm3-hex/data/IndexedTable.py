@@ -0,0 +1,35 @@
+from typing import Callable, Iterable
+
+from .IndexedItem import IndexedItem
+
+
+class IndexedTable[T: IndexedItem]:
+    # Items are stored at their index, and indices without an item, or out of
+    # bounds, all map to the same glitch item, so lookups never allocate.
+    # Items are only created on the first lookup, as most commands need few.
+    __slots__ = ("_items", "_glitch", "_make_items")
+
+    _items: tuple[T, ...]
+    _glitch: T
+    _make_items: Callable[[], Iterable[T]]
+
+    def __init__(self, *, glitch: T, items: Callable[[], Iterable[T]]):
+        self._items = ()
+        self._glitch = glitch
+        self._make_items = items
+
+    def __getitem__(self, index: int) -> T:
+        items = self._items or self._build()
+        return items[index] if 0 <= index < len(items) else self._glitch
+
+    def __len__(self) -> int:
+        return len(self._items or self._build())
+
+    def _build(self) -> tuple[T, ...]:
+        items = list(self._make_items())
+        table = [self._glitch] * (max(item.index for item in items) + 1)
+        for item in items:
+            table[item.index] = item
+
+        self._items = tuple(table)
+        return self._items
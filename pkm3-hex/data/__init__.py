@@ -1,4 +1,5 @@
 from .IndexedItem import IndexedItem
+from .IndexedTable import IndexedTable
 from .items import items
 from .locations import locations
 from .moves import moves
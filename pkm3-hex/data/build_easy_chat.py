@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+from .easy_chat import SNAPSHOT_PATH, Words
+from .easy_chat_words import words_data
+
+
+def main(argv: list[str]) -> int:
+    snapshot = Words.to_snapshot(words_data)
+    snapshot_path = Path(SNAPSHOT_PATH)
+    if "--check" in argv:
+        if snapshot_path.read_bytes() != snapshot:
+            print(f"{snapshot_path} is out of date", file=sys.stderr)
+            return 1
+        return 0
+
+    snapshot_path.write_bytes(snapshot)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,1824 @@
+# Source of the easy chat words snapshot. Run build_easy_chat after editing.
+words_data: list[list[tuple[str, int, str]]] = [
+    [
+        ("ABRA", 0x003F, "POKEMON_2"),
+        ("ABSOL", 0x0178, "POKEMON_2"),
+        ("AGGRON", 0x0180, "POKEMON_2"),
+        ("ALAKAZAM", 0x0041, "POKEMON_2"),
+        ("ALTARIA", 0x0167, "POKEMON_2"),
+        ("ANORITH", 0x0186, "POKEMON_2"),
+        ("ARMALDO", 0x0187, "POKEMON_2"),
+        ("ARON", 0x017E, "POKEMON_2"),
+        ("AZUMARILL", 0x00B8, "POKEMON_2"),
+        ("AZURILL", 0x015E, "POKEMON_2"),
+        ("BAGON", 0x018B, "POKEMON_2"),
+        ("BALTOY", 0x013E, "POKEMON_2"),
+        ("BANETTE", 0x017A, "POKEMON_2"),
+        ("BARBOACH", 0x0143, "POKEMON_2"),
+        ("BEAUTIFLY", 0x0124, "POKEMON_2"),
+        ("BELDUM", 0x018E, "POKEMON_2"),
+        ("BELLOSSOM", 0x00B6, "POKEMON_2"),
+        ("BLAZIKEN", 0x011A, "POKEMON_2"),
+        ("BRELOOM", 0x0133, "POKEMON_2"),
+        ("CACNEA", 0x0158, "POKEMON_2"),
+        ("CACTURNE", 0x0159, "POKEMON_2"),
+        ("CAMERUPT", 0x0154, "POKEMON_2"),
+        ("CARVANHA", 0x014A, "POKEMON_2"),
+        ("CASCOON", 0x0125, "POKEMON_2"),
+        ("CASTFORM", 0x0181, "POKEMON_2"),
+        ("CHIMECHO", 0x019B, "POKEMON_2"),
+        ("CHINCHOU", 0x00AA, "POKEMON_2"),
+        ("CLAMPEARL", 0x0175, "POKEMON_2"),
+        ("CLAYDOL", 0x013F, "POKEMON_2"),
+        ("COMBUSKEN", 0x0119, "POKEMON_2"),
+        ("CORPHISH", 0x0146, "POKEMON_2"),
+        ("CORSOLA", 0x00DE, "POKEMON_2"),
+        ("CRADILY", 0x0185, "POKEMON_2"),
+        ("CRAWDAUNT", 0x0147, "POKEMON_2"),
+        ("CROBAT", 0x00A9, "POKEMON_2"),
+        ("DELCATTY", 0x013C, "POKEMON_2"),
+        ("DEOXYS", 0x019A, "POKEMON_2"),
+        ("DODRIO", 0x0055, "POKEMON_2"),
+        ("DODUO", 0x0054, "POKEMON_2"),
+        ("DONPHAN", 0x00E8, "POKEMON_2"),
+        ("DUSCLOPS", 0x016A, "POKEMON_2"),
+        ("DUSKULL", 0x0169, "POKEMON_2"),
+        ("DUSTOX", 0x0126, "POKEMON_2"),
+        ("ELECTRIKE", 0x0151, "POKEMON_2"),
+        ("ELECTRODE", 0x0065, "POKEMON_2"),
+        ("EXPLOUD", 0x0174, "POKEMON_2"),
+        ("FEEBAS", 0x0148, "POKEMON_2"),
+        ("FLYGON", 0x014E, "POKEMON_2"),
+        ("GARDEVOIR", 0x018A, "POKEMON_2"),
+        ("GEODUDE", 0x004A, "POKEMON_2"),
+        ("GIRAFARIG", 0x00CB, "POKEMON_2"),
+        ("GLALIE", 0x015B, "POKEMON_2"),
+        ("GLOOM", 0x002C, "POKEMON_2"),
+        ("GOLBAT", 0x002A, "POKEMON_2"),
+        ("GOLDEEN", 0x0076, "POKEMON_2"),
+        ("GOLDUCK", 0x0037, "POKEMON_2"),
+        ("GOLEM", 0x004C, "POKEMON_2"),
+        ("GOREBYSS", 0x0177, "POKEMON_2"),
+        ("GRAVELER", 0x004B, "POKEMON_2"),
+        ("GRIMER", 0x0058, "POKEMON_2"),
+        ("GROUDON", 0x0195, "POKEMON_2"),
+        ("GROVYLE", 0x0116, "POKEMON_2"),
+        ("GRUMPIG", 0x0160, "POKEMON_2"),
+        ("GULPIN", 0x016F, "POKEMON_2"),
+        ("GYARADOS", 0x0082, "POKEMON_2"),
+        ("HARIYAMA", 0x0150, "POKEMON_2"),
+        ("HERACROSS", 0x00D6, "POKEMON_2"),
+        ("HORSEA", 0x0074, "POKEMON_2"),
+        ("HUNTAIL", 0x0176, "POKEMON_2"),
+        ("IGGLYBUFF", 0x00AE, "POKEMON_2"),
+        ("ILLUMISE", 0x0183, "POKEMON_2"),
+        ("JIGGLYPUFF", 0x0027, "POKEMON_2"),
+        ("JIRACHI", 0x0199, "POKEMON_2"),
+        ("KADABRA", 0x0040, "POKEMON_2"),
+        ("KECLEON", 0x013D, "POKEMON_2"),
+        ("KINGDRA", 0x00E6, "POKEMON_2"),
+        ("KIRLIA", 0x0189, "POKEMON_2"),
+        ("KOFFING", 0x006D, "POKEMON_2"),
+        ("KYOGRE", 0x0194, "POKEMON_2"),
+        ("LAIRON", 0x017F, "POKEMON_2"),
+        ("LANTURN", 0x00AB, "POKEMON_2"),
+        ("LATIAS", 0x0197, "POKEMON_2"),
+        ("LATIOS", 0x0198, "POKEMON_2"),
+        ("LILEEP", 0x0184, "POKEMON_2"),
+        ("LINOONE", 0x0121, "POKEMON_2"),
+        ("LOMBRE", 0x0128, "POKEMON_2"),
+        ("LOTAD", 0x0127, "POKEMON_2"),
+        ("LOUDRED", 0x0173, "POKEMON_2"),
+        ("LUDICOLO", 0x0129, "POKEMON_2"),
+        ("LUNATONE", 0x015C, "POKEMON_2"),
+        ("LUVDISC", 0x0145, "POKEMON_2"),
+        ("MACHAMP", 0x0044, "POKEMON_2"),
+        ("MACHOKE", 0x0043, "POKEMON_2"),
+        ("MACHOP", 0x0042, "POKEMON_2"),
+        ("MAGCARGO", 0x00DB, "POKEMON_2"),
+        ("MAGIKARP", 0x0081, "POKEMON_2"),
+        ("MAGNEMITE", 0x0051, "POKEMON_2"),
+        ("MAGNETON", 0x0052, "POKEMON_2"),
+        ("MAKUHITA", 0x014F, "POKEMON_2"),
+        ("MANECTRIC", 0x0152, "POKEMON_2"),
+        ("MARILL", 0x00B7, "POKEMON_2"),
+        ("MARSHTOMP", 0x011C, "POKEMON_2"),
+        ("MASQUERAIN", 0x0138, "POKEMON_2"),
+        ("MAWILE", 0x0163, "POKEMON_2"),
+        ("MEDICHAM", 0x0165, "POKEMON_2"),
+        ("MEDITITE", 0x0164, "POKEMON_2"),
+        ("METAGROSS", 0x0190, "POKEMON_2"),
+        ("METANG", 0x018F, "POKEMON_2"),
+        ("MIGHTYENA", 0x011F, "POKEMON_2"),
+        ("MILOTIC", 0x0149, "POKEMON_2"),
+        ("MINUN", 0x0162, "POKEMON_2"),
+        ("MUDKIP", 0x011B, "POKEMON_2"),
+        ("MUK", 0x0059, "POKEMON_2"),
+        ("NATU", 0x00B1, "POKEMON_2"),
+        ("NINCADA", 0x012D, "POKEMON_2"),
+        ("NINETALES", 0x0026, "POKEMON_2"),
+        ("NINJASK", 0x012E, "POKEMON_2"),
+        ("NOSEPASS", 0x0140, "POKEMON_2"),
+        ("NUMEL", 0x0153, "POKEMON_2"),
+        ("NUZLEAF", 0x012B, "POKEMON_2"),
+        ("ODDISH", 0x002B, "POKEMON_2"),
+        ("PELIPPER", 0x0136, "POKEMON_2"),
+        ("PHANPY", 0x00E7, "POKEMON_2"),
+        ("PICHU", 0x00AC, "POKEMON_2"),
+        ("PIKACHU", 0x0019, "POKEMON_2"),
+        ("PINSIR", 0x007F, "POKEMON_2"),
+        ("PLUSLE", 0x0161, "POKEMON_2"),
+        ("POOCHYENA", 0x011E, "POKEMON_2"),
+        ("PSYDUCK", 0x0036, "POKEMON_2"),
+        ("RAICHU", 0x001A, "POKEMON_2"),
+        ("RALTS", 0x0188, "POKEMON_2"),
+        ("RAYQUAZA", 0x0196, "POKEMON_2"),
+        ("REGICE", 0x0192, "POKEMON_2"),
+        ("REGIROCK", 0x0191, "POKEMON_2"),
+        ("REGISTEEL", 0x0193, "POKEMON_2"),
+        ("RELICANTH", 0x017D, "POKEMON_2"),
+        ("RHYDON", 0x0070, "POKEMON_2"),
+        ("RHYHORN", 0x006F, "POKEMON_2"),
+        ("ROSELIA", 0x016B, "POKEMON_2"),
+        ("SABLEYE", 0x0142, "POKEMON_2"),
+        ("SALAMENCE", 0x018D, "POKEMON_2"),
+        ("SANDSHREW", 0x001B, "POKEMON_2"),
+        ("SANDSLASH", 0x001C, "POKEMON_2"),
+        ("SCEPTILE", 0x0117, "POKEMON_2"),
+        ("SEADRA", 0x0075, "POKEMON_2"),
+        ("SEAKING", 0x0077, "POKEMON_2"),
+        ("SEALEO", 0x0156, "POKEMON_2"),
+        ("SEEDOT", 0x012A, "POKEMON_2"),
+        ("SEVIPER", 0x017B, "POKEMON_2"),
+        ("SHARPEDO", 0x014B, "POKEMON_2"),
+        ("SHEDINJA", 0x012F, "POKEMON_2"),
+        ("SHELGON", 0x018C, "POKEMON_2"),
+        ("SHIFTRY", 0x012C, "POKEMON_2"),
+        ("SHROOMISH", 0x0132, "POKEMON_2"),
+        ("SHUPPET", 0x0179, "POKEMON_2"),
+        ("SILCOON", 0x0123, "POKEMON_2"),
+        ("SKARMORY", 0x00E3, "POKEMON_2"),
+        ("SKITTY", 0x013B, "POKEMON_2"),
+        ("SLAKING", 0x016E, "POKEMON_2"),
+        ("SLAKOTH", 0x016C, "POKEMON_2"),
+        ("SLUGMA", 0x00DA, "POKEMON_2"),
+        ("SNORUNT", 0x015A, "POKEMON_2"),
+        ("SOLROCK", 0x015D, "POKEMON_2"),
+        ("SPHEAL", 0x0155, "POKEMON_2"),
+        ("SPINDA", 0x0134, "POKEMON_2"),
+        ("SPOINK", 0x015F, "POKEMON_2"),
+        ("STARMIE", 0x0079, "POKEMON_2"),
+        ("STARYU", 0x0078, "POKEMON_2"),
+        ("SURSKIT", 0x0137, "POKEMON_2"),
+        ("SWABLU", 0x0166, "POKEMON_2"),
+        ("SWALOT", 0x0170, "POKEMON_2"),
+        ("SWAMPERT", 0x011D, "POKEMON_2"),
+        ("SWELLOW", 0x0131, "POKEMON_2"),
+        ("TAILOW", 0x0130, "POKEMON_2"),
+        ("TENTACOOL", 0x0048, "POKEMON_2"),
+        ("TENTACRUEL", 0x0049, "POKEMON_2"),
+        ("TORCHIC", 0x0118, "POKEMON_2"),
+        ("TORKOAL", 0x0141, "POKEMON_2"),
+        ("TRAPINCH", 0x014C, "POKEMON_2"),
+        ("TREECKO", 0x0115, "POKEMON_2"),
+        ("TROPIUS", 0x0171, "POKEMON_2"),
+        ("VIBRAVA", 0x014D, "POKEMON_2"),
+        ("VIGOROTH", 0x016D, "POKEMON_2"),
+        ("VILEPLUME", 0x002D, "POKEMON_2"),
+        ("VOLBEAT", 0x0182, "POKEMON_2"),
+        ("VOLTORB", 0x0064, "POKEMON_2"),
+        ("VULPIX", 0x0025, "POKEMON_2"),
+        ("WAILMER", 0x0139, "POKEMON_2"),
+        ("WAILORD", 0x013A, "POKEMON_2"),
+        ("WALREIN", 0x0157, "POKEMON_2"),
+        ("WEEZING", 0x006E, "POKEMON_2"),
+        ("WHISCASH", 0x0144, "POKEMON_2"),
+        ("WHISMUR", 0x0172, "POKEMON_2"),
+        ("WIGGLYTUFF", 0x0028, "POKEMON_2"),
+        ("WINGULL", 0x0135, "POKEMON_2"),
+        ("WOBBUFFET", 0x00CA, "POKEMON_2"),
+        ("WURMPLE", 0x0122, "POKEMON_2"),
+        ("WYNAUT", 0x0168, "POKEMON_2"),
+        ("XATU", 0x00B2, "POKEMON_2"),
+        ("ZANGOOSE", 0x017C, "POKEMON_2"),
+        ("ZIGZAGOON", 0x0120, "POKEMON_2"),
+        ("ZUBAT", 0x0029, "POKEMON_2"),
+    ],
+    [
+        ("BAG", 0x0215, "TRAINER"),
+        ("CENTER", 0x0207, "TRAINER"),
+        ("EGG", 0x0208, "TRAINER"),
+        ("ENCYCLOPEDIA", 0x0205, "TRAINER"),
+        ("EVOLVE", 0x0204, "TRAINER"),
+        ("FLAME", 0x0216, "TRAINER"),
+        ("GET", 0x020F, "TRAINER"),
+        ("GOLD", 0x0217, "TRAINER"),
+        ("GOTCHA", 0x0201, "TRAINER"),
+        ("GREEN", 0x0214, "TRAINER"),
+        ("I CHOOSE YOU", 0x0200, "TRAINER"),
+        ("LEAF", 0x0218, "TRAINER"),
+        ("LEVEL", 0x0212, "TRAINER"),
+        ("LINK", 0x0209, "TRAINER"),
+        ("NATURE", 0x0206, "TRAINER"),
+        ("POKéDEX", 0x0210, "TRAINER"),
+        ("POKEMON", 0x020E, "TRAINER"),
+        ("POKéNAV", 0x020D, "TRAINER"),
+        ("RED", 0x0213, "TRAINER"),
+        ("RUBY", 0x0211, "TRAINER"),
+        ("SAPPHIRE", 0x0203, "TRAINER"),
+        ("SILVER", 0x0219, "TRAINER"),
+        ("SP. ABILITY", 0x020A, "TRAINER"),
+        ("TRADE", 0x0202, "TRAINER"),
+        ("TRAINER", 0x020B, "TRAINER"),
+        ("VERSION", 0x020C, "TRAINER"),
+    ],
+    [
+        ("AIR LOCK", 0x040D, "STATUS"),
+        ("ALT. COLOR", 0x0409, "STATUS"),
+        ("ARENA TRAP", 0x0405, "STATUS"),
+        ("ARMOR", 0x045E, "STATUS"),
+        ("BATTLE ARMOR", 0x0417, "STATUS"),
+        ("BEAUTIFUL", 0x040B, "STATUS"),
+        ("BEAUTY", 0x040C, "STATUS"),
+        ("BLAZE", 0x0465, "STATUS"),
+        ("BUG", 0x0461, "STATUS"),
+        ("CHLOROPHYLL", 0x046A, "STATUS"),
+        ("CLEAR BODY", 0x041D, "STATUS"),
+        ("CLOUD NINE", 0x0444, "STATUS"),
+        ("COLOR CHANGE", 0x0456, "STATUS"),
+        ("COLOR", 0x0408, "STATUS"),
+        ("COMPOUNDEYES", 0x044E, "STATUS"),
+        ("COOL", 0x0415, "STATUS"),
+        ("COOLNESS", 0x0416, "STATUS"),
+        ("CUTE CHARM", 0x0463, "STATUS"),
+        ("CUTE", 0x0418, "STATUS"),
+        ("CUTENESS", 0x0419, "STATUS"),
+        ("DAMP", 0x0425, "STATUS"),
+        ("DARK", 0x0400, "STATUS"),
+        ("DRAGON", 0x043E, "STATUS"),
+        ("DRIZZLE", 0x0404, "STATUS"),
+        ("DROUGHT", 0x044C, "STATUS"),
+        ("EARLY BIRD", 0x0448, "STATUS"),
+        ("EFFECT SPORE", 0x0458, "STATUS"),
+        ("ELECTRIC", 0x0439, "STATUS"),
+        ("FIGHTING", 0x0410, "STATUS"),
+        ("FIRE", 0x045A, "STATUS"),
+        ("FLAME BODY", 0x045B, "STATUS"),
+        ("FLASH FIRE", 0x0468, "STATUS"),
+        ("FLYING", 0x044B, "STATUS"),
+        ("FORECAST", 0x043A, "STATUS"),
+        ("GHOST", 0x041F, "STATUS"),
+        ("GRASS", 0x041C, "STATUS"),
+        ("GROUND", 0x0426, "STATUS"),
+        ("GUTS", 0x0421, "STATUS"),
+        ("HUGE POWER", 0x0436, "STATUS"),
+        ("HUSTLE", 0x0449, "STATUS"),
+        ("HYPER CUTTER", 0x040F, "STATUS"),
+        ("ICE", 0x0420, "STATUS"),
+        ("ILLUMINATE", 0x0447, "STATUS"),
+        ("IMMUNITY", 0x0464, "STATUS"),
+        ("INNER FOCUS", 0x0430, "STATUS"),
+        ("INSOMNIA", 0x0451, "STATUS"),
+        ("INTIMIDATE", 0x0406, "STATUS"),
+        ("KEEN EYE", 0x042F, "STATUS"),
+        ("LEVITATE", 0x0452, "STATUS"),
+        ("LIGHTNINGROD", 0x044D, "STATUS"),
+        ("LIMBER", 0x0427, "STATUS"),
+        ("LIQUID OOZE", 0x0455, "STATUS"),
+        ("MAGMA TEMPO", 0x045D, "STATUS"),
+        ("MAGNET PULL", 0x0428, "STATUS"),
+        ("MARVEL SCALE", 0x044F, "STATUS"),
+        ("NATURAL CURE", 0x0424, "STATUS"),
+        ("NORMAL", 0x0445, "STATUS"),
+        ("OBLIVIOUS", 0x0440, "STATUS"),
+        ("OEN MINUS", 0x045C, "STATUS"),
+        ("OVERGROW", 0x042B, "STATUS"),
+        ("PATTERN", 0x0467, "STATUS"),
+        ("PICKUP", 0x0466, "STATUS"),
+        ("{PK}RS", 0x0459, "STATUS"),
+        ("PLUS", 0x0453, "STATUS"),
+        ("POISON POINT", 0x043D, "STATUS"),
+        ("POISON", 0x043C, "STATUS"),
+        ("PRESSURE", 0x0454, "STATUS"),
+        ("PSYCHIC", 0x040E, "STATUS"),
+        ("PURE POWER", 0x046B, "STATUS"),
+        ("RAIN DISH", 0x0403, "STATUS"),
+        ("ROCK HEAD", 0x0407, "STATUS"),
+        ("ROCK", 0x040A, "STATUS"),
+        ("ROUGH SKIN", 0x0422, "STATUS"),
+        ("RUN AWAY", 0x0442, "STATUS"),
+        ("SAND STREAM", 0x042D, "STATUS"),
+        ("SAND VEIL", 0x042E, "STATUS"),
+        ("SERENE GRACE", 0x043B, "STATUS"),
+        ("SHADOW TAG", 0x0411, "STATUS"),
+        ("SHED SKIN", 0x0435, "STATUS"),
+        ("SHELL ARMOR", 0x0423, "STATUS"),
+        ("SHIELD DUST", 0x046C, "STATUS"),
+        ("SHINE", 0x044A, "STATUS"),
+        ("SMART", 0x0412, "STATUS"),
+        ("SMARTNESS", 0x0413, "STATUS"),
+        ("SOUNDPROOF", 0x0457, "STATUS"),
+        ("SPEED BOOST", 0x0414, "STATUS"),
+        ("STATIC", 0x0431, "STATUS"),
+        ("STEEL", 0x0446, "STATUS"),
+        ("STENCH", 0x0401, "STATUS"),
+        ("STICKY HOLD", 0x0443, "STATUS"),
+        ("STURDY", 0x041A, "STATUS"),
+        ("SUCTION CUPS", 0x041B, "STATUS"),
+        ("SWARM", 0x0462, "STATUS"),
+        ("SWIFT SWIM", 0x042C, "STATUS"),
+        ("SYNCHRONIZE", 0x042A, "STATUS"),
+        ("THICK FAT", 0x0402, "STATUS"),
+        ("TORRENT", 0x041E, "STATUS"),
+        ("TOUGH", 0x0433, "STATUS"),
+        ("TOUGHNESS", 0x0434, "STATUS"),
+        ("TRACE", 0x043F, "STATUS"),
+        ("TRUANT", 0x0441, "STATUS"),
+        ("TYPE", 0x0432, "STATUS"),
+        ("VITAL SPIRIT", 0x0469, "STATUS"),
+        ("VOLT ABSORB", 0x0437, "STATUS"),
+        ("WATER ABSORB", 0x0438, "STATUS"),
+        ("WATER VEIL", 0x0460, "STATUS"),
+        ("WATER", 0x045F, "STATUS"),
+        ("WHITE SMOKE", 0x0429, "STATUS"),
+        ("WONDER GUARD", 0x0450, "STATUS"),
+    ],
+    [
+        ("ACCEPT", 0x0635, "BATTLE"),
+        ("AIM", 0x0627, "BATTLE"),
+        ("ATTACK", 0x0612, "BATTLE"),
+        ("BATTLE", 0x0628, "BATTLE"),
+        ("CAN WIN", 0x060B, "BATTLE"),
+        ("CAN'T WIN", 0x060A, "BATTLE"),
+        ("CHALLENGE", 0x061F, "BATTLE"),
+        ("DECIDE", 0x0603, "BATTLE"),
+        ("DECIDED", 0x060E, "BATTLE"),
+        ("E", 0x0611, "BATTLE"),
+        ("EASY", 0x0638, "BATTLE"),
+        ("ESCAPE", 0x0626, "BATTLE"),
+        ("FIGHT", 0x0629, "BATTLE"),
+        ("FIGHTS", 0x061D, "BATTLE"),
+        ("FOE", 0x0623, "BATTLE"),
+        ("GENIUS", 0x0624, "BATTLE"),
+        ("GIVE UP", 0x062D, "BATTLE"),
+        ("GO EASY", 0x0622, "BATTLE"),
+        ("GO", 0x0601, "BATTLE"),
+        ("GUARD", 0x0632, "BATTLE"),
+        ("GUTSY", 0x0614, "BATTLE"),
+        ("IF I LOSE", 0x062F, "BATTLE"),
+        ("IF I WIN", 0x0608, "BATTLE"),
+        ("INVINCIBLE", 0x0636, "BATTLE"),
+        ("LEADER", 0x063C, "BATTLE"),
+        ("LEGEND", 0x0625, "BATTLE"),
+        ("LET ME WIN", 0x0604, "BATTLE"),
+        ("LOSE", 0x0631, "BATTLE"),
+        ("LOSS", 0x062E, "BATTLE"),
+        ("LOST", 0x0630, "BATTLE"),
+        ("MATCH UP", 0x0600, "BATTLE"),
+        ("MATCH", 0x0618, "BATTLE"),
+        ("MOVE", 0x063E, "BATTLE"),
+        ("NO MATCH", 0x060C, "BATTLE"),
+        ("NO. 1", 0x0602, "BATTLE"),
+        ("OFFENSIVE", 0x061A, "BATTLE"),
+        ("PARTNER", 0x0633, "BATTLE"),
+        ("POINTS", 0x062B, "BATTLE"),
+        ("POWER", 0x061E, "BATTLE"),
+        ("PUSHOVER", 0x063B, "BATTLE"),
+        ("RECEIVED", 0x0637, "BATTLE"),
+        ("REJECT", 0x0634, "BATTLE"),
+        ("RESUSCITATE", 0x062A, "BATTLE"),
+        ("RULE", 0x063D, "BATTLE"),
+        ("SENSE", 0x061B, "BATTLE"),
+        ("SERIOUS", 0x062C, "BATTLE"),
+        ("SMITE", 0x0617, "BATTLE"),
+        ("SPIRIT", 0x060D, "BATTLE"),
+        ("STRATEGY", 0x0616, "BATTLE"),
+        ("STRONG", 0x0620, "BATTLE"),
+        ("SURRENDER", 0x0613, "BATTLE"),
+        ("TAKE THAT", 0x0610, "BATTLE"),
+        ("TALENT", 0x0615, "BATTLE"),
+        ("TOO STRONG", 0x0621, "BATTLE"),
+        ("TOO WEAK", 0x063A, "BATTLE"),
+        ("TRUMP CARD", 0x060F, "BATTLE"),
+        ("VERSUS", 0x061C, "BATTLE"),
+        ("VICTORY", 0x0619, "BATTLE"),
+        ("WEAK", 0x0639, "BATTLE"),
+        ("WHEN I WIN", 0x0609, "BATTLE"),
+        ("WIN", 0x0606, "BATTLE"),
+        ("WINS", 0x0605, "BATTLE"),
+        ("WON", 0x0607, "BATTLE"),
+    ],
+    [
+        ("APOLOGIZE", 0x080C, "GREETINGS"),
+        ("APPRECIATE", 0x0819, "GREETINGS"),
+        ("BYE-BYE", 0x0820, "GREETINGS"),
+        ("COME OVER", 0x0828, "GREETINGS"),
+        ("CONGRATS", 0x0809, "GREETINGS"),
+        ("COUNT ON", 0x0829, "GREETINGS"),
+        ("EXCUSE ME", 0x0816, "GREETINGS"),
+        ("EXCUSE", 0x0814, "GREETINGS"),
+        ("FORGIVE", 0x080D, "GREETINGS"),
+        ("GIVE ME", 0x080A, "GREETINGS"),
+        ("GO AHEAD", 0x0818, "GREETINGS"),
+        ("GOOD-BYE", 0x0810, "GREETINGS"),
+        ("HELLO", 0x080F, "GREETINGS"),
+        ("HERE GOES", 0x0802, "GREETINGS"),
+        ("HERE I COME", 0x0803, "GREETINGS"),
+        ("HERE IT IS", 0x0804, "GREETINGS"),
+        ("HEY, THERE", 0x080E, "GREETINGS"),
+        ("HEY?", 0x081A, "GREETINGS"),
+        ("HEY", 0x0822, "GREETINGS"),
+        ("HI", 0x081E, "GREETINGS"),
+        ("HOO-HAH", 0x0825, "GREETINGS"),
+        ("HOW DO", 0x0808, "GREETINGS"),
+        ("HUH?", 0x081C, "GREETINGS"),
+        ("I'VE ARRIVED", 0x0812, "GREETINGS"),
+        ("LISTENING", 0x0824, "GREETINGS"),
+        ("MEET YOU", 0x0821, "GREETINGS"),
+        ("NO", 0x081D, "GREETINGS"),
+        ("OI", 0x0807, "GREETINGS"),
+        ("PARDON", 0x0813, "GREETINGS"),
+        ("SEE YA", 0x0815, "GREETINGS"),
+        ("SMELL", 0x0823, "GREETINGS"),
+        ("SORRY", 0x080B, "GREETINGS"),
+        ("THANK YOU", 0x0811, "GREETINGS"),
+        ("THANKS", 0x0800, "GREETINGS"),
+        ("WELCOME", 0x0806, "GREETINGS"),
+        ("WELL, THEN", 0x0817, "GREETINGS"),
+        ("WHAT'S UP?", 0x081B, "GREETINGS"),
+        ("YAHOO", 0x0826, "GREETINGS"),
+        ("YEAH, YEAH", 0x081F, "GREETINGS"),
+        ("YEAH", 0x0805, "GREETINGS"),
+        ("YES", 0x0801, "GREETINGS"),
+        ("YO", 0x0827, "GREETINGS"),
+    ],
+    [
+        ("ADULT", 0x0A0D, "PEOPLE"),
+        ("ALLY", 0x0A34, "PEOPLE"),
+        ("AREN'T", 0x0A1F, "PEOPLE"),
+        ("AUNT", 0x0A11, "PEOPLE"),
+        ("BABE", 0x0A16, "PEOPLE"),
+        ("BEEN", 0x0A3E, "PEOPLE"),
+        ("BOY", 0x0A0C, "PEOPLE"),
+        ("BROTHER", 0x0A0E, "PEOPLE"),
+        ("CHILDREN", 0x0A22, "PEOPLE"),
+        ("DAUGHTER", 0x0A1C, "PEOPLE"),
+        ("DUDE", 0x0A36, "PEOPLE"),
+        ("FAMILY", 0x0A17, "PEOPLE"),
+        ("FATHER", 0x0A0B, "PEOPLE"),
+        ("FRIEND", 0x0A33, "PEOPLE"),
+        ("GIRL", 0x0A15, "PEOPLE"),
+        ("GRANDFATHER", 0x0A09, "PEOPLE"),
+        ("GRANDMOTHER", 0x0A10, "PEOPLE"),
+        ("HE'S", 0x0A1E, "PEOPLE"),
+        ("HE", 0x0A1A, "PEOPLE"),
+        ("HER", 0x0A18, "PEOPLE"),
+        ("HERS", 0x0A48, "PEOPLE"),
+        ("HIM", 0x0A19, "PEOPLE"),
+        ("HIS", 0x0A1D, "PEOPLE"),
+        ("I AM", 0x0A29, "PEOPLE"),
+        ("I WAS", 0x0A26, "PEOPLE"),
+        ("I'VE", 0x0A2A, "PEOPLE"),
+        ("I", 0x0A01, "PEOPLE"),
+        ("IT'S", 0x0A31, "PEOPLE"),
+        ("KID", 0x0A21, "PEOPLE"),
+        ("LADY", 0x0A32, "PEOPLE"),
+        ("MAN", 0x0A13, "PEOPLE"),
+        ("ME", 0x0A14, "PEOPLE"),
+        ("MOTHER", 0x0A08, "PEOPLE"),
+        ("MR.", 0x0A23, "PEOPLE"),
+        ("MRS.", 0x0A24, "PEOPLE"),
+        ("MY", 0x0A28, "PEOPLE"),
+        ("MYSELF", 0x0A25, "PEOPLE"),
+        ("OPPONENT", 0x0A00, "PEOPLE"),
+        ("OUR", 0x0A40, "PEOPLE"),
+        ("PARENT", 0x0A12, "PEOPLE"),
+        ("PERSON", 0x0A35, "PEOPLE"),
+        ("PLACE", 0x0A1B, "PEOPLE"),
+        ("RIVAL", 0x0A42, "PEOPLE"),
+        ("SHE IS", 0x0A49, "PEOPLE"),
+        ("SHE WAS", 0x0A46, "PEOPLE"),
+        ("SHE", 0x0A45, "PEOPLE"),
+        ("SIBLINGS", 0x0A20, "PEOPLE"),
+        ("SISTER", 0x0A0F, "PEOPLE"),
+        ("SOME", 0x0A4A, "PEOPLE"),
+        ("SOMEONE", 0x0A2C, "PEOPLE"),
+        ("SON", 0x0A04, "PEOPLE"),
+        ("THEIR", 0x0A3A, "PEOPLE"),
+        ("THEY WERE", 0x0A38, "PEOPLE"),
+        ("THEY'RE", 0x0A3B, "PEOPLE"),
+        ("THEY'VE", 0x0A3C, "PEOPLE"),
+        ("THEY", 0x0A37, "PEOPLE"),
+        ("TO HER", 0x0A47, "PEOPLE"),
+        ("TO ME", 0x0A27, "PEOPLE"),
+        ("TO THEM", 0x0A39, "PEOPLE"),
+        ("TO US", 0x0A3F, "PEOPLE"),
+        ("TO WHOM", 0x0A2E, "PEOPLE"),
+        ("UNCLE", 0x0A0A, "PEOPLE"),
+        ("WE'RE", 0x0A41, "PEOPLE"),
+        ("WE'VE", 0x0A43, "PEOPLE"),
+        ("WE", 0x0A3D, "PEOPLE"),
+        ("WHO IS", 0x0A30, "PEOPLE"),
+        ("WHO WAS", 0x0A2D, "PEOPLE"),
+        ("WHO", 0x0A2B, "PEOPLE"),
+        ("WHOSE", 0x0A2F, "PEOPLE"),
+        ("WOMAN", 0x0A44, "PEOPLE"),
+        ("YOU'RE", 0x0A06, "PEOPLE"),
+        ("YOU'VE", 0x0A07, "PEOPLE"),
+        ("YOU", 0x0A02, "PEOPLE"),
+        ("YOUR", 0x0A05, "PEOPLE"),
+        ("YOURS", 0x0A03, "PEOPLE"),
+    ],
+    [
+        ("- - -", 0x0C08, "VOICES"),
+        ("-", 0x0C07, "VOICES"),
+        ("!!", 0x0C01, "VOICES"),
+        ("!", 0x0C00, "VOICES"),
+        ("?!", 0x0C02, "VOICES"),
+        ("?", 0x0C03, "VOICES"),
+        ("…!", 0x0C05, "VOICES"),
+        ("………", 0x0C06, "VOICES"),
+        ("…", 0x0C04, "VOICES"),
+        ("AGREE", 0x0C17, "VOICES"),
+        ("AHAHA", 0x0C0B, "VOICES"),
+        ("AIYEEH", 0x0C29, "VOICES"),
+        ("ARRGH", 0x0C34, "VOICES"),
+        ("AWW", 0x0C3B, "VOICES"),
+        ("CRIES", 0x0C16, "VOICES"),
+        ("CRY", 0x0C19, "VOICES"),
+        ("EEK", 0x0C20, "VOICES"),
+        ("EH?", 0x0C18, "VOICES"),
+        ("EHEHE", 0x0C1A, "VOICES"),
+        ("FUFUFU", 0x0C2B, "VOICES"),
+        ("GIGGLE", 0x0C13, "VOICES"),
+        ("GRAAAH", 0x0C21, "VOICES"),
+        ("GWAH", 0x0C3D, "VOICES"),
+        ("GWAHAHAHA", 0x0C22, "VOICES"),
+        ("HAH", 0x0C26, "VOICES"),
+        ("HAHAHA", 0x0C28, "VOICES"),
+        ("HEH", 0x0C30, "VOICES"),
+        ("HEHE", 0x0C25, "VOICES"),
+        ("HEHEHE", 0x0C2F, "VOICES"),
+        ("HIYAH", 0x0C2A, "VOICES"),
+        ("HMM", 0x0C0F, "VOICES"),
+        ("HOHOHO", 0x0C31, "VOICES"),
+        ("HUMPH", 0x0C2E, "VOICES"),
+        ("LALALA", 0x0C39, "VOICES"),
+        ("LOL", 0x0C2C, "VOICES"),
+        ("MMM", 0x0C36, "VOICES"),
+        ("MUFUFU", 0x0C35, "VOICES"),
+        ("NOPE", 0x0C0D, "VOICES"),
+        ("OH-KAY", 0x0C37, "VOICES"),
+        ("OH, DEAR", 0x0C33, "VOICES"),
+        ("OH, YEAH", 0x0C1C, "VOICES"),
+        ("OH?", 0x0C0C, "VOICES"),
+        ("OH", 0x0C1D, "VOICES"),
+        ("OI, OI, OI", 0x0C1B, "VOICES"),
+        ("OKAY", 0x0C38, "VOICES"),
+        ("OOPS", 0x0C1E, "VOICES"),
+        ("SHOCKED", 0x0C1F, "VOICES"),
+        ("SIGH", 0x0C14, "VOICES"),
+        ("SNORT", 0x0C2D, "VOICES"),
+        ("TCH", 0x0C24, "VOICES"),
+        ("UH-HUH", 0x0C32, "VOICES"),
+        ("UH-OH", 0x0C09, "VOICES"),
+        ("UNBELIEVABLE", 0x0C15, "VOICES"),
+        ("URGH", 0x0C0E, "VOICES"),
+        ("WAAAH", 0x0C0A, "VOICES"),
+        ("WAHAHAHA", 0x0C3E, "VOICES"),
+        ("WAY", 0x0C23, "VOICES"),
+        ("WHOAH", 0x0C10, "VOICES"),
+        ("WOW", 0x0C12, "VOICES"),
+        ("WOWEE", 0x0C3C, "VOICES"),
+        ("WROOOAAR!", 0x0C11, "VOICES"),
+        ("YAY", 0x0C3A, "VOICES"),
+        ("YUP", 0x0C27, "VOICES"),
+    ],
+    [
+        ("A LITTLE", 0x0E13, "SPEECH"),
+        ("A LOT", 0x0E12, "SPEECH"),
+        ("A TINY BIT", 0x0E1B, "SPEECH"),
+        ("ABSOLUTELY", 0x0E14, "SPEECH"),
+        ("ALSO", 0x0E29, "SPEECH"),
+        ("ALTHOUGH", 0x0E28, "SPEECH"),
+        ("AND", 0x0E15, "SPEECH"),
+        ("ANY", 0x0E39, "SPEECH"),
+        ("AROUND", 0x0E17, "SPEECH"),
+        ("AS IF", 0x0E31, "SPEECH"),
+        ("AS MUCH AS", 0x0E2B, "SPEECH"),
+        ("AWFULLY", 0x0E34, "SPEECH"),
+        ("BUT", 0x0E0A, "SPEECH"),
+        ("CASE", 0x0E0C, "SPEECH"),
+        ("ENOUGH", 0x0E11, "SPEECH"),
+        ("EVEN SO,", 0x0E1F, "SPEECH"),
+        ("FANTASTIC", 0x0E3B, "SPEECH"),
+        ("FEELING", 0x0E09, "SPEECH"),
+        ("FINALLY", 0x0E38, "SPEECH"),
+        ("FOR NOW,", 0x0E22, "SPEECH"),
+        ("FROM", 0x0E08, "SPEECH"),
+        ("HIT", 0x0E10, "SPEECH"),
+        ("HOW", 0x0E0F, "SPEECH"),
+        ("HOWEVER", 0x0E0B, "SPEECH"),
+        ("IF", 0x0E19, "SPEECH"),
+        ("INSTEAD", 0x0E3A, "SPEECH"),
+        ("JOKING", 0x0E24, "SPEECH"),
+        ("JUST", 0x0E1E, "SPEECH"),
+        ("LAY", 0x0E04, "SPEECH"),
+        ("LIE", 0x0E03, "SPEECH"),
+        ("LISTEN", 0x0E00, "SPEECH"),
+        ("MEAN", 0x0E02, "SPEECH"),
+        ("MISS", 0x0E0E, "SPEECH"),
+        ("MODE", 0x0E35, "SPEECH"),
+        ("MOOD", 0x0E32, "SPEECH"),
+        ("MORE", 0x0E36, "SPEECH"),
+        ("MUST BE", 0x0E20, "SPEECH"),
+        ("NATURALLY", 0x0E21, "SPEECH"),
+        ("NITWIT", 0x0E06, "SPEECH"),
+        ("NOT VERY", 0x0E01, "SPEECH"),
+        ("ONLY", 0x0E16, "SPEECH"),
+        ("PERFECT", 0x0E2A, "SPEECH"),
+        ("PROBABLY", 0x0E18, "SPEECH"),
+        ("QUITE", 0x0E07, "SPEECH"),
+        ("RATHER", 0x0E33, "SPEECH"),
+        ("READY", 0x0E25, "SPEECH"),
+        ("REALLY", 0x0E2C, "SPEECH"),
+        ("RECOMMEND", 0x0E05, "SPEECH"),
+        ("SERIOUSLY", 0x0E2E, "SPEECH"),
+        ("SOMEHOW", 0x0E27, "SPEECH"),
+        ("SOMETHING", 0x0E26, "SPEECH"),
+        ("THAT'S", 0x0E1D, "SPEECH"),
+        ("THE", 0x0E0D, "SPEECH"),
+        ("TOO LATE", 0x0E37, "SPEECH"),
+        ("TOTALLY", 0x0E2F, "SPEECH"),
+        ("TRULY", 0x0E2D, "SPEECH"),
+        ("UNDERSTOOD", 0x0E23, "SPEECH"),
+        ("UNTIL", 0x0E30, "SPEECH"),
+        ("VERY", 0x0E1A, "SPEECH"),
+        ("WILD", 0x0E1C, "SPEECH"),
+    ],
+    [
+        ("A", 0x1020, "ENDINGS"),
+        ("ABOUT", 0x1027, "ENDINGS"),
+        ("AFTER", 0x103F, "ENDINGS"),
+        ("ALL", 0x102A, "ENDINGS"),
+        ("AN", 0x1021, "ENDINGS"),
+        ("ANYWHERE", 0x1044, "ENDINGS"),
+        ("ARE", 0x100F, "ENDINGS"),
+        ("AS", 0x102E, "ENDINGS"),
+        ("AT", 0x1036, "ENDINGS"),
+        ("BE", 0x1006, "ENDINGS"),
+        ("BEFORE", 0x1040, "ENDINGS"),
+        ("BELONGS TO", 0x1035, "ENDINGS"),
+        ("BETTER", 0x1031, "ENDINGS"),
+        ("CAN'T", 0x1015, "ENDINGS"),
+        ("CAN", 0x1016, "ENDINGS"),
+        ("COULD", 0x1008, "ENDINGS"),
+        ("DID", 0x103B, "ENDINGS"),
+        ("DIDN'T", 0x103C, "ENDINGS"),
+        ("DO", 0x1018, "ENDINGS"),
+        ("DOES", 0x1019, "ENDINGS"),
+        ("DOESN'T", 0x103D, "ENDINGS"),
+        ("DON'T", 0x1017, "ENDINGS"),
+        ("EVER", 0x1032, "ENDINGS"),
+        ("FOR", 0x102B, "ENDINGS"),
+        ("GIMME", 0x1007, "ENDINGS"),
+        ("HAVE", 0x101E, "ENDINGS"),
+        ("HAVEN'T", 0x101F, "ENDINGS"),
+        ("IN", 0x1037, "ENDINGS"),
+        ("IS IT?", 0x1005, "ENDINGS"),
+        ("IS", 0x100B, "ENDINGS"),
+        ("ISN'T IT?", 0x100C, "ENDINGS"),
+        ("ISN'T", 0x1013, "ENDINGS"),
+        ("IT", 0x1029, "ENDINGS"),
+        ("LET'S", 0x100D, "ENDINGS"),
+        ("LIKE", 0x103A, "ENDINGS"),
+        ("LIKELY TO", 0x1009, "ENDINGS"),
+        ("MAYBE", 0x1026, "ENDINGS"),
+        ("NOT", 0x1022, "ENDINGS"),
+        ("OF", 0x1034, "ENDINGS"),
+        ("OFF", 0x102D, "ENDINGS"),
+        ("OK?", 0x1024, "ENDINGS"),
+        ("ON", 0x102C, "ENDINGS"),
+        ("ONCE", 0x1043, "ENDINGS"),
+        ("OR", 0x1002, "ENDINGS"),
+        ("OTHER", 0x100E, "ENDINGS"),
+        ("OUT", 0x1038, "ENDINGS"),
+        ("OVER", 0x1028, "ENDINGS"),
+        ("SINCE", 0x1033, "ENDINGS"),
+        ("SO", 0x1025, "ENDINGS"),
+        ("THAN", 0x1042, "ENDINGS"),
+        ("THERE", 0x1023, "ENDINGS"),
+        ("THOSE", 0x1012, "ENDINGS"),
+        ("TIMES", 0x1003, "ENDINGS"),
+        ("TO", 0x102F, "ENDINGS"),
+        ("TOO", 0x1039, "ENDINGS"),
+        ("WAS", 0x1010, "ENDINGS"),
+        ("WASN'T", 0x101C, "ENDINGS"),
+        ("WERE", 0x1011, "ENDINGS"),
+        ("WEREN'T", 0x101D, "ENDINGS"),
+        ("WHICH", 0x101B, "ENDINGS"),
+        ("WHILE", 0x1041, "ENDINGS"),
+        ("WHOM", 0x101A, "ENDINGS"),
+        ("WILL BE HERE", 0x1001, "ENDINGS"),
+        ("WILL", 0x1000, "ENDINGS"),
+        ("WITH", 0x1030, "ENDINGS"),
+        ("WITHOUT", 0x103E, "ENDINGS"),
+        ("WON'T", 0x1014, "ENDINGS"),
+        ("WONDER", 0x1004, "ENDINGS"),
+        ("WOULD", 0x100A, "ENDINGS"),
+    ],
+    [
+        ("ADORE", 0x1228, "FEELINGS"),
+        ("ALL RIGHT", 0x1227, "FEELINGS"),
+        ("ANGER", 0x1218, "FEELINGS"),
+        ("ANGRY", 0x1217, "FEELINGS"),
+        ("BAD", 0x122E, "FEELINGS"),
+        ("BEAT", 0x123F, "FEELINGS"),
+        ("BORING", 0x1224, "FEELINGS"),
+        ("CARE", 0x1225, "FEELINGS"),
+        ("CARES", 0x1226, "FEELINGS"),
+        ("DANGER", 0x123D, "FEELINGS"),
+        ("DARN", 0x121F, "FEELINGS"),
+        ("DEFEATED", 0x123E, "FEELINGS"),
+        ("DISAPPOINT", 0x121B, "FEELINGS"),
+        ("DISAPPOINTED", 0x120C, "FEELINGS"),
+        ("DISAPPOINTS", 0x120D, "FEELINGS"),
+        ("DISASTER", 0x1229, "FEELINGS"),
+        ("DISLIKE", 0x1216, "FEELINGS"),
+        ("DISLIKES", 0x1223, "FEELINGS"),
+        ("DONE", 0x123C, "FEELINGS"),
+        ("DOWNCAST", 0x1220, "FEELINGS"),
+        ("DRINK", 0x1233, "FEELINGS"),
+        ("EAT", 0x122C, "FEELINGS"),
+        ("ENJOY", 0x122A, "FEELINGS"),
+        ("ENJOYS", 0x122B, "FEELINGS"),
+        ("EXCITE", 0x1207, "FEELINGS"),
+        ("FEAR", 0x1235, "FEELINGS"),
+        ("FUNNY", 0x1209, "FEELINGS"),
+        ("GETS", 0x121D, "FEELINGS"),
+        ("GIDDY", 0x1204, "FEELINGS"),
+        ("GO HOME", 0x120B, "FEELINGS"),
+        ("GOES", 0x1203, "FEELINGS"),
+        ("GOT", 0x120A, "FEELINGS"),
+        ("GREAT", 0x1240, "FEELINGS"),
+        ("HAPPINESS", 0x1206, "FEELINGS"),
+        ("HAPPY", 0x1205, "FEELINGS"),
+        ("HARD", 0x122F, "FEELINGS"),
+        ("HEAR", 0x1213, "FEELINGS"),
+        ("HEARS", 0x1211, "FEELINGS"),
+        ("HURRIED", 0x1202, "FEELINGS"),
+        ("IMPORTANT", 0x1208, "FEELINGS"),
+        ("INCREDIBLE", 0x1221, "FEELINGS"),
+        ("JOY", 0x121C, "FEELINGS"),
+        ("LACKING", 0x122D, "FEELINGS"),
+        ("LIKES", 0x1222, "FEELINGS"),
+        ("LONESOME", 0x121A, "FEELINGS"),
+        ("MEET", 0x1200, "FEELINGS"),
+        ("MISHEARD", 0x1215, "FEELINGS"),
+        ("NEGATIVE", 0x123B, "FEELINGS"),
+        ("NEVER", 0x121E, "FEELINGS"),
+        ("NICE", 0x1232, "FEELINGS"),
+        ("PLAY", 0x1201, "FEELINGS"),
+        ("QUESTION", 0x1242, "FEELINGS"),
+        ("RARE", 0x123A, "FEELINGS"),
+        ("ROMANTIC", 0x1241, "FEELINGS"),
+        ("SAD", 0x120E, "FEELINGS"),
+        ("SATISFIED", 0x1238, "FEELINGS"),
+        ("SCARY", 0x1219, "FEELINGS"),
+        ("SEE", 0x1239, "FEELINGS"),
+        ("SHOULD", 0x1231, "FEELINGS"),
+        ("SURPRISE", 0x1234, "FEELINGS"),
+        ("TERRIBLE", 0x1230, "FEELINGS"),
+        ("THINK", 0x1212, "FEELINGS"),
+        ("TRIES", 0x1210, "FEELINGS"),
+        ("TRY", 0x120F, "FEELINGS"),
+        ("UNDERSTAND", 0x1243, "FEELINGS"),
+        ("UNDERSTANDS", 0x1244, "FEELINGS"),
+        ("WAIT", 0x1237, "FEELINGS"),
+        ("WANT", 0x1236, "FEELINGS"),
+        ("WANTS", 0x1214, "FEELINGS"),
+    ],
+    [
+        ("ABSENT", 0x140D, "CONDITIONS"),
+        ("ALONE", 0x1437, "CONDITIONS"),
+        ("AMUSING", 0x1417, "CONDITIONS"),
+        ("APPROVED", 0x1403, "CONDITIONS"),
+        ("AWFUL", 0x1436, "CONDITIONS"),
+        ("BADLY", 0x1444, "CONDITIONS"),
+        ("BECOMES", 0x1432, "CONDITIONS"),
+        ("BEING", 0x140E, "CONDITIONS"),
+        ("BEST", 0x143C, "CONDITIONS"),
+        ("BIG", 0x1413, "CONDITIONS"),
+        ("BORED", 0x1438, "CONDITIONS"),
+        ("BUSY", 0x140A, "CONDITIONS"),
+        ("CLOSE", 0x1415, "CONDITIONS"),
+        ("COLD", 0x141E, "CONDITIONS"),
+        ("CORRECT", 0x1426, "CONDITIONS"),
+        ("DIFFERENT", 0x1429, "CONDITIONS"),
+        ("DOCILE", 0x1416, "CONDITIONS"),
+        ("ELSE", 0x1424, "CONDITIONS"),
+        ("ENTERTAINING", 0x1418, "CONDITIONS"),
+        ("EXCELLENT", 0x141C, "CONDITIONS"),
+        ("EXCESS", 0x1402, "CONDITIONS"),
+        ("EXISTS", 0x1401, "CONDITIONS"),
+        ("EXPENSIVE", 0x1425, "CONDITIONS"),
+        ("FABULOUS", 0x1423, "CONDITIONS"),
+        ("FAST", 0x1434, "CONDITIONS"),
+        ("FULL", 0x140C, "CONDITIONS"),
+        ("GOING", 0x1408, "CONDITIONS"),
+        ("GOOD", 0x1405, "CONDITIONS"),
+        ("HAS", 0x1404, "CONDITIONS"),
+        ("HEALTHY", 0x141B, "CONDITIONS"),
+        ("HOT", 0x1400, "CONDITIONS"),
+        ("IMPOSSIBLE", 0x1427, "CONDITIONS"),
+        ("KIND", 0x143F, "CONDITIONS"),
+        ("LACKS", 0x143B, "CONDITIONS"),
+        ("LATE", 0x1414, "CONDITIONS"),
+        ("LESS", 0x1406, "CONDITIONS"),
+        ("LOUSY", 0x143D, "CONDITIONS"),
+        ("LOW", 0x1435, "CONDITIONS"),
+        ("LUKEWARM", 0x1433, "CONDITIONS"),
+        ("MISTAKE", 0x143E, "CONDITIONS"),
+        ("MOMENTUM", 0x1407, "CONDITIONS"),
+        ("MUCH", 0x1421, "CONDITIONS"),
+        ("MYSTERY", 0x143A, "CONDITIONS"),
+        ("NATURAL", 0x1431, "CONDITIONS"),
+        ("NEED", 0x140F, "CONDITIONS"),
+        ("NOISY", 0x1412, "CONDITIONS"),
+        ("NON-STOP", 0x142D, "CONDITIONS"),
+        ("NONE", 0x142F, "CONDITIONS"),
+        ("NOTHING", 0x1430, "CONDITIONS"),
+        ("OVERWHELMING", 0x1422, "CONDITIONS"),
+        ("PERFECTION", 0x1419, "CONDITIONS"),
+        ("PREPOSTEROUS", 0x142E, "CONDITIONS"),
+        ("PRETTY", 0x141A, "CONDITIONS"),
+        ("REFRESHING", 0x141F, "CONDITIONS"),
+        ("SECRET", 0x1439, "CONDITIONS"),
+        ("SEEMS", 0x1443, "CONDITIONS"),
+        ("SIMPLE", 0x1442, "CONDITIONS"),
+        ("SKILL", 0x142B, "CONDITIONS"),
+        ("SKILLED", 0x1411, "CONDITIONS"),
+        ("SMALL", 0x1428, "CONDITIONS"),
+        ("TASTY", 0x1410, "CONDITIONS"),
+        ("TIRED", 0x142A, "CONDITIONS"),
+        ("TOGETHER", 0x140B, "CONDITIONS"),
+        ("TOP", 0x142C, "CONDITIONS"),
+        ("UNAVOIDABLE", 0x1420, "CONDITIONS"),
+        ("UPSIDE DOWN", 0x141D, "CONDITIONS"),
+        ("WEAKENED", 0x1441, "CONDITIONS"),
+        ("WEIRD", 0x1409, "CONDITIONS"),
+        ("WELL", 0x1440, "CONDITIONS"),
+    ],
+    [
+        ("ALLOW", 0x1648, "ACTIONS"),
+        ("ANGERS", 0x160E, "ACTIONS"),
+        ("APPEAR", 0x1630, "ACTIONS"),
+        ("APPEARS", 0x164B, "ACTIONS"),
+        ("BELIEVE", 0x1627, "ACTIONS"),
+        ("BRAG", 0x1624, "ACTIONS"),
+        ("CAME", 0x161C, "ACTIONS"),
+        ("CAPABLE", 0x162E, "ACTIONS"),
+        ("CAUSE", 0x161F, "ACTIONS"),
+        ("CHANGE", 0x1613, "ACTIONS"),
+        ("CHOOSE", 0x161A, "ACTIONS"),
+        ("COLLECT", 0x1606, "ACTIONS"),
+        ("COME", 0x161B, "ACTIONS"),
+        ("CONCEDE", 0x1601, "ACTIONS"),
+        ("COULDN'T", 0x162D, "ACTIONS"),
+        ("DISAPPEAR", 0x162F, "ACTIONS"),
+        ("DRINKS", 0x1636, "ACTIONS"),
+        ("EATS", 0x1629, "ACTIONS"),
+        ("FAINT", 0x164C, "ACTIONS"),
+        ("FAINTED", 0x164D, "ACTIONS"),
+        ("FORGET", 0x1649, "ACTIONS"),
+        ("FORGETS", 0x164A, "ACTIONS"),
+        ("GIVE", 0x1602, "ACTIONS"),
+        ("GIVES", 0x1603, "ACTIONS"),
+        ("HEARING", 0x1618, "ACTIONS"),
+        ("IGNORANT", 0x1625, "ACTIONS"),
+        ("KNOW", 0x1620, "ACTIONS"),
+        ("KNOWS", 0x1621, "ACTIONS"),
+        ("LAVISH", 0x1616, "ACTIONS"),
+        ("LEARN", 0x1612, "ACTIONS"),
+        ("LISTENS", 0x1617, "ACTIONS"),
+        ("LOOKS", 0x1643, "ACTIONS"),
+        ("MAKE", 0x161E, "ACTIONS"),
+        ("MEETS", 0x1600, "ACTIONS"),
+        ("OVERDO", 0x1641, "ACTIONS"),
+        ("OWN", 0x1646, "ACTIONS"),
+        ("PLAYED", 0x1604, "ACTIONS"),
+        ("PLAYS", 0x1605, "ACTIONS"),
+        ("PLEASE", 0x1611, "ACTIONS"),
+        ("PRAISE", 0x1640, "ACTIONS"),
+        ("PRETEND", 0x163F, "ACTIONS"),
+        ("REFUSE", 0x1622, "ACTIONS"),
+        ("RELEASE", 0x1635, "ACTIONS"),
+        ("RUN", 0x1638, "ACTIONS"),
+        ("RUNS", 0x1637, "ACTIONS"),
+        ("SAID", 0x160B, "ACTIONS"),
+        ("SAYS", 0x1609, "ACTIONS"),
+        ("SEARCH", 0x161D, "ACTIONS"),
+        ("SEEK", 0x1645, "ACTIONS"),
+        ("SEES", 0x1644, "ACTIONS"),
+        ("SHOW", 0x1642, "ACTIONS"),
+        ("SINK", 0x163D, "ACTIONS"),
+        ("SLEEP", 0x1634, "ACTIONS"),
+        ("SLEPT", 0x1633, "ACTIONS"),
+        ("SLIDE", 0x1628, "ACTIONS"),
+        ("SMACK", 0x163E, "ACTIONS"),
+        ("STORES", 0x1623, "ACTIONS"),
+        ("STORY", 0x1614, "ACTIONS"),
+        ("TAKE", 0x1647, "ACTIONS"),
+        ("TALK", 0x163C, "ACTIONS"),
+        ("TALKING", 0x163B, "ACTIONS"),
+        ("TEACH", 0x160F, "ACTIONS"),
+        ("TEACHES", 0x1610, "ACTIONS"),
+        ("THINKS", 0x1626, "ACTIONS"),
+        ("THROW", 0x1631, "ACTIONS"),
+        ("TRAINS", 0x1619, "ACTIONS"),
+        ("TRUST", 0x1615, "ACTIONS"),
+        ("USE", 0x162A, "ACTIONS"),
+        ("USES", 0x162B, "ACTIONS"),
+        ("USING", 0x162C, "ACTIONS"),
+        ("WAKE UP", 0x160C, "ACTIONS"),
+        ("WAKES UP", 0x160D, "ACTIONS"),
+        ("WALKING", 0x1607, "ACTIONS"),
+        ("WALKS", 0x1608, "ACTIONS"),
+        ("WENT", 0x160A, "ACTIONS"),
+        ("WORKING", 0x163A, "ACTIONS"),
+        ("WORKS", 0x1639, "ACTIONS"),
+        ("WORRY", 0x1632, "ACTIONS"),
+    ],
+    [
+        ("ALLOWANCE", 0x1803, "LIFESTYLE"),
+        ("BATH", 0x1804, "LIFESTYLE"),
+        ("CHORES", 0x1800, "LIFESTYLE"),
+        ("CLASS", 0x1810, "LIFESTYLE"),
+        ("COMMEMORATE", 0x1807, "LIFESTYLE"),
+        ("CONVERSATION", 0x1805, "LIFESTYLE"),
+        ("DEPT. STORE", 0x181A, "LIFESTYLE"),
+        ("DIGITAL", 0x1818, "LIFESTYLE"),
+        ("DREAM", 0x1827, "LIFESTYLE"),
+        ("EVENT", 0x1817, "LIFESTYLE"),
+        ("GROUP", 0x1809, "LIFESTYLE"),
+        ("HABIT", 0x1808, "LIFESTYLE"),
+        ("HOME", 0x1801, "LIFESTYLE"),
+        ("INFORMATION", 0x1812, "LIFESTYLE"),
+        ("ITEM", 0x181D, "LIFESTYLE"),
+        ("KINDERGARTEN", 0x1828, "LIFESTYLE"),
+        ("LESSONS", 0x1811, "LIFESTYLE"),
+        ("LETTER", 0x1816, "LIFESTYLE"),
+        ("LIFE", 0x1829, "LIFESTYLE"),
+        ("LIVING", 0x1813, "LIFESTYLE"),
+        ("MACHINE", 0x1823, "LIFESTYLE"),
+        ("MAIL", 0x1824, "LIFESTYLE"),
+        ("MESSAGE", 0x1825, "LIFESTYLE"),
+        ("MONEY", 0x1802, "LIFESTYLE"),
+        ("NAME", 0x181E, "LIFESTYLE"),
+        ("NEWS", 0x181F, "LIFESTYLE"),
+        ("PARTY", 0x1821, "LIFESTYLE"),
+        ("PHONE", 0x181C, "LIFESTYLE"),
+        ("POPULAR", 0x1820, "LIFESTYLE"),
+        ("PROMISE", 0x1826, "LIFESTYLE"),
+        ("RADIO", 0x182A, "LIFESTYLE"),
+        ("RENTAL", 0x182B, "LIFESTYLE"),
+        ("SCHOOL", 0x1806, "LIFESTYLE"),
+        ("SERVICE", 0x180C, "LIFESTYLE"),
+        ("STORE", 0x180B, "LIFESTYLE"),
+        ("STUDY", 0x1822, "LIFESTYLE"),
+        ("SYSTEM", 0x180E, "LIFESTYLE"),
+        ("TEACHER", 0x1814, "LIFESTYLE"),
+        ("TELEVISION", 0x181B, "LIFESTYLE"),
+        ("TEST", 0x1819, "LIFESTYLE"),
+        ("TOURNAMENT", 0x1815, "LIFESTYLE"),
+        ("TRAIN", 0x180F, "LIFESTYLE"),
+        ("WORD", 0x180A, "LIFESTYLE"),
+        ("WORK", 0x180D, "LIFESTYLE"),
+        ("WORLD", 0x182C, "LIFESTYLE"),
+    ],
+    [
+        ("ADVENTURE", 0x1A2B, "HOBBIES"),
+        ("ANIME", 0x1A01, "HOBBIES"),
+        ("BALL", 0x1A2D, "HOBBIES"),
+        ("BIKE", 0x1A15, "HOBBIES"),
+        ("BOARD", 0x1A2C, "HOBBIES"),
+        ("BOOK", 0x1A2E, "HOBBIES"),
+        ("CAMERA", 0x1A0B, "HOBBIES"),
+        ("CARDS", 0x1A09, "HOBBIES"),
+        ("CHANNEL", 0x1A1E, "HOBBIES"),
+        ("CHAT", 0x1A05, "HOBBIES"),
+        ("CHILD'S PLAY", 0x1A06, "HOBBIES"),
+        ("COLLECTION", 0x1A11, "HOBBIES"),
+        ("COMICS", 0x1A30, "HOBBIES"),
+        ("COMPLETE", 0x1A12, "HOBBIES"),
+        ("DANCE", 0x1A1D, "HOBBIES"),
+        ("DATE", 0x1A21, "HOBBIES"),
+        ("DESIGN", 0x1A22, "HOBBIES"),
+        ("DIET", 0x1A1A, "HOBBIES"),
+        ("FASHION", 0x1A2A, "HOBBIES"),
+        ("FESTIVAL", 0x1A2F, "HOBBIES"),
+        ("FISHING", 0x1A20, "HOBBIES"),
+        ("FLOWERS", 0x1A26, "HOBBIES"),
+        ("GAME", 0x1A0F, "HOBBIES"),
+        ("GOURMET", 0x1A0E, "HOBBIES"),
+        ("HERO", 0x1A27, "HOBBIES"),
+        ("HEROINE", 0x1A29, "HOBBIES"),
+        ("HOBBY", 0x1A16, "HOBBIES"),
+        ("HOLIDAY", 0x1A31, "HOBBIES"),
+        ("IDOL", 0x1A00, "HOBBIES"),
+        ("LOCOMOTIVE", 0x1A23, "HOBBIES"),
+        ("LOOK", 0x1A35, "HOBBIES"),
+        ("MAGAZINE", 0x1A13, "HOBBIES"),
+        ("MAKING", 0x1A1F, "HOBBIES"),
+        ("MOVIE", 0x1A03, "HOBBIES"),
+        ("MUSIC", 0x1A08, "HOBBIES"),
+        ("NAP", 0x1A28, "HOBBIES"),
+        ("PC", 0x1A25, "HOBBIES"),
+        ("PLANS", 0x1A32, "HOBBIES"),
+        ("PLUSH DOLL", 0x1A24, "HOBBIES"),
+        ("RPG", 0x1A10, "HOBBIES"),
+        ("SHOPPING", 0x1A0A, "HOBBIES"),
+        ("SOFTWARE", 0x1A18, "HOBBIES"),
+        ("SONG", 0x1A02, "HOBBIES"),
+        ("SONGS", 0x1A19, "HOBBIES"),
+        ("SPECTATOR", 0x1A0D, "HOBBIES"),
+        ("SPORTS", 0x1A17, "HOBBIES"),
+        ("SWEETS", 0x1A04, "HOBBIES"),
+        ("TOYS", 0x1A07, "HOBBIES"),
+        ("TRAVEL", 0x1A1C, "HOBBIES"),
+        ("TREASURE", 0x1A1B, "HOBBIES"),
+        ("TRENDY", 0x1A33, "HOBBIES"),
+        ("VACATION", 0x1A34, "HOBBIES"),
+        ("VIEWING", 0x1A0C, "HOBBIES"),
+        ("WALK", 0x1A14, "HOBBIES"),
+    ],
+    [
+        ("AGE", 0x1C1D, "TIME"),
+        ("ALMOST", 0x1C27, "TIME"),
+        ("ALWAYS", 0x1C06, "TIME"),
+        ("ANOTHER", 0x1C12, "TIME"),
+        ("BEGINNING", 0x1C21, "TIME"),
+        ("CURRENT", 0x1C07, "TIME"),
+        ("DAILY", 0x1C25, "TIME"),
+        ("DAY", 0x1C04, "TIME"),
+        ("DAYS", 0x1C09, "TIME"),
+        ("DAYTIME", 0x1C23, "TIME"),
+        ("EARLIER", 0x1C11, "TIME"),
+        ("END", 0x1C0A, "TIME"),
+        ("FALL", 0x1C00, "TIME"),
+        ("FINAL", 0x1C1B, "TIME"),
+        ("FINISH", 0x1C14, "TIME"),
+        ("FOREVER", 0x1C08, "TIME"),
+        ("FRIDAY", 0x1C0E, "TIME"),
+        ("LAST", 0x1C03, "TIME"),
+        ("LATER", 0x1C10, "TIME"),
+        ("MONDAY", 0x1C0F, "TIME"),
+        ("MONTH", 0x1C18, "TIME"),
+        ("MORNING", 0x1C01, "TIME"),
+        ("NEARLY", 0x1C28, "TIME"),
+        ("NEXT", 0x1C1C, "TIME"),
+        ("NIGHT", 0x1C2B, "TIME"),
+        ("NIGHTTIME", 0x1C2A, "TIME"),
+        ("NOW", 0x1C1A, "TIME"),
+        ("OLDEN", 0x1C26, "TIME"),
+        ("SATURDAY", 0x1C1E, "TIME"),
+        ("SOMETIME", 0x1C05, "TIME"),
+        ("SOON", 0x1C16, "TIME"),
+        ("SPRING", 0x1C22, "TIME"),
+        ("START", 0x1C17, "TIME"),
+        ("STOP", 0x1C19, "TIME"),
+        ("SUMMER", 0x1C1F, "TIME"),
+        ("SUNDAY", 0x1C20, "TIME"),
+        ("THURSDAY", 0x1C29, "TIME"),
+        ("TIME", 0x1C13, "TIME"),
+        ("TODAY", 0x1C0D, "TIME"),
+        ("TOMORROW", 0x1C02, "TIME"),
+        ("TUESDAY", 0x1C0B, "TIME"),
+        ("WEDNESDAY", 0x1C15, "TIME"),
+        ("WEEK", 0x1C2C, "TIME"),
+        ("WINTER", 0x1C24, "TIME"),
+        ("YESTERDAY", 0x1C0C, "TIME"),
+    ],
+    [
+        ("ABOVE", 0x1E07, "MISC"),
+        ("AM", 0x1E18, "MISC"),
+        ("AWAY", 0x1E1E, "MISC"),
+        ("BACK", 0x1E08, "MISC"),
+        ("BELOW", 0x1E06, "MISC"),
+        ("BESIDE", 0x1E0D, "MISC"),
+        ("CHOICE", 0x1E1C, "MISC"),
+        ("CONFUSED", 0x1E26, "MISC"),
+        ("DEEP", 0x1E23, "MISC"),
+        ("DOWN", 0x1E13, "MISC"),
+        ("EVERY", 0x1E10, "MISC"),
+        ("FAR", 0x1E1D, "MISC"),
+        ("FRONT", 0x1E1A, "MISC"),
+        ("HERE", 0x1E0A, "MISC"),
+        ("HIGH", 0x1E09, "MISC"),
+        ("HIGHS", 0x1E00, "MISC"),
+        ("INSIDE", 0x1E0B, "MISC"),
+        ("LEFT", 0x1E28, "MISC"),
+        ("LOWS", 0x1E01, "MISC"),
+        ("NEAR", 0x1E1F, "MISC"),
+        ("OPPOSITE", 0x1E27, "MISC"),
+        ("OUTSIDE", 0x1E0C, "MISC"),
+        ("REAR", 0x1E03, "MISC"),
+        ("RIGHT", 0x1E29, "MISC"),
+        ("SHALLOW", 0x1E24, "MISC"),
+        ("THAT WAS", 0x1E19, "MISC"),
+        ("THAT'S IT!", 0x1E17, "MISC"),
+        ("THAT", 0x1E14, "MISC"),
+        ("THESE WERE", 0x1E12, "MISC"),
+        ("THESE", 0x1E11, "MISC"),
+        ("THING", 0x1E05, "MISC"),
+        ("THINGS", 0x1E04, "MISC"),
+        ("THIS IS IT!", 0x1E0E, "MISC"),
+        ("THIS", 0x1E0F, "MISC"),
+        ("THOSE ARE", 0x1E15, "MISC"),
+        ("THOSE WERE", 0x1E16, "MISC"),
+        ("UM", 0x1E02, "MISC"),
+        ("UP", 0x1E1B, "MISC"),
+        ("WHAT", 0x1E22, "MISC"),
+        ("WHEN", 0x1E21, "MISC"),
+        ("WHERE", 0x1E20, "MISC"),
+        ("WHY", 0x1E25, "MISC"),
+    ],
+    [
+        ("ANTICIPATION", 0x2023, "ADJECTIVES"),
+        ("AWESOME", 0x2017, "ADJECTIVES"),
+        ("BREAK", 0x2014, "ADJECTIVES"),
+        ("DESTROYED", 0x201F, "ADJECTIVES"),
+        ("DROOLING", 0x200E, "ADJECTIVES"),
+        ("EXCITING", 0x200F, "ADJECTIVES"),
+        ("FIERY", 0x2020, "ADJECTIVES"),
+        ("HAPPILY", 0x2022, "ADJECTIVES"),
+        ("HOPELESS", 0x200C, "ADJECTIVES"),
+        ("HUNGRY", 0x2003, "ADJECTIVES"),
+        ("INCREASING", 0x201D, "ADJECTIVES"),
+        ("LOLLING", 0x2009, "ADJECTIVES"),
+        ("LOVEY-DOVEY", 0x2021, "ADJECTIVES"),
+        ("RICKETY", 0x2001, "ADJECTIVES"),
+        ("RIPPED", 0x201B, "ADJECTIVES"),
+        ("ROCK-SOLID", 0x2002, "ADJECTIVES"),
+        ("SADLY", 0x200B, "ADJECTIVES"),
+        ("SCATTER", 0x2016, "ADJECTIVES"),
+        ("SHAKY", 0x201A, "ADJECTIVES"),
+        ("SHREDDED", 0x201C, "ADJECTIVES"),
+        ("SILKY", 0x200A, "ADJECTIVES"),
+        ("SLIMY", 0x2012, "ADJECTIVES"),
+        ("SMOOTH", 0x2011, "ADJECTIVES"),
+        ("SPIRALING", 0x2007, "ADJECTIVES"),
+        ("THICK", 0x2010, "ADJECTIVES"),
+        ("THIN", 0x2013, "ADJECTIVES"),
+        ("THIRSTY", 0x2008, "ADJECTIVES"),
+        ("TICKLISH", 0x2005, "ADJECTIVES"),
+        ("TIGHT", 0x2004, "ADJECTIVES"),
+        ("TWIRLING", 0x2006, "ADJECTIVES"),
+        ("USELESS", 0x200D, "ADJECTIVES"),
+        ("VORACIOUS", 0x2015, "ADJECTIVES"),
+        ("WANDERING", 0x2000, "ADJECTIVES"),
+        ("WIMPY", 0x2018, "ADJECTIVES"),
+        ("WOBBLY", 0x2019, "ADJECTIVES"),
+        ("YET", 0x201E, "ADJECTIVES"),
+    ],
+    [
+        ("{POKEBLOCK}", 0x2212, "EVENTS"),
+        ("APPEAL", 0x2200, "EVENTS"),
+        ("BATTLE ROOM", 0x220E, "EVENTS"),
+        ("BATTLE TOWER", 0x220C, "EVENTS"),
+        ("BERRY", 0x2203, "EVENTS"),
+        ("BLEND", 0x2211, "EVENTS"),
+        ("CONTEST", 0x2204, "EVENTS"),
+        ("CRUSH", 0x2216, "EVENTS"),
+        ("DIRECT", 0x2217, "EVENTS"),
+        ("EVENTS", 0x2201, "EVENTS"),
+        ("EVOLUTION", 0x220A, "EVENTS"),
+        ("HALL OF FAME", 0x2209, "EVENTS"),
+        ("HIDDEN", 0x220F, "EVENTS"),
+        ("HYPER", 0x220B, "EVENTS"),
+        ("JUDGE", 0x2206, "EVENTS"),
+        ("LEADERS", 0x220D, "EVENTS"),
+        ("MASTER", 0x2213, "EVENTS"),
+        ("MC", 0x2205, "EVENTS"),
+        ("RANK", 0x2214, "EVENTS"),
+        ("RIBBON", 0x2215, "EVENTS"),
+        ("ROOM", 0x221A, "EVENTS"),
+        ("SECRET BASE", 0x2210, "EVENTS"),
+        ("STAGE", 0x2208, "EVENTS"),
+        ("STAY-AT-HOME", 0x2202, "EVENTS"),
+        ("SUPER", 0x2207, "EVENTS"),
+        ("TOWER", 0x2218, "EVENTS"),
+        ("UNION", 0x2219, "EVENTS"),
+        ("WIRELESS", 0x221B, "EVENTS"),
+    ],
+    [
+        ("ABSORB", 0x2447, "MOVE_1"),
+        ("AEROBLAST", 0x24B1, "MOVE_1"),
+        ("AGILITY", 0x2461, "MOVE_1"),
+        ("AIR_CUTTER", 0x253A, "MOVE_1"),
+        ("ANCIENT_POWER", 0x24F6, "MOVE_1"),
+        ("AROMATHERAPY", 0x2538, "MOVE_1"),
+        ("ASTONISH", 0x2536, "MOVE_1"),
+        ("AURORA_BEAM", 0x243E, "MOVE_1"),
+        ("BIDE", 0x2475, "MOVE_1"),
+        ("BIND", 0x2414, "MOVE_1"),
+        ("BITE", 0x242C, "MOVE_1"),
+        ("BRICK_BREAK", 0x2518, "MOVE_1"),
+        ("BUBBLE", 0x2491, "MOVE_1"),
+        ("CHARGE", 0x250C, "MOVE_1"),
+        ("CHARM", 0x24CC, "MOVE_1"),
+        ("CLAMP", 0x2480, "MOVE_1"),
+        ("CONFUSE_RAY", 0x246D, "MOVE_1"),
+        ("CONSTRICT", 0x2484, "MOVE_1"),
+        ("COSMIC_POWER", 0x2542, "MOVE_1"),
+        ("COUNTER", 0x2444, "MOVE_1"),
+        ("CRABHAMMER", 0x2498, "MOVE_1"),
+        ("CROSS_CHOP", 0x24EE, "MOVE_1"),
+        ("CRUNCH", 0x24F2, "MOVE_1"),
+        ("CUT", 0x240F, "MOVE_1"),
+        ("DIG", 0x245B, "MOVE_1"),
+        ("DISABLE", 0x2432, "MOVE_1"),
+        ("DOUBLE_EDGE", 0x2426, "MOVE_1"),
+        ("DOUBLE_SLAP", 0x2403, "MOVE_1"),
+        ("DOUBLE_TEAM", 0x2468, "MOVE_1"),
+        ("EARTHQUAKE", 0x2459, "MOVE_1"),
+        ("ENCORE", 0x24E3, "MOVE_1"),
+        ("ENDEAVOR", 0x251B, "MOVE_1"),
+        ("ENDURE", 0x24CB, "MOVE_1"),
+        ("EXTRASENSORY", 0x2546, "MOVE_1"),
+        ("EXTREME_SPEED", 0x24F5, "MOVE_1"),
+        ("FACADE", 0x2507, "MOVE_1"),
+        ("FAKE_TEARS", 0x2539, "MOVE_1"),
+        ("FISSURE", 0x245A, "MOVE_1"),
+        ("FLAIL", 0x24AF, "MOVE_1"),
+        ("FLAME_WHEEL", 0x24AC, "MOVE_1"),
+        ("FLAMETHROWER", 0x2435, "MOVE_1"),
+        ("FLATTER", 0x2504, "MOVE_1"),
+        ("FLY", 0x2413, "MOVE_1"),
+        ("FOCUS_ENERGY", 0x2474, "MOVE_1"),
+        ("FOCUS_PUNCH", 0x2508, "MOVE_1"),
+        ("FOLLOW_ME", 0x250A, "MOVE_1"),
+        ("GIGA_DRAIN", 0x24CA, "MOVE_1"),
+        ("GRASS_WHISTLE", 0x2540, "MOVE_1"),
+        ("GROWTH", 0x244A, "MOVE_1"),
+        ("GRUDGE", 0x2520, "MOVE_1"),
+        ("GUST", 0x2410, "MOVE_1"),
+        ("HAIL", 0x2502, "MOVE_1"),
+        ("HARDEN", 0x246A, "MOVE_1"),
+        ("HAZE", 0x2472, "MOVE_1"),
+        ("HEADBUTT", 0x241D, "MOVE_1"),
+        ("HEAL_BELL", 0x24D7, "MOVE_1"),
+        ("HYPNOSIS", 0x245F, "MOVE_1"),
+        ("ICE_BALL", 0x252D, "MOVE_1"),
+        ("ICY_WIND", 0x24C4, "MOVE_1"),
+        ("IRON_TAIL", 0x24E7, "MOVE_1"),
+        ("KARATE_CHOP", 0x2402, "MOVE_1"),
+        ("KINESIS", 0x2486, "MOVE_1"),
+        ("LEECH_LIFE", 0x248D, "MOVE_1"),
+        ("LICK", 0x247A, "MOVE_1"),
+        ("LOVELY_KISS", 0x248E, "MOVE_1"),
+        ("LOW_KICK", 0x2443, "MOVE_1"),
+        ("MEAN_LOOK", 0x24D4, "MOVE_1"),
+        ("MEMENTO", 0x2506, "MOVE_1"),
+        ("METAL_SOUND", 0x253F, "MOVE_1"),
+        ("METEOR_MASH", 0x2535, "MOVE_1"),
+        ("MIND_READER", 0x24AA, "MOVE_1"),
+        ("MIRROR_MOVE", 0x2477, "MOVE_1"),
+        ("MIST", 0x2436, "MOVE_1"),
+        ("MORNING_SUN", 0x24EA, "MOVE_1"),
+        ("NATURE_POWER", 0x250B, "MOVE_1"),
+        ("NIGHTMARE", 0x24AB, "MOVE_1"),
+        ("OCTAZOOKA", 0x24BE, "MOVE_1"),
+        ("ODOR_SLEUTH", 0x253C, "MOVE_1"),
+        ("OUTRAGE", 0x24C8, "MOVE_1"),
+        ("OVERHEAT", 0x253B, "MOVE_1"),
+        ("PAIN_SPLIT", 0x24DC, "MOVE_1"),
+        ("POWDER_SNOW", 0x24B5, "MOVE_1"),
+        ("PSYBEAM", 0x243C, "MOVE_1"),
+        ("PSYCH_UP", 0x24F4, "MOVE_1"),
+        ("PSYCHIC", 0x245E, "MOVE_1"),
+        ("PSYCHO_BOOST", 0x2562, "MOVE_1"),
+        ("PSYWAVE", 0x2495, "MOVE_1"),
+        ("PURSUIT", 0x24E4, "MOVE_1"),
+        ("RAGE", 0x2463, "MOVE_1"),
+        ("RAIN_DANCE", 0x24F0, "MOVE_1"),
+        ("RAPID_SPIN", 0x24E5, "MOVE_1"),
+        ("RAZOR_WIND", 0x240D, "MOVE_1"),
+        ("RECOVER", 0x2469, "MOVE_1"),
+        ("RETURN", 0x24D8, "MOVE_1"),
+        ("REVERSAL", 0x24B3, "MOVE_1"),
+        ("ROCK_SLIDE", 0x249D, "MOVE_1"),
+        ("ROCK_SMASH", 0x24F9, "MOVE_1"),
+        ("ROCK_THROW", 0x2458, "MOVE_1"),
+        ("ROCK_TOMB", 0x253D, "MOVE_1"),
+        ("ROLLOUT", 0x24CD, "MOVE_1"),
+        ("SACRED_FIRE", 0x24DD, "MOVE_1"),
+        ("SAFEGUARD", 0x24DB, "MOVE_1"),
+        ("SAND_ATTACK", 0x241C, "MOVE_1"),
+        ("SAND_TOMB", 0x2548, "MOVE_1"),
+        ("SANDSTORM", 0x24C9, "MOVE_1"),
+        ("SCARY_FACE", 0x24B8, "MOVE_1"),
+        ("SCREECH", 0x2467, "MOVE_1"),
+        ("SELF_DESTRUCT", 0x2478, "MOVE_1"),
+        ("SHADOW_BALL", 0x24F7, "MOVE_1"),
+        ("SHADOW_PUNCH", 0x2545, "MOVE_1"),
+        ("SHARPEN", 0x249F, "MOVE_1"),
+        ("SHEER_COLD", 0x2549, "MOVE_1"),
+        ("SIGNAL_BEAM", 0x2544, "MOVE_1"),
+        ("SILVER_WIND", 0x253E, "MOVE_1"),
+        ("SING", 0x242F, "MOVE_1"),
+        ("SKETCH", 0x24A6, "MOVE_1"),
+        ("SKILL_SWAP", 0x251D, "MOVE_1"),
+        ("SKY_ATTACK", 0x248F, "MOVE_1"),
+        ("SKY_UPPERCUT", 0x2547, "MOVE_1"),
+        ("SLASH", 0x24A3, "MOVE_1"),
+        ("SMELLING_SALT", 0x2509, "MOVE_1"),
+        ("SMOG", 0x247B, "MOVE_1"),
+        ("SMOKESCREEN", 0x246C, "MOVE_1"),
+        ("SNORE", 0x24AD, "MOVE_1"),
+        ("SOLAR_BEAM", 0x244C, "MOVE_1"),
+        ("SONIC_BOOM", 0x2431, "MOVE_1"),
+        ("SPARK", 0x24D1, "MOVE_1"),
+        ("SPIDER_WEB", 0x24A9, "MOVE_1"),
+        ("SPITE", 0x24B4, "MOVE_1"),
+        ("SPORE", 0x2493, "MOVE_1"),
+        ("STRENGTH", 0x2446, "MOVE_1"),
+        ("STRING_SHOT", 0x2451, "MOVE_1"),
+        ("STUN_SPORE", 0x244E, "MOVE_1"),
+        ("SUBMISSION", 0x2442, "MOVE_1"),
+        ("SUPER_FANG", 0x24A2, "MOVE_1"),
+        ("SWAGGER", 0x24CF, "MOVE_1"),
+        ("SWEET_SCENT", 0x24E6, "MOVE_1"),
+        ("SWIFT", 0x2481, "MOVE_1"),
+        ("SYNTHESIS", 0x24EB, "MOVE_1"),
+        ("TAIL_WHIP", 0x2427, "MOVE_1"),
+        ("THRASH", 0x2425, "MOVE_1"),
+        ("THUNDER_PUNCH", 0x2409, "MOVE_1"),
+        ("THUNDER", 0x2457, "MOVE_1"),
+        ("THUNDERBOLT", 0x2455, "MOVE_1"),
+        ("TICKLE", 0x2541, "MOVE_1"),
+        ("TORMENT", 0x2503, "MOVE_1"),
+        ("UPROAR", 0x24FD, "MOVE_1"),
+        ("VITAL_THROW", 0x24E9, "MOVE_1"),
+        ("WATER_SPOUT", 0x2543, "MOVE_1"),
+        ("WEATHER_BALL", 0x2537, "MOVE_1"),
+        ("WHIRLPOOL", 0x24FA, "MOVE_1"),
+        ("WILL_O_WISP", 0x2505, "MOVE_1"),
+        ("WITHDRAW", 0x246E, "MOVE_1"),
+        ("YAWN", 0x2519, "MOVE_1"),
+    ],
+    [
+        ("ACID_ARMOR", 0x2697, "MOVE_2"),
+        ("ACID", 0x2633, "MOVE_2"),
+        ("AERIAL_ACE", 0x274C, "MOVE_2"),
+        ("AMNESIA", 0x2685, "MOVE_2"),
+        ("ARM_THRUST", 0x2724, "MOVE_2"),
+        ("ASSIST", 0x2712, "MOVE_2"),
+        ("ATTRACT", 0x26D5, "MOVE_2"),
+        ("BARRAGE", 0x268C, "MOVE_2"),
+        ("BARRIER", 0x2670, "MOVE_2"),
+        ("BATON_PASS", 0x26E2, "MOVE_2"),
+        ("BEAT_UP", 0x26FB, "MOVE_2"),
+        ("BELLY_DRUM", 0x26BB, "MOVE_2"),
+        ("BLAST_BURN", 0x2733, "MOVE_2"),
+        ("BLAZE_KICK", 0x272B, "MOVE_2"),
+        ("BLIZZARD", 0x263B, "MOVE_2"),
+        ("BLOCK", 0x274F, "MOVE_2"),
+        ("BODY_SLAM", 0x2622, "MOVE_2"),
+        ("BONE_CLUB", 0x267D, "MOVE_2"),
+        ("BONE_RUSH", 0x26C6, "MOVE_2"),
+        ("BONEMERANG", 0x269B, "MOVE_2"),
+        ("BOUNCE", 0x2754, "MOVE_2"),
+        ("BUBBLE_BEAM", 0x263D, "MOVE_2"),
+        ("BULK_UP", 0x2753, "MOVE_2"),
+        ("BULLET_SEED", 0x274B, "MOVE_2"),
+        ("CALM_MIND", 0x275B, "MOVE_2"),
+        ("CAMOUFLAGE", 0x2725, "MOVE_2"),
+        ("COMET_PUNCH", 0x2604, "MOVE_2"),
+        ("CONFUSION", 0x265D, "MOVE_2"),
+        ("CONVERSION", 0x26A0, "MOVE_2"),
+        ("COTTON_SPORE", 0x26B2, "MOVE_2"),
+        ("COVET", 0x2757, "MOVE_2"),
+        ("CRUSH_CLAW", 0x2732, "MOVE_2"),
+        ("CURSE", 0x26AE, "MOVE_2"),
+        ("DEFENSE_CURL", 0x266F, "MOVE_2"),
+        ("DESTINY_BOND", 0x26C2, "MOVE_2"),
+        ("DETECT", 0x26C5, "MOVE_2"),
+        ("DIVE", 0x2723, "MOVE_2"),
+        ("DIZZY_PUNCH", 0x2692, "MOVE_2"),
+        ("DOOM_DESIRE", 0x2761, "MOVE_2"),
+        ("DOUBLE_KICK", 0x2618, "MOVE_2"),
+        ("DRAGON_BREATH", 0x26E1, "MOVE_2"),
+        ("DRAGON_CLAW", 0x2751, "MOVE_2"),
+        ("DRAGON_DANCE", 0x275D, "MOVE_2"),
+        ("DRAGON_RAGE", 0x2652, "MOVE_2"),
+        ("DREAM_EATER", 0x268A, "MOVE_2"),
+        ("DRILL_PECK", 0x2641, "MOVE_2"),
+        ("DYNAMIC_PUNCH", 0x26DF, "MOVE_2"),
+        ("EGG_BOMB", 0x2679, "MOVE_2"),
+        ("EMBER", 0x2634, "MOVE_2"),
+        ("ERUPTION", 0x271C, "MOVE_2"),
+        ("EXPLOSION", 0x2699, "MOVE_2"),
+        ("FAINT_ATTACK", 0x26B9, "MOVE_2"),
+        ("FAKE_OUT", 0x26FC, "MOVE_2"),
+        ("FALSE_SWIPE", 0x26CE, "MOVE_2"),
+        ("FEATHER_DANCE", 0x2729, "MOVE_2"),
+        ("FIRE_BLAST", 0x267E, "MOVE_2"),
+        ("FIRE_PUNCH", 0x2607, "MOVE_2"),
+        ("FIRE_SPIN", 0x2653, "MOVE_2"),
+        ("FLASH", 0x2694, "MOVE_2"),
+        ("FORESIGHT", 0x26C1, "MOVE_2"),
+        ("FRENZY_PLANT", 0x2752, "MOVE_2"),
+        ("FRUSTRATION", 0x26DA, "MOVE_2"),
+        ("FURY_ATTACK", 0x261F, "MOVE_2"),
+        ("FURY_CUTTER", 0x26D2, "MOVE_2"),
+        ("FURY_SWIPES", 0x269A, "MOVE_2"),
+        ("FUTURE_SIGHT", 0x26F8, "MOVE_2"),
+        ("GLARE", 0x2689, "MOVE_2"),
+        ("GROWL", 0x262D, "MOVE_2"),
+        ("GUILLOTINE", 0x260C, "MOVE_2"),
+        ("HEAT_WAVE", 0x2701, "MOVE_2"),
+        ("HELPING_HAND", 0x270E, "MOVE_2"),
+        ("HI_JUMP_KICK", 0x2688, "MOVE_2"),
+        ("HIDDEN_POWER", 0x26ED, "MOVE_2"),
+        ("HORN_ATTACK", 0x261E, "MOVE_2"),
+        ("HORN_DRILL", 0x2620, "MOVE_2"),
+        ("HOWL", 0x2750, "MOVE_2"),
+        ("HYDRO_CANNON", 0x2734, "MOVE_2"),
+        ("HYDRO_PUMP", 0x2638, "MOVE_2"),
+        ("HYPER_BEAM", 0x263F, "MOVE_2"),
+        ("HYPER_FANG", 0x269E, "MOVE_2"),
+        ("HYPER_VOICE", 0x2730, "MOVE_2"),
+        ("ICE_BEAM", 0x263A, "MOVE_2"),
+        ("ICE_PUNCH", 0x2608, "MOVE_2"),
+        ("ICICLE_SPEAR", 0x274D, "MOVE_2"),
+        ("IMPRISON", 0x271E, "MOVE_2"),
+        ("INGRAIN", 0x2713, "MOVE_2"),
+        ("IRON_DEFENSE", 0x274E, "MOVE_2"),
+        ("JUMP_KICK", 0x261A, "MOVE_2"),
+        ("KNOCK_OFF", 0x271A, "MOVE_2"),
+        ("LEAF_BLADE", 0x275C, "MOVE_2"),
+        ("LEECH_SEED", 0x2649, "MOVE_2"),
+        ("LEER", 0x262B, "MOVE_2"),
+        ("LIGHT_SCREEN", 0x2671, "MOVE_2"),
+        ("LOCK_ON", 0x26C7, "MOVE_2"),
+        ("LUSTER_PURGE", 0x2727, "MOVE_2"),
+        ("MACH_PUNCH", 0x26B7, "MOVE_2"),
+        ("MAGIC_COAT", 0x2715, "MOVE_2"),
+        ("MAGICAL_LEAF", 0x2759, "MOVE_2"),
+        ("MAGNITUDE", 0x26DE, "MOVE_2"),
+        ("MEDITATE", 0x2660, "MOVE_2"),
+        ("MEGA_DRAIN", 0x2648, "MOVE_2"),
+        ("MEGA_KICK", 0x2619, "MOVE_2"),
+        ("MEGA_PUNCH", 0x2605, "MOVE_2"),
+        ("MEGAHORN", 0x26E0, "MOVE_2"),
+        ("METAL_CLAW", 0x26E8, "MOVE_2"),
+        ("METRONOME", 0x2676, "MOVE_2"),
+        ("MILK_DRINK", 0x26D0, "MOVE_2"),
+        ("MIMIC", 0x2666, "MOVE_2"),
+        ("MINIMIZE", 0x266B, "MOVE_2"),
+        ("MIRROR_COAT", 0x26F3, "MOVE_2"),
+        ("MIST_BALL", 0x2728, "MOVE_2"),
+        ("MOONLIGHT", 0x26EC, "MOVE_2"),
+        ("MUD_SHOT", 0x2755, "MOVE_2"),
+        ("MUD_SLAP", 0x26BD, "MOVE_2"),
+        ("MUD_SPORT", 0x272C, "MOVE_2"),
+        ("MUDDY_WATER", 0x274A, "MOVE_2"),
+        ("NEEDLE_ARM", 0x272E, "MOVE_2"),
+        ("NIGHT_SHADE", 0x2665, "MOVE_2"),
+        ("PAY_DAY", 0x2606, "MOVE_2"),
+        ("PECK", 0x2640, "MOVE_2"),
+        ("PERISH_SONG", 0x26C3, "MOVE_2"),
+        ("PETAL_DANCE", 0x2650, "MOVE_2"),
+        ("PIN_MISSILE", 0x262A, "MOVE_2"),
+        ("POISON_FANG", 0x2731, "MOVE_2"),
+        ("POISON_GAS", 0x268B, "MOVE_2"),
+        ("POISON_POWDER", 0x264D, "MOVE_2"),
+        ("POISON_STING", 0x2628, "MOVE_2"),
+        ("POISON_TAIL", 0x2756, "MOVE_2"),
+        ("POUND", 0x2601, "MOVE_2"),
+        ("PRESENT", 0x26D9, "MOVE_2"),
+        ("PROTECT", 0x26B6, "MOVE_2"),
+        ("QUICK_ATTACK", 0x2662, "MOVE_2"),
+        ("RAZOR_LEAF", 0x264B, "MOVE_2"),
+        ("RECYCLE", 0x2716, "MOVE_2"),
+        ("REFLECT", 0x2673, "MOVE_2"),
+        ("REFRESH", 0x271F, "MOVE_2"),
+        ("REST", 0x269C, "MOVE_2"),
+        ("REVENGE", 0x2717, "MOVE_2"),
+        ("ROAR", 0x262E, "MOVE_2"),
+        ("ROCK_BLAST", 0x275E, "MOVE_2"),
+        ("ROLE_PLAY", 0x2710, "MOVE_2"),
+        ("ROLLING_KICK", 0x261B, "MOVE_2"),
+        ("SCRATCH", 0x260A, "MOVE_2"),
+        ("SECRET_POWER", 0x2722, "MOVE_2"),
+        ("SEISMIC_TOSS", 0x2645, "MOVE_2"),
+        ("SHOCK_WAVE", 0x275F, "MOVE_2"),
+        ("SKULL_BASH", 0x2682, "MOVE_2"),
+        ("SLACK_OFF", 0x272F, "MOVE_2"),
+        ("SLAM", 0x2615, "MOVE_2"),
+        ("SLEEP_POWDER", 0x264F, "MOVE_2"),
+        ("SLEEP_TALK", 0x26D6, "MOVE_2"),
+        ("SLUDGE_BOMB", 0x26BC, "MOVE_2"),
+        ("SLUDGE", 0x267C, "MOVE_2"),
+        ("SNATCH", 0x2721, "MOVE_2"),
+        ("SOFT_BOILED", 0x2687, "MOVE_2"),
+        ("SPIKE_CANNON", 0x2683, "MOVE_2"),
+        ("SPIKES", 0x26BF, "MOVE_2"),
+        ("SPIT_UP", 0x26FF, "MOVE_2"),
+        ("SPLASH", 0x2696, "MOVE_2"),
+        ("STEEL_WING", 0x26D3, "MOVE_2"),
+        ("STOCKPILE", 0x26FE, "MOVE_2"),
+        ("STOMP", 0x2617, "MOVE_2"),
+        ("STRUGGLE", 0x26A5, "MOVE_2"),
+        ("SUBSTITUTE", 0x26A4, "MOVE_2"),
+        ("SUNNY_DAY", 0x26F1, "MOVE_2"),
+        ("SUPERPOWER", 0x2714, "MOVE_2"),
+        ("SUPERSONIC", 0x2630, "MOVE_2"),
+        ("SURF", 0x2639, "MOVE_2"),
+        ("SWALLOW", 0x2700, "MOVE_2"),
+        ("SWEET_KISS", 0x26BA, "MOVE_2"),
+        ("SWORDS_DANCE", 0x260E, "MOVE_2"),
+        ("TACKLE", 0x2621, "MOVE_2"),
+        ("TAIL_GLOW", 0x2726, "MOVE_2"),
+        ("TAKE_DOWN", 0x2624, "MOVE_2"),
+        ("TAUNT", 0x270D, "MOVE_2"),
+        ("TEETER_DANCE", 0x272A, "MOVE_2"),
+        ("TELEPORT", 0x2664, "MOVE_2"),
+        ("THIEF", 0x26A8, "MOVE_2"),
+        ("THUNDER_SHOCK", 0x2654, "MOVE_2"),
+        ("THUNDER_WAVE", 0x2656, "MOVE_2"),
+        ("TOXIC", 0x265C, "MOVE_2"),
+        ("TRANSFORM", 0x2690, "MOVE_2"),
+        ("TRI_ATTACK", 0x26A1, "MOVE_2"),
+        ("TRICK", 0x270F, "MOVE_2"),
+        ("TRIPLE_KICK", 0x26A7, "MOVE_2"),
+        ("TWINEEDLE", 0x2629, "MOVE_2"),
+        ("TWISTER", 0x26EF, "MOVE_2"),
+        ("VICE_GRIP", 0x260B, "MOVE_2"),
+        ("VINE_WHIP", 0x2616, "MOVE_2"),
+        ("VOLT_TACKLE", 0x2758, "MOVE_2"),
+        ("WATER_GUN", 0x2637, "MOVE_2"),
+        ("WATER_PULSE", 0x2760, "MOVE_2"),
+        ("WATER_SPORT", 0x275A, "MOVE_2"),
+        ("WATERFALL", 0x267F, "MOVE_2"),
+        ("WHIRLWIND", 0x2612, "MOVE_2"),
+        ("WING_ATTACK", 0x2611, "MOVE_2"),
+        ("WISH", 0x2711, "MOVE_2"),
+        ("WRAP", 0x2623, "MOVE_2"),
+        ("ZAP_CANNON", 0x26C0, "MOVE_2"),
+    ],
+    [
+        ("ABRA", 0x2A3F, "POKEMON"),
+        ("AERODACTYL", 0x2A8E, "POKEMON"),
+        ("AIPOM", 0x2ABE, "POKEMON"),
+        ("ALAKAZAM", 0x2A41, "POKEMON"),
+        ("AMPHAROS", 0x2AB5, "POKEMON"),
+        ("ARBOK", 0x2A18, "POKEMON"),
+        ("ARCANINE", 0x2A3B, "POKEMON"),
+        ("ARIADOS", 0x2AA8, "POKEMON"),
+        ("ARTICUNO", 0x2A90, "POKEMON"),
+        ("AZUMARILL", 0x2AB8, "POKEMON"),
+        ("BAYLEEF", 0x2A99, "POKEMON"),
+        ("BEEDRILL", 0x2A0F, "POKEMON"),
+        ("BELLOSSOM", 0x2AB6, "POKEMON"),
+        ("BELLSPROUT", 0x2A45, "POKEMON"),
+        ("BLASTOISE", 0x2A09, "POKEMON"),
+        ("BLISSEY", 0x2AF2, "POKEMON"),
+        ("BULBASAUR", 0x2A01, "POKEMON"),
+        ("BUTTERFREE", 0x2A0C, "POKEMON"),
+        ("CATERPIE", 0x2A0A, "POKEMON"),
+        ("CELEBI", 0x2AFB, "POKEMON"),
+        ("CHANSEY", 0x2A71, "POKEMON"),
+        ("CHARIZARD", 0x2A06, "POKEMON"),
+        ("CHARMANDER", 0x2A04, "POKEMON"),
+        ("CHARMELEON", 0x2A05, "POKEMON"),
+        ("CHIKORITA", 0x2A98, "POKEMON"),
+        ("CHINCHOU", 0x2AAA, "POKEMON"),
+        ("CLEFABLE", 0x2A24, "POKEMON"),
+        ("CLEFAIRY", 0x2A23, "POKEMON"),
+        ("CLEFFA", 0x2AAD, "POKEMON"),
+        ("CLOYSTER", 0x2A5B, "POKEMON"),
+        ("CORSOLA", 0x2ADE, "POKEMON"),
+        ("CROBAT", 0x2AA9, "POKEMON"),
+        ("CROCONAW", 0x2A9F, "POKEMON"),
+        ("CUBONE", 0x2A68, "POKEMON"),
+        ("CYNDAQUIL", 0x2A9B, "POKEMON"),
+        ("DELIBIRD", 0x2AE1, "POKEMON"),
+        ("DEWGONG", 0x2A57, "POKEMON"),
+        ("DIGLETT", 0x2A32, "POKEMON"),
+        ("DITTO", 0x2A84, "POKEMON"),
+        ("DODRIO", 0x2A55, "POKEMON"),
+        ("DODUO", 0x2A54, "POKEMON"),
+        ("DONPHAN", 0x2AE8, "POKEMON"),
+        ("DRAGONAIR", 0x2A94, "POKEMON"),
+        ("DRAGONITE", 0x2A95, "POKEMON"),
+        ("DRATINI", 0x2A93, "POKEMON"),
+        ("DROWZEE", 0x2A60, "POKEMON"),
+        ("DUGTRIO", 0x2A33, "POKEMON"),
+        ("DUNSPARCE", 0x2ACE, "POKEMON"),
+        ("EEVEE", 0x2A85, "POKEMON"),
+        ("EKANS", 0x2A17, "POKEMON"),
+        ("ELECTABUZZ", 0x2A7D, "POKEMON"),
+        ("ELECTRODE", 0x2A65, "POKEMON"),
+        ("ELEKID", 0x2AEF, "POKEMON"),
+        ("ENTEI", 0x2AF4, "POKEMON"),
+        ("ESPEON", 0x2AC4, "POKEMON"),
+        ("EXEGGCUTE", 0x2A66, "POKEMON"),
+        ("EXEGGUTOR", 0x2A67, "POKEMON"),
+        ("FARFETCHD", 0x2A53, "POKEMON"),
+        ("FEAROW", 0x2A16, "POKEMON"),
+        ("FERALIGATR", 0x2AA0, "POKEMON"),
+        ("FLAAFFY", 0x2AB4, "POKEMON"),
+        ("FLAREON", 0x2A88, "POKEMON"),
+        ("FORRETRESS", 0x2ACD, "POKEMON"),
+        ("FURRET", 0x2AA2, "POKEMON"),
+        ("GASTLY", 0x2A5C, "POKEMON"),
+        ("GENGAR", 0x2A5E, "POKEMON"),
+        ("GEODUDE", 0x2A4A, "POKEMON"),
+        ("GIRAFARIG", 0x2ACB, "POKEMON"),
+        ("GLIGAR", 0x2ACF, "POKEMON"),
+        ("GLOOM", 0x2A2C, "POKEMON"),
+        ("GOLBAT", 0x2A2A, "POKEMON"),
+        ("GOLDEEN", 0x2A76, "POKEMON"),
+        ("GOLDUCK", 0x2A37, "POKEMON"),
+        ("GOLEM", 0x2A4C, "POKEMON"),
+        ("GRANBULL", 0x2AD2, "POKEMON"),
+        ("GRAVELER", 0x2A4B, "POKEMON"),
+        ("GRIMER", 0x2A58, "POKEMON"),
+        ("GROWLITHE", 0x2A3A, "POKEMON"),
+        ("GYARADOS", 0x2A82, "POKEMON"),
+        ("HAUNTER", 0x2A5D, "POKEMON"),
+        ("HERACROSS", 0x2AD6, "POKEMON"),
+        ("HITMONCHAN", 0x2A6B, "POKEMON"),
+        ("HITMONLEE", 0x2A6A, "POKEMON"),
+        ("HITMONTOP", 0x2AED, "POKEMON"),
+        ("HO_OH", 0x2AFA, "POKEMON"),
+        ("HOOTHOOT", 0x2AA3, "POKEMON"),
+        ("HOPPIP", 0x2ABB, "POKEMON"),
+        ("HORSEA", 0x2A74, "POKEMON"),
+        ("HOUNDOOM", 0x2AE5, "POKEMON"),
+        ("HOUNDOUR", 0x2AE4, "POKEMON"),
+        ("HYPNO", 0x2A61, "POKEMON"),
+        ("IGGLYBUFF", 0x2AAE, "POKEMON"),
+        ("IVYSAUR", 0x2A02, "POKEMON"),
+        ("JIGGLYPUFF", 0x2A27, "POKEMON"),
+        ("JOLTEON", 0x2A87, "POKEMON"),
+        ("JUMPLUFF", 0x2ABD, "POKEMON"),
+        ("JYNX", 0x2A7C, "POKEMON"),
+        ("KABUTO", 0x2A8C, "POKEMON"),
+        ("KABUTOPS", 0x2A8D, "POKEMON"),
+        ("KADABRA", 0x2A40, "POKEMON"),
+        ("KAKUNA", 0x2A0E, "POKEMON"),
+        ("KANGASKHAN", 0x2A73, "POKEMON"),
+        ("KINGDRA", 0x2AE6, "POKEMON"),
+        ("KINGLER", 0x2A63, "POKEMON"),
+        ("KOFFING", 0x2A6D, "POKEMON"),
+        ("KRABBY", 0x2A62, "POKEMON"),
+        ("LANTURN", 0x2AAB, "POKEMON"),
+        ("LAPRAS", 0x2A83, "POKEMON"),
+        ("LARVITAR", 0x2AF6, "POKEMON"),
+        ("LEDIAN", 0x2AA6, "POKEMON"),
+        ("LEDYBA", 0x2AA5, "POKEMON"),
+        ("LICKITUNG", 0x2A6C, "POKEMON"),
+        ("LUGIA", 0x2AF9, "POKEMON"),
+        ("MACHAMP", 0x2A44, "POKEMON"),
+        ("MACHOKE", 0x2A43, "POKEMON"),
+        ("MACHOP", 0x2A42, "POKEMON"),
+        ("MAGBY", 0x2AF0, "POKEMON"),
+        ("MAGCARGO", 0x2ADB, "POKEMON"),
+        ("MAGIKARP", 0x2A81, "POKEMON"),
+        ("MAGMAR", 0x2A7E, "POKEMON"),
+        ("MAGNEMITE", 0x2A51, "POKEMON"),
+        ("MAGNETON", 0x2A52, "POKEMON"),
+        ("MANKEY", 0x2A38, "POKEMON"),
+        ("MANTINE", 0x2AE2, "POKEMON"),
+        ("MAREEP", 0x2AB3, "POKEMON"),
+        ("MARILL", 0x2AB7, "POKEMON"),
+        ("MAROWAK", 0x2A69, "POKEMON"),
+        ("MEGANIUM", 0x2A9A, "POKEMON"),
+        ("MEOWTH", 0x2A34, "POKEMON"),
+        ("METAPOD", 0x2A0B, "POKEMON"),
+        ("MEW", 0x2A97, "POKEMON"),
+        ("MEWTWO", 0x2A96, "POKEMON"),
+        ("MILTANK", 0x2AF1, "POKEMON"),
+        ("MISDREAVUS", 0x2AC8, "POKEMON"),
+        ("MOLTRES", 0x2A92, "POKEMON"),
+        ("MR_MIME", 0x2A7A, "POKEMON"),
+        ("MUK", 0x2A59, "POKEMON"),
+        ("MURKROW", 0x2AC6, "POKEMON"),
+        ("NATU", 0x2AB1, "POKEMON"),
+        ("NIDOKING", 0x2A22, "POKEMON"),
+        ("NIDOQUEEN", 0x2A1F, "POKEMON"),
+        ("NIDORAN_F", 0x2A1D, "POKEMON"),
+        ("NIDORAN_M", 0x2A20, "POKEMON"),
+        ("NIDORINA", 0x2A1E, "POKEMON"),
+        ("NIDORINO", 0x2A21, "POKEMON"),
+        ("NINETALES", 0x2A26, "POKEMON"),
+        ("NOCTOWL", 0x2AA4, "POKEMON"),
+        ("OCTILLERY", 0x2AE0, "POKEMON"),
+        ("ODDISH", 0x2A2B, "POKEMON"),
+        ("OMANYTE", 0x2A8A, "POKEMON"),
+        ("OMASTAR", 0x2A8B, "POKEMON"),
+        ("ONIX", 0x2A5F, "POKEMON"),
+        ("PARAS", 0x2A2E, "POKEMON"),
+        ("PARASECT", 0x2A2F, "POKEMON"),
+        ("PERSIAN", 0x2A35, "POKEMON"),
+        ("PHANPY", 0x2AE7, "POKEMON"),
+        ("PICHU", 0x2AAC, "POKEMON"),
+        ("PIDGEOT", 0x2A12, "POKEMON"),
+        ("PIDGEOTTO", 0x2A11, "POKEMON"),
+        ("PIDGEY", 0x2A10, "POKEMON"),
+        ("PIKACHU", 0x2A19, "POKEMON"),
+        ("PILOSWINE", 0x2ADD, "POKEMON"),
+        ("PINECO", 0x2ACC, "POKEMON"),
+        ("PINSIR", 0x2A7F, "POKEMON"),
+        ("POLITOED", 0x2ABA, "POKEMON"),
+        ("POLIWAG", 0x2A3C, "POKEMON"),
+        ("POLIWHIRL", 0x2A3D, "POKEMON"),
+        ("POLIWRATH", 0x2A3E, "POKEMON"),
+        ("PONYTA", 0x2A4D, "POKEMON"),
+        ("PORYGON", 0x2A89, "POKEMON"),
+        ("PORYGON2", 0x2AE9, "POKEMON"),
+        ("PRIMEAPE", 0x2A39, "POKEMON"),
+        ("PSYDUCK", 0x2A36, "POKEMON"),
+        ("PUPITAR", 0x2AF7, "POKEMON"),
+        ("QUAGSIRE", 0x2AC3, "POKEMON"),
+        ("QUILAVA", 0x2A9C, "POKEMON"),
+        ("QWILFISH", 0x2AD3, "POKEMON"),
+        ("RAICHU", 0x2A1A, "POKEMON"),
+        ("RAIKOU", 0x2AF3, "POKEMON"),
+        ("RAPIDASH", 0x2A4E, "POKEMON"),
+        ("RATICATE", 0x2A14, "POKEMON"),
+        ("RATTATA", 0x2A13, "POKEMON"),
+        ("REMORAID", 0x2ADF, "POKEMON"),
+        ("RHYDON", 0x2A70, "POKEMON"),
+        ("RHYHORN", 0x2A6F, "POKEMON"),
+        ("SANDSHREW", 0x2A1B, "POKEMON"),
+        ("SANDSLASH", 0x2A1C, "POKEMON"),
+        ("SCIZOR", 0x2AD4, "POKEMON"),
+        ("SCYTHER", 0x2A7B, "POKEMON"),
+        ("SEADRA", 0x2A75, "POKEMON"),
+        ("SEAKING", 0x2A77, "POKEMON"),
+        ("SEEL", 0x2A56, "POKEMON"),
+        ("SENTRET", 0x2AA1, "POKEMON"),
+        ("SHELLDER", 0x2A5A, "POKEMON"),
+        ("SHUCKLE", 0x2AD5, "POKEMON"),
+        ("SKARMORY", 0x2AE3, "POKEMON"),
+        ("SKIPLOOM", 0x2ABC, "POKEMON"),
+        ("SLOWBRO", 0x2A50, "POKEMON"),
+        ("SLOWKING", 0x2AC7, "POKEMON"),
+        ("SLOWPOKE", 0x2A4F, "POKEMON"),
+        ("SLUGMA", 0x2ADA, "POKEMON"),
+        ("SMEARGLE", 0x2AEB, "POKEMON"),
+        ("SMOOCHUM", 0x2AEE, "POKEMON"),
+        ("SNEASEL", 0x2AD7, "POKEMON"),
+        ("SNORLAX", 0x2A8F, "POKEMON"),
+        ("SNUBBULL", 0x2AD1, "POKEMON"),
+        ("SPEAROW", 0x2A15, "POKEMON"),
+        ("SPINARAK", 0x2AA7, "POKEMON"),
+        ("SQUIRTLE", 0x2A07, "POKEMON"),
+        ("STANTLER", 0x2AEA, "POKEMON"),
+        ("STARMIE", 0x2A79, "POKEMON"),
+        ("STARYU", 0x2A78, "POKEMON"),
+        ("STEELIX", 0x2AD0, "POKEMON"),
+        ("SUDOWOODO", 0x2AB9, "POKEMON"),
+        ("SUICUNE", 0x2AF5, "POKEMON"),
+        ("SUNFLORA", 0x2AC0, "POKEMON"),
+        ("SUNKERN", 0x2ABF, "POKEMON"),
+        ("SWINUB", 0x2ADC, "POKEMON"),
+        ("TANGELA", 0x2A72, "POKEMON"),
+        ("TAUROS", 0x2A80, "POKEMON"),
+        ("TEDDIURSA", 0x2AD8, "POKEMON"),
+        ("TENTACOOL", 0x2A48, "POKEMON"),
+        ("TENTACRUEL", 0x2A49, "POKEMON"),
+        ("TOGEPI", 0x2AAF, "POKEMON"),
+        ("TOGETIC", 0x2AB0, "POKEMON"),
+        ("TOTODILE", 0x2A9E, "POKEMON"),
+        ("TYPHLOSION", 0x2A9D, "POKEMON"),
+        ("TYRANITAR", 0x2AF8, "POKEMON"),
+        ("TYROGUE", 0x2AEC, "POKEMON"),
+        ("UMBREON", 0x2AC5, "POKEMON"),
+        ("UNOWN", 0x2AC9, "POKEMON"),
+        ("URSARING", 0x2AD9, "POKEMON"),
+        ("VAPOREON", 0x2A86, "POKEMON"),
+        ("VENOMOTH", 0x2A31, "POKEMON"),
+        ("VENONAT", 0x2A30, "POKEMON"),
+        ("VENUSAUR", 0x2A03, "POKEMON"),
+        ("VICTREEBEL", 0x2A47, "POKEMON"),
+        ("VILEPLUME", 0x2A2D, "POKEMON"),
+        ("VOLTORB", 0x2A64, "POKEMON"),
+        ("VULPIX", 0x2A25, "POKEMON"),
+        ("WARTORTLE", 0x2A08, "POKEMON"),
+        ("WEEDLE", 0x2A0D, "POKEMON"),
+        ("WEEPINBELL", 0x2A46, "POKEMON"),
+        ("WEEZING", 0x2A6E, "POKEMON"),
+        ("WIGGLYTUFF", 0x2A28, "POKEMON"),
+        ("WOBBUFFET", 0x2ACA, "POKEMON"),
+        ("WOOPER", 0x2AC2, "POKEMON"),
+        ("XATU", 0x2AB2, "POKEMON"),
+        ("YANMA", 0x2AC1, "POKEMON"),
+        ("ZAPDOS", 0x2A91, "POKEMON"),
+        ("ZUBAT", 0x2A29, "POKEMON"),
+    ],
+]
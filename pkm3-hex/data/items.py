@@ -1,461 +1,458 @@
-from collections import defaultdict
 from dataclasses import dataclass
 
 from .IndexedItem import IndexedItem
+from .IndexedTable import IndexedTable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item(IndexedItem):
     @property
     def is_glitch(self) -> bool:
         return self.name.startswith("Glitch item")
 
 
-items = defaultdict(
-    lambda: Item(index=0x01B8, name="Glitch item out of bounds"),
-    {
-        item.index: item
-        for item in (
-            Item(index=0x0000, name="Nothing"),
-            Item(index=0x0001, name="Master Ball"),
-            Item(index=0x0002, name="Ultra Ball"),
-            Item(index=0x0003, name="Great Ball"),
-            Item(index=0x0004, name="Poké Ball"),
-            Item(index=0x0005, name="Safari Ball"),
-            Item(index=0x0006, name="Net Ball"),
-            Item(index=0x0007, name="Dive Ball"),
-            Item(index=0x0008, name="Nest Ball"),
-            Item(index=0x0009, name="Repeat Ball"),
-            Item(index=0x000A, name="Timer Ball"),
-            Item(index=0x000B, name="Luxury Ball"),
-            Item(index=0x000C, name="Premier Ball"),
-            Item(index=0x000D, name="Potion"),
-            Item(index=0x000E, name="Antidote"),
-            Item(index=0x000F, name="Burn Heal"),
-            Item(index=0x0010, name="Ice Heal"),
-            Item(index=0x0011, name="Awakening"),
-            Item(index=0x0012, name="Parlyz Heal"),
-            Item(index=0x0013, name="Full Restore"),
-            Item(index=0x0014, name="Max Potion"),
-            Item(index=0x0015, name="Hyper Potion"),
-            Item(index=0x0016, name="Super Potion"),
-            Item(index=0x0017, name="Full Heal"),
-            Item(index=0x0018, name="Revive"),
-            Item(index=0x0019, name="Max Revive"),
-            Item(index=0x001A, name="Fresh Water"),
-            Item(index=0x001B, name="Soda Pop"),
-            Item(index=0x001C, name="Lemonade"),
-            Item(index=0x001D, name="Moomoo Milk"),
-            Item(index=0x001E, name="EnergyPowder"),
-            Item(index=0x001F, name="Energy Root"),
-            Item(index=0x0020, name="Heal Powder"),
-            Item(index=0x0021, name="Revival Herb"),
-            Item(index=0x0022, name="Ether"),
-            Item(index=0x0023, name="Max Ether"),
-            Item(index=0x0024, name="Elixir"),
-            Item(index=0x0025, name="Max Elixir"),
-            Item(index=0x0026, name="Lava Cookie"),
-            Item(index=0x0027, name="Blue Flute"),
-            Item(index=0x0028, name="Yellow Flute"),
-            Item(index=0x0029, name="Red Flute"),
-            Item(index=0x002A, name="Black Flute"),
-            Item(index=0x002B, name="White Flute"),
-            Item(index=0x002C, name="Berry Juice"),
-            Item(index=0x002D, name="Sacred Ash"),
-            Item(index=0x002E, name="Shoal Salt"),
-            Item(index=0x002F, name="Shoal Shell"),
-            Item(index=0x0030, name="Red Shard"),
-            Item(index=0x0031, name="Blue Shard"),
-            Item(index=0x0032, name="Yellow Shard"),
-            Item(index=0x0033, name="Green Shard"),
-            Item(index=0x0034, name="Glitch Item 0x0034"),
-            Item(index=0x0035, name="Glitch Item 0x0035"),
-            Item(index=0x0036, name="Glitch Item 0x0036"),
-            Item(index=0x0037, name="Glitch Item 0x0037"),
-            Item(index=0x0038, name="Glitch Item 0x0038"),
-            Item(index=0x0039, name="Glitch Item 0x0039"),
-            Item(index=0x003A, name="Glitch Item 0x003A"),
-            Item(index=0x003B, name="Glitch Item 0x003B"),
-            Item(index=0x003C, name="Glitch Item 0x003C"),
-            Item(index=0x003D, name="Glitch Item 0x003D"),
-            Item(index=0x003E, name="Glitch Item 0x003E"),
-            Item(index=0x003F, name="HP Up"),
-            Item(index=0x0040, name="Protein"),
-            Item(index=0x0041, name="Iron"),
-            Item(index=0x0042, name="Carbos"),
-            Item(index=0x0043, name="Calcium"),
-            Item(index=0x0044, name="Rare Candy"),
-            Item(index=0x0045, name="PP Up"),
-            Item(index=0x0046, name="Zinc"),
-            Item(index=0x0047, name="PP Max"),
-            Item(index=0x0048, name="Glitch Item 0x0048"),
-            Item(index=0x0049, name="Guard Spec."),
-            Item(index=0x004A, name="Dire Hit"),
-            Item(index=0x004B, name="X Attack"),
-            Item(index=0x004C, name="X Defend"),
-            Item(index=0x004D, name="X Speed"),
-            Item(index=0x004E, name="X Accuracy"),
-            Item(index=0x004F, name="X Special"),
-            Item(index=0x0050, name="Poké Doll"),
-            Item(index=0x0051, name="Fluffy Tail"),
-            Item(index=0x0052, name="Glitch Item 0x0052"),
-            Item(index=0x0053, name="Super Repel"),
-            Item(index=0x0054, name="Max Repel"),
-            Item(index=0x0055, name="Escape Rope"),
-            Item(index=0x0056, name="Repel"),
-            Item(index=0x0057, name="Glitch Item 0x0057"),
-            Item(index=0x0058, name="Glitch Item 0x0058"),
-            Item(index=0x0059, name="Glitch Item 0x0059"),
-            Item(index=0x005A, name="Glitch Item 0x005A"),
-            Item(index=0x005B, name="Glitch Item 0x005B"),
-            Item(index=0x005C, name="Glitch Item 0x005C"),
-            Item(index=0x005D, name="Sun Stone"),
-            Item(index=0x005E, name="Moon Stone"),
-            Item(index=0x005F, name="Fire Stone"),
-            Item(index=0x0060, name="Thunderstone"),
-            Item(index=0x0061, name="Water Stone"),
-            Item(index=0x0062, name="Leaf Stone"),
-            Item(index=0x0063, name="Glitch Item 0x0063"),
-            Item(index=0x0064, name="Glitch Item 0x0064"),
-            Item(index=0x0065, name="Glitch Item 0x0065"),
-            Item(index=0x0066, name="Glitch Item 0x0066"),
-            Item(index=0x0067, name="TinyMushroom"),
-            Item(index=0x0068, name="Big Mushroom"),
-            Item(index=0x0069, name="Glitch Item 0x0069"),
-            Item(index=0x006A, name="Pearl"),
-            Item(index=0x006B, name="Big Pearl"),
-            Item(index=0x006C, name="Stardust"),
-            Item(index=0x006D, name="Star Piece"),
-            Item(index=0x006E, name="Nugget"),
-            Item(index=0x006F, name="Heart Scale"),
-            Item(index=0x0070, name="Glitch Item 0x0070"),
-            Item(index=0x0071, name="Glitch Item 0x0071"),
-            Item(index=0x0072, name="Glitch Item 0x0072"),
-            Item(index=0x0073, name="Glitch Item 0x0073"),
-            Item(index=0x0074, name="Glitch Item 0x0074"),
-            Item(index=0x0075, name="Glitch Item 0x0075"),
-            Item(index=0x0076, name="Glitch Item 0x0076"),
-            Item(index=0x0077, name="Glitch Item 0x0077"),
-            Item(index=0x0078, name="Glitch Item 0x0078"),
-            Item(index=0x0079, name="Orange Mail"),
-            Item(index=0x007A, name="Harbor Mail"),
-            Item(index=0x007B, name="Glitter Mail"),
-            Item(index=0x007C, name="Mech Mail"),
-            Item(index=0x007D, name="Wood Mail"),
-            Item(index=0x007E, name="Wave Mail"),
-            Item(index=0x007F, name="Bead Mail"),
-            Item(index=0x0080, name="Shadow Mail"),
-            Item(index=0x0081, name="Tropic Mail"),
-            Item(index=0x0082, name="Dream Mail"),
-            Item(index=0x0083, name="Fab Mail"),
-            Item(index=0x0084, name="Retro Mail"),
-            Item(index=0x0085, name="Cheri Berry"),
-            Item(index=0x0086, name="Chesto Berry"),
-            Item(index=0x0087, name="Pecha Berry"),
-            Item(index=0x0088, name="Rawst Berry"),
-            Item(index=0x0089, name="Aspear Berry"),
-            Item(index=0x008A, name="Leppa Berry"),
-            Item(index=0x008B, name="Oran Berry"),
-            Item(index=0x008C, name="Persim Berry"),
-            Item(index=0x008D, name="Lum Berry"),
-            Item(index=0x008E, name="Sitrus Berry"),
-            Item(index=0x008F, name="Figy Berry"),
-            Item(index=0x0090, name="Wiki Berry"),
-            Item(index=0x0091, name="Mago Berry"),
-            Item(index=0x0092, name="Aguav Berry"),
-            Item(index=0x0093, name="Iapapa Berry"),
-            Item(index=0x0094, name="Razz Berry"),
-            Item(index=0x0095, name="Bluk Berry"),
-            Item(index=0x0096, name="Nanab Berry"),
-            Item(index=0x0097, name="Wepear Berry"),
-            Item(index=0x0098, name="Pinap Berry"),
-            Item(index=0x0099, name="Pomeg Berry"),
-            Item(index=0x009A, name="Kelpsy Berry"),
-            Item(index=0x009B, name="Qualot Berry"),
-            Item(index=0x009C, name="Hondew Berry"),
-            Item(index=0x009D, name="Grepa Berry"),
-            Item(index=0x009E, name="Tamato Berry"),
-            Item(index=0x009F, name="Cornn Berry"),
-            Item(index=0x00A0, name="Magost Berry"),
-            Item(index=0x00A1, name="Rabuta Berry"),
-            Item(index=0x00A2, name="Nomel Berry"),
-            Item(index=0x00A3, name="Spelon Berry"),
-            Item(index=0x00A4, name="Pamtre Berry"),
-            Item(index=0x00A5, name="Watmel Berry"),
-            Item(index=0x00A6, name="Durin Berry"),
-            Item(index=0x00A7, name="Belue Berry"),
-            Item(index=0x00A8, name="Liechi Berry"),
-            Item(index=0x00A9, name="Ganlon Berry"),
-            Item(index=0x00AA, name="Salac Berry"),
-            Item(index=0x00AB, name="Petaya Berry"),
-            Item(index=0x00AC, name="Apicot Berry"),
-            Item(index=0x00AD, name="Lansat Berry"),
-            Item(index=0x00AE, name="Starf Berry"),
-            Item(index=0x00AF, name="Enigma Berry"),
-            Item(index=0x00B0, name="Glitch Item 0x00B0"),
-            Item(index=0x00B1, name="Glitch Item 0x00B1"),
-            Item(index=0x00B2, name="Glitch Item 0x00B2"),
-            Item(index=0x00B3, name="BrightPowder"),
-            Item(index=0x00B4, name="White Herb"),
-            Item(index=0x00B5, name="Macho Brace"),
-            Item(index=0x00B6, name="Exp. Share"),
-            Item(index=0x00B7, name="Quick Claw"),
-            Item(index=0x00B8, name="Soothe Bell"),
-            Item(index=0x00B9, name="Mental Herb"),
-            Item(index=0x00BA, name="Choice Band"),
-            Item(index=0x00BB, name="King's Rock"),
-            Item(index=0x00BC, name="SilverPowder"),
-            Item(index=0x00BD, name="Amulet Coin"),
-            Item(index=0x00BE, name="Cleanse Tag"),
-            Item(index=0x00BF, name="Soul Dew"),
-            Item(index=0x00C0, name="DeepSeaTooth"),
-            Item(index=0x00C1, name="DeepSeaScale"),
-            Item(index=0x00C2, name="Smoke Ball"),
-            Item(index=0x00C3, name="Everstone"),
-            Item(index=0x00C4, name="Focus Band"),
-            Item(index=0x00C5, name="Lucky Egg"),
-            Item(index=0x00C6, name="Scope Lens"),
-            Item(index=0x00C7, name="Metal Coat"),
-            Item(index=0x00C8, name="Leftovers"),
-            Item(index=0x00C9, name="Dragon Scale"),
-            Item(index=0x00CA, name="Light Ball"),
-            Item(index=0x00CB, name="Soft Sand"),
-            Item(index=0x00CC, name="Hard Stone"),
-            Item(index=0x00CD, name="Miracle Seed"),
-            Item(index=0x00CE, name="BlackGlasses"),
-            Item(index=0x00CF, name="Black Belt"),
-            Item(index=0x00D0, name="Magnet"),
-            Item(index=0x00D1, name="Mystic Water"),
-            Item(index=0x00D2, name="Sharp Beak"),
-            Item(index=0x00D3, name="Poison Barb"),
-            Item(index=0x00D4, name="NeverMeltIce"),
-            Item(index=0x00D5, name="Spell Tag"),
-            Item(index=0x00D6, name="TwistedSpoon"),
-            Item(index=0x00D7, name="Charcoal"),
-            Item(index=0x00D8, name="Dragon Fang"),
-            Item(index=0x00D9, name="Silk Scarf"),
-            Item(index=0x00DA, name="Up-Grade"),
-            Item(index=0x00DB, name="Shell Bell"),
-            Item(index=0x00DC, name="Sea Incense"),
-            Item(index=0x00DD, name="Lax Incense"),
-            Item(index=0x00DE, name="Lucky Punch"),
-            Item(index=0x00DF, name="Metal Powder"),
-            Item(index=0x00E0, name="Thick Club"),
-            Item(index=0x00E1, name="Stick"),
-            Item(index=0x00E2, name="Glitch Item 0x00E2"),
-            Item(index=0x00E3, name="Glitch Item 0x00E3"),
-            Item(index=0x00E4, name="Glitch Item 0x00E4"),
-            Item(index=0x00E5, name="Glitch Item 0x00E5"),
-            Item(index=0x00E6, name="Glitch Item 0x00E6"),
-            Item(index=0x00E7, name="Glitch Item 0x00E7"),
-            Item(index=0x00E8, name="Glitch Item 0x00E8"),
-            Item(index=0x00E9, name="Glitch Item 0x00E9"),
-            Item(index=0x00EA, name="Glitch Item 0x00EA"),
-            Item(index=0x00EB, name="Glitch Item 0x00EB"),
-            Item(index=0x00EC, name="Glitch Item 0x00EC"),
-            Item(index=0x00ED, name="Glitch Item 0x00ED"),
-            Item(index=0x00EE, name="Glitch Item 0x00EE"),
-            Item(index=0x00EF, name="Glitch Item 0x00EF"),
-            Item(index=0x00F0, name="Glitch Item 0x00F0"),
-            Item(index=0x00F1, name="Glitch Item 0x00F1"),
-            Item(index=0x00F2, name="Glitch Item 0x00F2"),
-            Item(index=0x00F3, name="Glitch Item 0x00F3"),
-            Item(index=0x00F4, name="Glitch Item 0x00F4"),
-            Item(index=0x00F5, name="Glitch Item 0x00F5"),
-            Item(index=0x00F6, name="Glitch Item 0x00F6"),
-            Item(index=0x00F7, name="Glitch Item 0x00F7"),
-            Item(index=0x00F8, name="Glitch Item 0x00F8"),
-            Item(index=0x00F9, name="Glitch Item 0x00F9"),
-            Item(index=0x00FA, name="Glitch Item 0x00FA"),
-            Item(index=0x00FB, name="Glitch Item 0x00FB"),
-            Item(index=0x00FC, name="Glitch Item 0x00FC"),
-            Item(index=0x00FD, name="Glitch Item 0x00FD"),
-            Item(index=0x00FE, name="Red Scarf"),
-            Item(index=0x00FF, name="Blue Scarf"),
-            Item(index=0x0100, name="Pink Scarf"),
-            Item(index=0x0101, name="Green Scarf"),
-            Item(index=0x0102, name="Yellow Scarf"),
-            Item(index=0x0103, name="Mach Bike"),
-            Item(index=0x0104, name="Coin Case"),
-            Item(index=0x0105, name="Itemfinder"),
-            Item(index=0x0106, name="Old Rod"),
-            Item(index=0x0107, name="Good Rod"),
-            Item(index=0x0108, name="Super Rod"),
-            Item(index=0x0109, name="S.S. Ticket"),
-            Item(index=0x010A, name="Contest Pass"),
-            Item(index=0x010B, name="Glitch Item 0x010B"),
-            Item(index=0x010C, name="Wailmer Pail"),
-            Item(index=0x010D, name="Devon Goods"),
-            Item(index=0x010E, name="Soot Sack"),
-            Item(index=0x010F, name="Basement Key"),
-            Item(index=0x0110, name="Acro Bike"),
-            Item(index=0x0111, name="Pokéblock Case"),
-            Item(index=0x0112, name="Letter"),
-            Item(index=0x0113, name="Eon Ticket"),
-            Item(index=0x0114, name="Red Orb"),
-            Item(index=0x0115, name="Blue Orb"),
-            Item(index=0x0116, name="Scanner"),
-            Item(index=0x0117, name="Go-Goggles"),
-            Item(index=0x0118, name="Meteorite"),
-            Item(index=0x0119, name="Rm. 1 Key"),
-            Item(index=0x011A, name="Rm. 2 Key"),
-            Item(index=0x011B, name="Rm. 4 Key"),
-            Item(index=0x011C, name="Rm. 6 Key"),
-            Item(index=0x011D, name="Storage Key"),
-            Item(index=0x011E, name="Root Fossil"),
-            Item(index=0x011F, name="Claw Fossil"),
-            Item(index=0x0120, name="Devon Scope"),
-            Item(index=0x0121, name="TM01"),
-            Item(index=0x0122, name="TM02"),
-            Item(index=0x0123, name="TM03"),
-            Item(index=0x0124, name="TM04"),
-            Item(index=0x0125, name="TM05"),
-            Item(index=0x0126, name="TM06"),
-            Item(index=0x0127, name="TM07"),
-            Item(index=0x0128, name="TM08"),
-            Item(index=0x0129, name="TM09"),
-            Item(index=0x012A, name="TM10"),
-            Item(index=0x012B, name="TM11"),
-            Item(index=0x012C, name="TM12"),
-            Item(index=0x012D, name="TM13"),
-            Item(index=0x012E, name="TM14"),
-            Item(index=0x012F, name="TM15"),
-            Item(index=0x0130, name="TM16"),
-            Item(index=0x0131, name="TM17"),
-            Item(index=0x0132, name="TM18"),
-            Item(index=0x0133, name="TM19"),
-            Item(index=0x0134, name="TM20"),
-            Item(index=0x0135, name="TM21"),
-            Item(index=0x0136, name="TM22"),
-            Item(index=0x0137, name="TM23"),
-            Item(index=0x0138, name="TM24"),
-            Item(index=0x0139, name="TM25"),
-            Item(index=0x013A, name="TM26"),
-            Item(index=0x013B, name="TM27"),
-            Item(index=0x013C, name="TM28"),
-            Item(index=0x013D, name="TM29"),
-            Item(index=0x013E, name="TM30"),
-            Item(index=0x013F, name="TM31"),
-            Item(index=0x0140, name="TM32"),
-            Item(index=0x0141, name="TM33"),
-            Item(index=0x0142, name="TM34"),
-            Item(index=0x0143, name="TM35"),
-            Item(index=0x0144, name="TM36"),
-            Item(index=0x0145, name="TM37"),
-            Item(index=0x0146, name="TM38"),
-            Item(index=0x0147, name="TM39"),
-            Item(index=0x0148, name="TM40"),
-            Item(index=0x0149, name="TM41"),
-            Item(index=0x014A, name="TM42"),
-            Item(index=0x014B, name="TM43"),
-            Item(index=0x014C, name="TM44"),
-            Item(index=0x014D, name="TM45"),
-            Item(index=0x014E, name="TM46"),
-            Item(index=0x014F, name="TM47"),
-            Item(index=0x0150, name="TM48"),
-            Item(index=0x0151, name="TM49"),
-            Item(index=0x0152, name="TM50"),
-            Item(index=0x0153, name="HM01"),
-            Item(index=0x0154, name="HM02"),
-            Item(index=0x0155, name="HM03"),
-            Item(index=0x0156, name="HM04"),
-            Item(index=0x0157, name="HM05"),
-            Item(index=0x0158, name="HM06"),
-            Item(index=0x0159, name="HM07"),
-            Item(index=0x015A, name="HM08"),
-            Item(index=0x015B, name="Glitch Item 0x015B"),
-            Item(index=0x015C, name="Glitch Item 0x015C"),
-            Item(index=0x015D, name="Oak's Parcel*"),
-            Item(index=0x015E, name="Poké Flute*"),
-            Item(index=0x015F, name="Secret Key*"),
-            Item(index=0x0160, name="Bike Voucher*"),
-            Item(index=0x0161, name="Gold Teeth*"),
-            Item(index=0x0162, name="Old Amber*"),
-            Item(index=0x0163, name="Card Key*"),
-            Item(index=0x0164, name="Lift Key*"),
-            Item(index=0x0165, name="Helix Fossil*"),
-            Item(index=0x0166, name="Dome Fossil*"),
-            Item(index=0x0167, name="Silph Scope*"),
-            Item(index=0x0168, name="Bicycle*"),
-            Item(index=0x0169, name="Town Map*"),
-            Item(index=0x016A, name="VS Seeker*"),
-            Item(index=0x016B, name="Fame Checker*"),
-            Item(index=0x016C, name="TM Case*"),
-            Item(index=0x016D, name="Berry Pouch*"),
-            Item(index=0x016E, name="Teachy TV*"),
-            Item(index=0x016F, name="Tri-Pass*"),
-            Item(index=0x0170, name="Rainbow Pass*"),
-            Item(index=0x0171, name="Tea*"),
-            Item(index=0x0172, name="MysticTicket*"),
-            Item(index=0x0173, name="AuroraTicket*"),
-            Item(index=0x0174, name="Powder Jar*"),
-            Item(index=0x0175, name="Ruby*"),
-            Item(index=0x0176, name="Sapphire*"),
-            Item(index=0x0177, name="Magma Emblem*"),
-            Item(index=0x0178, name="Old Sea Map*"),
-            Item(index=0x0179, name="Glitch Item 0x0179"),
-            Item(index=0x017A, name="Glitch Item 0x017A"),
-            Item(index=0x017B, name="Glitch Item 0x017B"),
-            Item(index=0x017C, name="Glitch Item 0x017C"),
-            Item(index=0x017D, name="Glitch Item 0x017D"),
-            Item(index=0x017E, name="Glitch Item 0x017E"),
-            Item(index=0x017F, name="Glitch Item 0x017F"),
-            Item(index=0x0180, name="Glitch Item 0x0180"),
-            Item(index=0x0181, name="Glitch Item 0x0181"),
-            Item(index=0x0182, name="Glitch Item 0x0182"),
-            Item(index=0x0183, name="Glitch Item 0x0183"),
-            Item(index=0x0184, name="Glitch Item 0x0184"),
-            Item(index=0x0185, name="Glitch Item 0x0185"),
-            Item(index=0x0186, name="Glitch Item 0x0186"),
-            Item(index=0x0187, name="Glitch Item 0x0187"),
-            Item(index=0x0188, name="Glitch Item 0x0188"),
-            Item(index=0x0189, name="Glitch Item 0x0189"),
-            Item(index=0x018A, name="Glitch Item 0x018A"),
-            Item(index=0x018B, name="Glitch Item 0x018B"),
-            Item(index=0x018C, name="Glitch Item 0x018C"),
-            Item(index=0x018D, name="Glitch Item 0x018D"),
-            Item(index=0x018E, name="Glitch Item 0x018E"),
-            Item(index=0x018F, name="Glitch Item 0x018F"),
-            Item(index=0x0190, name="Glitch Item 0x0190"),
-            Item(index=0x0191, name="Glitch Item 0x0191"),
-            Item(index=0x0192, name="Glitch Item 0x0192"),
-            Item(index=0x0193, name="Glitch Item 0x0193"),
-            Item(index=0x0194, name="Glitch Item 0x0194"),
-            Item(index=0x0195, name="Glitch Item 0x0195"),
-            Item(index=0x0196, name="Glitch Item 0x0196"),
-            Item(index=0x0197, name="Glitch Item 0x0197"),
-            Item(index=0x0198, name="Glitch Item 0x0198"),
-            Item(index=0x0199, name="Glitch Item 0x0199"),
-            Item(index=0x019A, name="Glitch Item 0x019A"),
-            Item(index=0x019B, name="Glitch Item 0x019B"),
-            Item(index=0x019C, name="Glitch Item 0x019C"),
-            Item(index=0x019D, name="Glitch Item 0x019D"),
-            Item(index=0x019E, name="Glitch Item 0x019E"),
-            Item(index=0x019F, name="Glitch Item 0x019F"),
-            Item(index=0x01A0, name="Glitch Item 0x01A0"),
-            Item(index=0x01A1, name="Glitch Item 0x01A1"),
-            Item(index=0x01A2, name="Glitch Item 0x01A2"),
-            Item(index=0x01A3, name="Glitch Item 0x01A3"),
-            Item(index=0x01A4, name="Glitch Item 0x01A4"),
-            Item(index=0x01A5, name="Glitch Item 0x01A5"),
-            Item(index=0x01A6, name="Glitch Item 0x01A6"),
-            Item(index=0x01A7, name="Glitch Item 0x01A7"),
-            Item(index=0x01A8, name="Glitch Item 0x01A8"),
-            Item(index=0x01A9, name="Glitch Item 0x01A9"),
-            Item(index=0x01AA, name="Glitch Item 0x01AA"),
-            Item(index=0x01AB, name="Glitch Item 0x01AB"),
-            Item(index=0x01AC, name="Glitch Item 0x01AC"),
-            Item(index=0x01AD, name="Glitch Item 0x01AD"),
-            Item(index=0x01AE, name="Glitch Item 0x01AE"),
-            Item(index=0x01AF, name="Glitch Item 0x01AF"),
-            Item(index=0x01B0, name="Glitch Item 0x01B0"),
-            Item(index=0x01B1, name="Glitch Item 0x01B1"),
-            Item(index=0x01B2, name="Glitch Item 0x01B2"),
-            Item(index=0x01B3, name="Glitch Item 0x01B3"),
-            Item(index=0x01B4, name="Glitch Item 0x01B4"),
-            Item(index=0x01B5, name="Glitch Item 0x01B5"),
-            Item(index=0x01B6, name="Glitch Item 0x01B6"),
-            Item(index=0x01B7, name="Glitch Item 0x01B7"),
-        )
-    },
+items = IndexedTable(
+    glitch=Item(index=0x01B8, name="Glitch item out of bounds"),
+    items=lambda: (
+        Item(index=0x0000, name="Nothing"),
+        Item(index=0x0001, name="Master Ball"),
+        Item(index=0x0002, name="Ultra Ball"),
+        Item(index=0x0003, name="Great Ball"),
+        Item(index=0x0004, name="Poké Ball"),
+        Item(index=0x0005, name="Safari Ball"),
+        Item(index=0x0006, name="Net Ball"),
+        Item(index=0x0007, name="Dive Ball"),
+        Item(index=0x0008, name="Nest Ball"),
+        Item(index=0x0009, name="Repeat Ball"),
+        Item(index=0x000A, name="Timer Ball"),
+        Item(index=0x000B, name="Luxury Ball"),
+        Item(index=0x000C, name="Premier Ball"),
+        Item(index=0x000D, name="Potion"),
+        Item(index=0x000E, name="Antidote"),
+        Item(index=0x000F, name="Burn Heal"),
+        Item(index=0x0010, name="Ice Heal"),
+        Item(index=0x0011, name="Awakening"),
+        Item(index=0x0012, name="Parlyz Heal"),
+        Item(index=0x0013, name="Full Restore"),
+        Item(index=0x0014, name="Max Potion"),
+        Item(index=0x0015, name="Hyper Potion"),
+        Item(index=0x0016, name="Super Potion"),
+        Item(index=0x0017, name="Full Heal"),
+        Item(index=0x0018, name="Revive"),
+        Item(index=0x0019, name="Max Revive"),
+        Item(index=0x001A, name="Fresh Water"),
+        Item(index=0x001B, name="Soda Pop"),
+        Item(index=0x001C, name="Lemonade"),
+        Item(index=0x001D, name="Moomoo Milk"),
+        Item(index=0x001E, name="EnergyPowder"),
+        Item(index=0x001F, name="Energy Root"),
+        Item(index=0x0020, name="Heal Powder"),
+        Item(index=0x0021, name="Revival Herb"),
+        Item(index=0x0022, name="Ether"),
+        Item(index=0x0023, name="Max Ether"),
+        Item(index=0x0024, name="Elixir"),
+        Item(index=0x0025, name="Max Elixir"),
+        Item(index=0x0026, name="Lava Cookie"),
+        Item(index=0x0027, name="Blue Flute"),
+        Item(index=0x0028, name="Yellow Flute"),
+        Item(index=0x0029, name="Red Flute"),
+        Item(index=0x002A, name="Black Flute"),
+        Item(index=0x002B, name="White Flute"),
+        Item(index=0x002C, name="Berry Juice"),
+        Item(index=0x002D, name="Sacred Ash"),
+        Item(index=0x002E, name="Shoal Salt"),
+        Item(index=0x002F, name="Shoal Shell"),
+        Item(index=0x0030, name="Red Shard"),
+        Item(index=0x0031, name="Blue Shard"),
+        Item(index=0x0032, name="Yellow Shard"),
+        Item(index=0x0033, name="Green Shard"),
+        Item(index=0x0034, name="Glitch Item 0x0034"),
+        Item(index=0x0035, name="Glitch Item 0x0035"),
+        Item(index=0x0036, name="Glitch Item 0x0036"),
+        Item(index=0x0037, name="Glitch Item 0x0037"),
+        Item(index=0x0038, name="Glitch Item 0x0038"),
+        Item(index=0x0039, name="Glitch Item 0x0039"),
+        Item(index=0x003A, name="Glitch Item 0x003A"),
+        Item(index=0x003B, name="Glitch Item 0x003B"),
+        Item(index=0x003C, name="Glitch Item 0x003C"),
+        Item(index=0x003D, name="Glitch Item 0x003D"),
+        Item(index=0x003E, name="Glitch Item 0x003E"),
+        Item(index=0x003F, name="HP Up"),
+        Item(index=0x0040, name="Protein"),
+        Item(index=0x0041, name="Iron"),
+        Item(index=0x0042, name="Carbos"),
+        Item(index=0x0043, name="Calcium"),
+        Item(index=0x0044, name="Rare Candy"),
+        Item(index=0x0045, name="PP Up"),
+        Item(index=0x0046, name="Zinc"),
+        Item(index=0x0047, name="PP Max"),
+        Item(index=0x0048, name="Glitch Item 0x0048"),
+        Item(index=0x0049, name="Guard Spec."),
+        Item(index=0x004A, name="Dire Hit"),
+        Item(index=0x004B, name="X Attack"),
+        Item(index=0x004C, name="X Defend"),
+        Item(index=0x004D, name="X Speed"),
+        Item(index=0x004E, name="X Accuracy"),
+        Item(index=0x004F, name="X Special"),
+        Item(index=0x0050, name="Poké Doll"),
+        Item(index=0x0051, name="Fluffy Tail"),
+        Item(index=0x0052, name="Glitch Item 0x0052"),
+        Item(index=0x0053, name="Super Repel"),
+        Item(index=0x0054, name="Max Repel"),
+        Item(index=0x0055, name="Escape Rope"),
+        Item(index=0x0056, name="Repel"),
+        Item(index=0x0057, name="Glitch Item 0x0057"),
+        Item(index=0x0058, name="Glitch Item 0x0058"),
+        Item(index=0x0059, name="Glitch Item 0x0059"),
+        Item(index=0x005A, name="Glitch Item 0x005A"),
+        Item(index=0x005B, name="Glitch Item 0x005B"),
+        Item(index=0x005C, name="Glitch Item 0x005C"),
+        Item(index=0x005D, name="Sun Stone"),
+        Item(index=0x005E, name="Moon Stone"),
+        Item(index=0x005F, name="Fire Stone"),
+        Item(index=0x0060, name="Thunderstone"),
+        Item(index=0x0061, name="Water Stone"),
+        Item(index=0x0062, name="Leaf Stone"),
+        Item(index=0x0063, name="Glitch Item 0x0063"),
+        Item(index=0x0064, name="Glitch Item 0x0064"),
+        Item(index=0x0065, name="Glitch Item 0x0065"),
+        Item(index=0x0066, name="Glitch Item 0x0066"),
+        Item(index=0x0067, name="TinyMushroom"),
+        Item(index=0x0068, name="Big Mushroom"),
+        Item(index=0x0069, name="Glitch Item 0x0069"),
+        Item(index=0x006A, name="Pearl"),
+        Item(index=0x006B, name="Big Pearl"),
+        Item(index=0x006C, name="Stardust"),
+        Item(index=0x006D, name="Star Piece"),
+        Item(index=0x006E, name="Nugget"),
+        Item(index=0x006F, name="Heart Scale"),
+        Item(index=0x0070, name="Glitch Item 0x0070"),
+        Item(index=0x0071, name="Glitch Item 0x0071"),
+        Item(index=0x0072, name="Glitch Item 0x0072"),
+        Item(index=0x0073, name="Glitch Item 0x0073"),
+        Item(index=0x0074, name="Glitch Item 0x0074"),
+        Item(index=0x0075, name="Glitch Item 0x0075"),
+        Item(index=0x0076, name="Glitch Item 0x0076"),
+        Item(index=0x0077, name="Glitch Item 0x0077"),
+        Item(index=0x0078, name="Glitch Item 0x0078"),
+        Item(index=0x0079, name="Orange Mail"),
+        Item(index=0x007A, name="Harbor Mail"),
+        Item(index=0x007B, name="Glitter Mail"),
+        Item(index=0x007C, name="Mech Mail"),
+        Item(index=0x007D, name="Wood Mail"),
+        Item(index=0x007E, name="Wave Mail"),
+        Item(index=0x007F, name="Bead Mail"),
+        Item(index=0x0080, name="Shadow Mail"),
+        Item(index=0x0081, name="Tropic Mail"),
+        Item(index=0x0082, name="Dream Mail"),
+        Item(index=0x0083, name="Fab Mail"),
+        Item(index=0x0084, name="Retro Mail"),
+        Item(index=0x0085, name="Cheri Berry"),
+        Item(index=0x0086, name="Chesto Berry"),
+        Item(index=0x0087, name="Pecha Berry"),
+        Item(index=0x0088, name="Rawst Berry"),
+        Item(index=0x0089, name="Aspear Berry"),
+        Item(index=0x008A, name="Leppa Berry"),
+        Item(index=0x008B, name="Oran Berry"),
+        Item(index=0x008C, name="Persim Berry"),
+        Item(index=0x008D, name="Lum Berry"),
+        Item(index=0x008E, name="Sitrus Berry"),
+        Item(index=0x008F, name="Figy Berry"),
+        Item(index=0x0090, name="Wiki Berry"),
+        Item(index=0x0091, name="Mago Berry"),
+        Item(index=0x0092, name="Aguav Berry"),
+        Item(index=0x0093, name="Iapapa Berry"),
+        Item(index=0x0094, name="Razz Berry"),
+        Item(index=0x0095, name="Bluk Berry"),
+        Item(index=0x0096, name="Nanab Berry"),
+        Item(index=0x0097, name="Wepear Berry"),
+        Item(index=0x0098, name="Pinap Berry"),
+        Item(index=0x0099, name="Pomeg Berry"),
+        Item(index=0x009A, name="Kelpsy Berry"),
+        Item(index=0x009B, name="Qualot Berry"),
+        Item(index=0x009C, name="Hondew Berry"),
+        Item(index=0x009D, name="Grepa Berry"),
+        Item(index=0x009E, name="Tamato Berry"),
+        Item(index=0x009F, name="Cornn Berry"),
+        Item(index=0x00A0, name="Magost Berry"),
+        Item(index=0x00A1, name="Rabuta Berry"),
+        Item(index=0x00A2, name="Nomel Berry"),
+        Item(index=0x00A3, name="Spelon Berry"),
+        Item(index=0x00A4, name="Pamtre Berry"),
+        Item(index=0x00A5, name="Watmel Berry"),
+        Item(index=0x00A6, name="Durin Berry"),
+        Item(index=0x00A7, name="Belue Berry"),
+        Item(index=0x00A8, name="Liechi Berry"),
+        Item(index=0x00A9, name="Ganlon Berry"),
+        Item(index=0x00AA, name="Salac Berry"),
+        Item(index=0x00AB, name="Petaya Berry"),
+        Item(index=0x00AC, name="Apicot Berry"),
+        Item(index=0x00AD, name="Lansat Berry"),
+        Item(index=0x00AE, name="Starf Berry"),
+        Item(index=0x00AF, name="Enigma Berry"),
+        Item(index=0x00B0, name="Glitch Item 0x00B0"),
+        Item(index=0x00B1, name="Glitch Item 0x00B1"),
+        Item(index=0x00B2, name="Glitch Item 0x00B2"),
+        Item(index=0x00B3, name="BrightPowder"),
+        Item(index=0x00B4, name="White Herb"),
+        Item(index=0x00B5, name="Macho Brace"),
+        Item(index=0x00B6, name="Exp. Share"),
+        Item(index=0x00B7, name="Quick Claw"),
+        Item(index=0x00B8, name="Soothe Bell"),
+        Item(index=0x00B9, name="Mental Herb"),
+        Item(index=0x00BA, name="Choice Band"),
+        Item(index=0x00BB, name="King's Rock"),
+        Item(index=0x00BC, name="SilverPowder"),
+        Item(index=0x00BD, name="Amulet Coin"),
+        Item(index=0x00BE, name="Cleanse Tag"),
+        Item(index=0x00BF, name="Soul Dew"),
+        Item(index=0x00C0, name="DeepSeaTooth"),
+        Item(index=0x00C1, name="DeepSeaScale"),
+        Item(index=0x00C2, name="Smoke Ball"),
+        Item(index=0x00C3, name="Everstone"),
+        Item(index=0x00C4, name="Focus Band"),
+        Item(index=0x00C5, name="Lucky Egg"),
+        Item(index=0x00C6, name="Scope Lens"),
+        Item(index=0x00C7, name="Metal Coat"),
+        Item(index=0x00C8, name="Leftovers"),
+        Item(index=0x00C9, name="Dragon Scale"),
+        Item(index=0x00CA, name="Light Ball"),
+        Item(index=0x00CB, name="Soft Sand"),
+        Item(index=0x00CC, name="Hard Stone"),
+        Item(index=0x00CD, name="Miracle Seed"),
+        Item(index=0x00CE, name="BlackGlasses"),
+        Item(index=0x00CF, name="Black Belt"),
+        Item(index=0x00D0, name="Magnet"),
+        Item(index=0x00D1, name="Mystic Water"),
+        Item(index=0x00D2, name="Sharp Beak"),
+        Item(index=0x00D3, name="Poison Barb"),
+        Item(index=0x00D4, name="NeverMeltIce"),
+        Item(index=0x00D5, name="Spell Tag"),
+        Item(index=0x00D6, name="TwistedSpoon"),
+        Item(index=0x00D7, name="Charcoal"),
+        Item(index=0x00D8, name="Dragon Fang"),
+        Item(index=0x00D9, name="Silk Scarf"),
+        Item(index=0x00DA, name="Up-Grade"),
+        Item(index=0x00DB, name="Shell Bell"),
+        Item(index=0x00DC, name="Sea Incense"),
+        Item(index=0x00DD, name="Lax Incense"),
+        Item(index=0x00DE, name="Lucky Punch"),
+        Item(index=0x00DF, name="Metal Powder"),
+        Item(index=0x00E0, name="Thick Club"),
+        Item(index=0x00E1, name="Stick"),
+        Item(index=0x00E2, name="Glitch Item 0x00E2"),
+        Item(index=0x00E3, name="Glitch Item 0x00E3"),
+        Item(index=0x00E4, name="Glitch Item 0x00E4"),
+        Item(index=0x00E5, name="Glitch Item 0x00E5"),
+        Item(index=0x00E6, name="Glitch Item 0x00E6"),
+        Item(index=0x00E7, name="Glitch Item 0x00E7"),
+        Item(index=0x00E8, name="Glitch Item 0x00E8"),
+        Item(index=0x00E9, name="Glitch Item 0x00E9"),
+        Item(index=0x00EA, name="Glitch Item 0x00EA"),
+        Item(index=0x00EB, name="Glitch Item 0x00EB"),
+        Item(index=0x00EC, name="Glitch Item 0x00EC"),
+        Item(index=0x00ED, name="Glitch Item 0x00ED"),
+        Item(index=0x00EE, name="Glitch Item 0x00EE"),
+        Item(index=0x00EF, name="Glitch Item 0x00EF"),
+        Item(index=0x00F0, name="Glitch Item 0x00F0"),
+        Item(index=0x00F1, name="Glitch Item 0x00F1"),
+        Item(index=0x00F2, name="Glitch Item 0x00F2"),
+        Item(index=0x00F3, name="Glitch Item 0x00F3"),
+        Item(index=0x00F4, name="Glitch Item 0x00F4"),
+        Item(index=0x00F5, name="Glitch Item 0x00F5"),
+        Item(index=0x00F6, name="Glitch Item 0x00F6"),
+        Item(index=0x00F7, name="Glitch Item 0x00F7"),
+        Item(index=0x00F8, name="Glitch Item 0x00F8"),
+        Item(index=0x00F9, name="Glitch Item 0x00F9"),
+        Item(index=0x00FA, name="Glitch Item 0x00FA"),
+        Item(index=0x00FB, name="Glitch Item 0x00FB"),
+        Item(index=0x00FC, name="Glitch Item 0x00FC"),
+        Item(index=0x00FD, name="Glitch Item 0x00FD"),
+        Item(index=0x00FE, name="Red Scarf"),
+        Item(index=0x00FF, name="Blue Scarf"),
+        Item(index=0x0100, name="Pink Scarf"),
+        Item(index=0x0101, name="Green Scarf"),
+        Item(index=0x0102, name="Yellow Scarf"),
+        Item(index=0x0103, name="Mach Bike"),
+        Item(index=0x0104, name="Coin Case"),
+        Item(index=0x0105, name="Itemfinder"),
+        Item(index=0x0106, name="Old Rod"),
+        Item(index=0x0107, name="Good Rod"),
+        Item(index=0x0108, name="Super Rod"),
+        Item(index=0x0109, name="S.S. Ticket"),
+        Item(index=0x010A, name="Contest Pass"),
+        Item(index=0x010B, name="Glitch Item 0x010B"),
+        Item(index=0x010C, name="Wailmer Pail"),
+        Item(index=0x010D, name="Devon Goods"),
+        Item(index=0x010E, name="Soot Sack"),
+        Item(index=0x010F, name="Basement Key"),
+        Item(index=0x0110, name="Acro Bike"),
+        Item(index=0x0111, name="Pokéblock Case"),
+        Item(index=0x0112, name="Letter"),
+        Item(index=0x0113, name="Eon Ticket"),
+        Item(index=0x0114, name="Red Orb"),
+        Item(index=0x0115, name="Blue Orb"),
+        Item(index=0x0116, name="Scanner"),
+        Item(index=0x0117, name="Go-Goggles"),
+        Item(index=0x0118, name="Meteorite"),
+        Item(index=0x0119, name="Rm. 1 Key"),
+        Item(index=0x011A, name="Rm. 2 Key"),
+        Item(index=0x011B, name="Rm. 4 Key"),
+        Item(index=0x011C, name="Rm. 6 Key"),
+        Item(index=0x011D, name="Storage Key"),
+        Item(index=0x011E, name="Root Fossil"),
+        Item(index=0x011F, name="Claw Fossil"),
+        Item(index=0x0120, name="Devon Scope"),
+        Item(index=0x0121, name="TM01"),
+        Item(index=0x0122, name="TM02"),
+        Item(index=0x0123, name="TM03"),
+        Item(index=0x0124, name="TM04"),
+        Item(index=0x0125, name="TM05"),
+        Item(index=0x0126, name="TM06"),
+        Item(index=0x0127, name="TM07"),
+        Item(index=0x0128, name="TM08"),
+        Item(index=0x0129, name="TM09"),
+        Item(index=0x012A, name="TM10"),
+        Item(index=0x012B, name="TM11"),
+        Item(index=0x012C, name="TM12"),
+        Item(index=0x012D, name="TM13"),
+        Item(index=0x012E, name="TM14"),
+        Item(index=0x012F, name="TM15"),
+        Item(index=0x0130, name="TM16"),
+        Item(index=0x0131, name="TM17"),
+        Item(index=0x0132, name="TM18"),
+        Item(index=0x0133, name="TM19"),
+        Item(index=0x0134, name="TM20"),
+        Item(index=0x0135, name="TM21"),
+        Item(index=0x0136, name="TM22"),
+        Item(index=0x0137, name="TM23"),
+        Item(index=0x0138, name="TM24"),
+        Item(index=0x0139, name="TM25"),
+        Item(index=0x013A, name="TM26"),
+        Item(index=0x013B, name="TM27"),
+        Item(index=0x013C, name="TM28"),
+        Item(index=0x013D, name="TM29"),
+        Item(index=0x013E, name="TM30"),
+        Item(index=0x013F, name="TM31"),
+        Item(index=0x0140, name="TM32"),
+        Item(index=0x0141, name="TM33"),
+        Item(index=0x0142, name="TM34"),
+        Item(index=0x0143, name="TM35"),
+        Item(index=0x0144, name="TM36"),
+        Item(index=0x0145, name="TM37"),
+        Item(index=0x0146, name="TM38"),
+        Item(index=0x0147, name="TM39"),
+        Item(index=0x0148, name="TM40"),
+        Item(index=0x0149, name="TM41"),
+        Item(index=0x014A, name="TM42"),
+        Item(index=0x014B, name="TM43"),
+        Item(index=0x014C, name="TM44"),
+        Item(index=0x014D, name="TM45"),
+        Item(index=0x014E, name="TM46"),
+        Item(index=0x014F, name="TM47"),
+        Item(index=0x0150, name="TM48"),
+        Item(index=0x0151, name="TM49"),
+        Item(index=0x0152, name="TM50"),
+        Item(index=0x0153, name="HM01"),
+        Item(index=0x0154, name="HM02"),
+        Item(index=0x0155, name="HM03"),
+        Item(index=0x0156, name="HM04"),
+        Item(index=0x0157, name="HM05"),
+        Item(index=0x0158, name="HM06"),
+        Item(index=0x0159, name="HM07"),
+        Item(index=0x015A, name="HM08"),
+        Item(index=0x015B, name="Glitch Item 0x015B"),
+        Item(index=0x015C, name="Glitch Item 0x015C"),
+        Item(index=0x015D, name="Oak's Parcel*"),
+        Item(index=0x015E, name="Poké Flute*"),
+        Item(index=0x015F, name="Secret Key*"),
+        Item(index=0x0160, name="Bike Voucher*"),
+        Item(index=0x0161, name="Gold Teeth*"),
+        Item(index=0x0162, name="Old Amber*"),
+        Item(index=0x0163, name="Card Key*"),
+        Item(index=0x0164, name="Lift Key*"),
+        Item(index=0x0165, name="Helix Fossil*"),
+        Item(index=0x0166, name="Dome Fossil*"),
+        Item(index=0x0167, name="Silph Scope*"),
+        Item(index=0x0168, name="Bicycle*"),
+        Item(index=0x0169, name="Town Map*"),
+        Item(index=0x016A, name="VS Seeker*"),
+        Item(index=0x016B, name="Fame Checker*"),
+        Item(index=0x016C, name="TM Case*"),
+        Item(index=0x016D, name="Berry Pouch*"),
+        Item(index=0x016E, name="Teachy TV*"),
+        Item(index=0x016F, name="Tri-Pass*"),
+        Item(index=0x0170, name="Rainbow Pass*"),
+        Item(index=0x0171, name="Tea*"),
+        Item(index=0x0172, name="MysticTicket*"),
+        Item(index=0x0173, name="AuroraTicket*"),
+        Item(index=0x0174, name="Powder Jar*"),
+        Item(index=0x0175, name="Ruby*"),
+        Item(index=0x0176, name="Sapphire*"),
+        Item(index=0x0177, name="Magma Emblem*"),
+        Item(index=0x0178, name="Old Sea Map*"),
+        Item(index=0x0179, name="Glitch Item 0x0179"),
+        Item(index=0x017A, name="Glitch Item 0x017A"),
+        Item(index=0x017B, name="Glitch Item 0x017B"),
+        Item(index=0x017C, name="Glitch Item 0x017C"),
+        Item(index=0x017D, name="Glitch Item 0x017D"),
+        Item(index=0x017E, name="Glitch Item 0x017E"),
+        Item(index=0x017F, name="Glitch Item 0x017F"),
+        Item(index=0x0180, name="Glitch Item 0x0180"),
+        Item(index=0x0181, name="Glitch Item 0x0181"),
+        Item(index=0x0182, name="Glitch Item 0x0182"),
+        Item(index=0x0183, name="Glitch Item 0x0183"),
+        Item(index=0x0184, name="Glitch Item 0x0184"),
+        Item(index=0x0185, name="Glitch Item 0x0185"),
+        Item(index=0x0186, name="Glitch Item 0x0186"),
+        Item(index=0x0187, name="Glitch Item 0x0187"),
+        Item(index=0x0188, name="Glitch Item 0x0188"),
+        Item(index=0x0189, name="Glitch Item 0x0189"),
+        Item(index=0x018A, name="Glitch Item 0x018A"),
+        Item(index=0x018B, name="Glitch Item 0x018B"),
+        Item(index=0x018C, name="Glitch Item 0x018C"),
+        Item(index=0x018D, name="Glitch Item 0x018D"),
+        Item(index=0x018E, name="Glitch Item 0x018E"),
+        Item(index=0x018F, name="Glitch Item 0x018F"),
+        Item(index=0x0190, name="Glitch Item 0x0190"),
+        Item(index=0x0191, name="Glitch Item 0x0191"),
+        Item(index=0x0192, name="Glitch Item 0x0192"),
+        Item(index=0x0193, name="Glitch Item 0x0193"),
+        Item(index=0x0194, name="Glitch Item 0x0194"),
+        Item(index=0x0195, name="Glitch Item 0x0195"),
+        Item(index=0x0196, name="Glitch Item 0x0196"),
+        Item(index=0x0197, name="Glitch Item 0x0197"),
+        Item(index=0x0198, name="Glitch Item 0x0198"),
+        Item(index=0x0199, name="Glitch Item 0x0199"),
+        Item(index=0x019A, name="Glitch Item 0x019A"),
+        Item(index=0x019B, name="Glitch Item 0x019B"),
+        Item(index=0x019C, name="Glitch Item 0x019C"),
+        Item(index=0x019D, name="Glitch Item 0x019D"),
+        Item(index=0x019E, name="Glitch Item 0x019E"),
+        Item(index=0x019F, name="Glitch Item 0x019F"),
+        Item(index=0x01A0, name="Glitch Item 0x01A0"),
+        Item(index=0x01A1, name="Glitch Item 0x01A1"),
+        Item(index=0x01A2, name="Glitch Item 0x01A2"),
+        Item(index=0x01A3, name="Glitch Item 0x01A3"),
+        Item(index=0x01A4, name="Glitch Item 0x01A4"),
+        Item(index=0x01A5, name="Glitch Item 0x01A5"),
+        Item(index=0x01A6, name="Glitch Item 0x01A6"),
+        Item(index=0x01A7, name="Glitch Item 0x01A7"),
+        Item(index=0x01A8, name="Glitch Item 0x01A8"),
+        Item(index=0x01A9, name="Glitch Item 0x01A9"),
+        Item(index=0x01AA, name="Glitch Item 0x01AA"),
+        Item(index=0x01AB, name="Glitch Item 0x01AB"),
+        Item(index=0x01AC, name="Glitch Item 0x01AC"),
+        Item(index=0x01AD, name="Glitch Item 0x01AD"),
+        Item(index=0x01AE, name="Glitch Item 0x01AE"),
+        Item(index=0x01AF, name="Glitch Item 0x01AF"),
+        Item(index=0x01B0, name="Glitch Item 0x01B0"),
+        Item(index=0x01B1, name="Glitch Item 0x01B1"),
+        Item(index=0x01B2, name="Glitch Item 0x01B2"),
+        Item(index=0x01B3, name="Glitch Item 0x01B3"),
+        Item(index=0x01B4, name="Glitch Item 0x01B4"),
+        Item(index=0x01B5, name="Glitch Item 0x01B5"),
+        Item(index=0x01B6, name="Glitch Item 0x01B6"),
+        Item(index=0x01B7, name="Glitch Item 0x01B7"),
+    ),
 )
@@ -1,237 +1,234 @@
-from collections import defaultdict
 from dataclasses import dataclass
 
 from .IndexedItem import IndexedItem
+from .IndexedTable import IndexedTable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Location(IndexedItem):
     @property
     def is_glitch(self) -> bool:
         return self.index > 0xFF
 
 
-locations = defaultdict(
-    lambda: Location(index=0xD5, name="Glitch location"),
-    {
-        location.index: location
-        for location in (
-            Location(index=0x00, name="Littleroot Town"),
-            Location(index=0x01, name="Oldale Town"),
-            Location(index=0x02, name="Dewford Town"),
-            Location(index=0x03, name="Lavaridge Town"),
-            Location(index=0x04, name="Fallarbor Town"),
-            Location(index=0x05, name="Verdanturf Town"),
-            Location(index=0x06, name="Pacifidlog Town"),
-            Location(index=0x07, name="Petalburg City"),
-            Location(index=0x08, name="Slateport City"),
-            Location(index=0x09, name="Mauville City"),
-            Location(index=0x0A, name="Rustboro City"),
-            Location(index=0x0B, name="Fortree City"),
-            Location(index=0x0C, name="Lilycove City"),
-            Location(index=0x0D, name="Mossdeep City"),
-            Location(index=0x0E, name="Sootopolis City"),
-            Location(index=0x0F, name="Ever Grande City"),
-            Location(index=0x10, name="Route 101"),
-            Location(index=0x11, name="Route 102"),
-            Location(index=0x12, name="Route 103"),
-            Location(index=0x13, name="Route 104"),
-            Location(index=0x14, name="Route 105"),
-            Location(index=0x15, name="Route 106"),
-            Location(index=0x16, name="Route 107"),
-            Location(index=0x17, name="Route 108"),
-            Location(index=0x18, name="Route 109"),
-            Location(index=0x19, name="Route 110"),
-            Location(index=0x1A, name="Route 111"),
-            Location(index=0x1B, name="Route 112"),
-            Location(index=0x1C, name="Route 113"),
-            Location(index=0x1D, name="Route 114"),
-            Location(index=0x1E, name="Route 115"),
-            Location(index=0x1F, name="Route 116"),
-            Location(index=0x20, name="Route 117"),
-            Location(index=0x21, name="Route 118"),
-            Location(index=0x22, name="Route 119"),
-            Location(index=0x23, name="Route 120"),
-            Location(index=0x24, name="Route 121"),
-            Location(index=0x25, name="Route 122"),
-            Location(index=0x26, name="Route 123"),
-            Location(index=0x27, name="Route 124"),
-            Location(index=0x28, name="Route 125"),
-            Location(index=0x29, name="Route 126"),
-            Location(index=0x2A, name="Route 127"),
-            Location(index=0x2B, name="Route 128"),
-            Location(index=0x2C, name="Route 129"),
-            Location(index=0x2D, name="Route 130"),
-            Location(index=0x2E, name="Route 131"),
-            Location(index=0x2F, name="Route 132"),
-            Location(index=0x30, name="Route 133"),
-            Location(index=0x31, name="Route 134"),
-            Location(index=0x32, name="Underwater (Route 124)"),
-            Location(index=0x33, name="Underwater (Route 126)"),
-            Location(index=0x34, name="Underwater (Route 127)"),
-            Location(index=0x35, name="Underwater (Route 128)"),
-            Location(index=0x36, name="Underwater (Sootopolis City)"),
-            Location(index=0x37, name="Granite Cave"),
-            Location(index=0x38, name="Mt. Chimney"),
-            Location(index=0x39, name="Safari Zone"),
-            Location(index=0x3A, name="Battle TowerRS/Battle FrontierE"),
-            Location(index=0x3B, name="Petalburg Woods"),
-            Location(index=0x3C, name="Rusturf Tunnel"),
-            Location(index=0x3D, name="Abandoned Ship"),
-            Location(index=0x3E, name="New Mauville"),
-            Location(index=0x3F, name="Meteor Falls"),
-            Location(index=0x40, name="Meteor Falls (unused)"),
-            Location(index=0x41, name="Mt. Pyre"),
-            Location(index=0x42, name="Hideout* (Magma HideoutR/Aqua HideoutS)"),
-            Location(index=0x43, name="Shoal Cave"),
-            Location(index=0x44, name="Seafloor Cavern"),
-            Location(index=0x45, name="Underwater (Seafloor Cavern)"),
-            Location(index=0x46, name="Victory Road"),
-            Location(index=0x47, name="Mirage Island"),
-            Location(index=0x48, name="Cave of Origin"),
-            Location(index=0x49, name="Southern Island"),
-            Location(index=0x4A, name="Fiery Path"),
-            Location(index=0x4B, name="Fiery Path (unused)"),
-            Location(index=0x4C, name="Jagged Pass"),
-            Location(index=0x4D, name="Jagged Pass (unused)"),
-            Location(index=0x4E, name="Sealed Chamber"),
-            Location(index=0x4F, name="Underwater (Route 134)"),
-            Location(index=0x50, name="Scorched Slab"),
-            Location(index=0x51, name="Island Cave"),
-            Location(index=0x52, name="Desert Ruins"),
-            Location(index=0x53, name="Ancient Tomb"),
-            Location(index=0x54, name="Inside of Truck"),
-            Location(index=0x55, name="Sky Pillar"),
-            Location(index=0x56, name="Secret Base"),
-            Location(index=0x57, name="Ferry"),
-            Location(index=0x58, name="Pallet Town"),
-            Location(index=0x59, name="Viridian City"),
-            Location(index=0x5A, name="Pewter City"),
-            Location(index=0x5B, name="Cerulean City"),
-            Location(index=0x5C, name="Lavender Town"),
-            Location(index=0x5D, name="Vermilion City"),
-            Location(index=0x5E, name="Celadon City"),
-            Location(index=0x5F, name="Fuchsia City"),
-            Location(index=0x60, name="Cinnabar Island"),
-            Location(index=0x61, name="Indigo Plateau"),
-            Location(index=0x62, name="Saffron City"),
-            Location(index=0x63, name="Route 4 (Pokémon Center)"),
-            Location(index=0x64, name="Route 10 (Pokémon Center)"),
-            Location(index=0x65, name="Route 1"),
-            Location(index=0x66, name="Route 2"),
-            Location(index=0x67, name="Route 3"),
-            Location(index=0x68, name="Route 4"),
-            Location(index=0x69, name="Route 5"),
-            Location(index=0x6A, name="Route 6"),
-            Location(index=0x6B, name="Route 7"),
-            Location(index=0x6C, name="Route 8"),
-            Location(index=0x6D, name="Route 9"),
-            Location(index=0x6E, name="Route 10"),
-            Location(index=0x6F, name="Route 11"),
-            Location(index=0x70, name="Route 12"),
-            Location(index=0x71, name="Route 13"),
-            Location(index=0x72, name="Route 14"),
-            Location(index=0x73, name="Route 15"),
-            Location(index=0x74, name="Route 16"),
-            Location(index=0x75, name="Route 17"),
-            Location(index=0x76, name="Route 18"),
-            Location(index=0x77, name="Route 19"),
-            Location(index=0x78, name="Route 20"),
-            Location(index=0x79, name="Route 21"),
-            Location(index=0x7A, name="Route 22"),
-            Location(index=0x7B, name="Route 23"),
-            Location(index=0x7C, name="Route 24"),
-            Location(index=0x7D, name="Route 25"),
-            Location(index=0x7E, name="Viridian Forest"),
-            Location(index=0x7F, name="Mt. Moon"),
-            Location(index=0x80, name="S.S. Anne"),
-            Location(index=0x81, name="Underground Path (Routes 5-6)"),
-            Location(index=0x82, name="Underground Path (Routes 7-8)"),
-            Location(index=0x83, name="Diglett's Cave"),
-            Location(index=0x84, name="Victory Road"),
-            Location(index=0x85, name="Rocket Hideout"),
-            Location(index=0x86, name="Silph Co."),
-            Location(index=0x87, name="Pokémon Mansion"),
-            Location(index=0x88, name="Safari Zone"),
-            Location(index=0x89, name="Pokémon League"),
-            Location(index=0x8A, name="Rock Tunnel"),
-            Location(index=0x8B, name="Seafoam Islands"),
-            Location(index=0x8C, name="Pokémon Tower"),
-            Location(index=0x8D, name="Cerulean Cave"),
-            Location(index=0x8E, name="Power Plant"),
-            Location(index=0x8F, name="One Island"),
-            Location(index=0x90, name="Two Island"),
-            Location(index=0x91, name="Three Island"),
-            Location(index=0x92, name="Four Island"),
-            Location(index=0x93, name="Five Island"),
-            Location(index=0x94, name="Seven Island"),
-            Location(index=0x95, name="Six Island"),
-            Location(index=0x96, name="Kindle Road"),
-            Location(index=0x97, name="Treasure Beach"),
-            Location(index=0x98, name="Cape Brink"),
-            Location(index=0x99, name="Bond Bridge"),
-            Location(index=0x9A, name="Three Isle Port"),
-            Location(index=0x9B, name="Sevii Isle 6"),
-            Location(index=0x9C, name="Sevii Isle 7"),
-            Location(index=0x9D, name="Sevii Isle 8"),
-            Location(index=0x9E, name="Sevii Isle 9"),
-            Location(index=0x9F, name="Resort Gorgeous"),
-            Location(index=0xA0, name="Water Labyrinth"),
-            Location(index=0xA1, name="Five Isle Meadow"),
-            Location(index=0xA2, name="Memorial Pillar"),
-            Location(index=0xA3, name="Outcast Island"),
-            Location(index=0xA4, name="Green Path"),
-            Location(index=0xA5, name="Water Path"),
-            Location(index=0xA6, name="Ruin Valley"),
-            Location(index=0xA7, name="Trainer Tower (exterior)"),
-            Location(index=0xA8, name="Canyon Entrance"),
-            Location(index=0xA9, name="Sevault Canyon"),
-            Location(index=0xAA, name="Tanoby Ruins"),
-            Location(index=0xAB, name="Sevii Isle 22"),
-            Location(index=0xAC, name="Sevii Isle 23"),
-            Location(index=0xAD, name="Sevii Isle 24"),
-            Location(index=0xAE, name="Navel Rock"),
-            Location(index=0xAF, name="Mt. Ember"),
-            Location(index=0xB0, name="Berry Forest"),
-            Location(index=0xB1, name="Icefall Cave"),
-            Location(index=0xB2, name="Rocket Warehouse"),
-            Location(index=0xB3, name="Trainer Tower"),
-            Location(index=0xB4, name="Dotted Hole"),
-            Location(index=0xB5, name="Lost Cave"),
-            Location(index=0xB6, name="Pattern Bush"),
-            Location(index=0xB7, name="Altering Cave"),
-            Location(index=0xB8, name="Tanoby Chambers"),
-            Location(index=0xB9, name="Three Isle Path"),
-            Location(index=0xBA, name="Tanoby Key"),
-            Location(index=0xBB, name="Birth Island"),
-            Location(index=0xBC, name="Monean Chamber"),
-            Location(index=0xBD, name="Liptoo Chamber"),
-            Location(index=0xBE, name="Weepth Chamber"),
-            Location(index=0xBF, name="Dilford Chamber"),
-            Location(index=0xC0, name="Scufib Chamber"),
-            Location(index=0xC1, name="Rixy Chamber"),
-            Location(index=0xC2, name="Viapois Chamber"),
-            Location(index=0xC3, name="Ember Spa"),
-            Location(index=0xC4, name="Celadon Dept."),
-            Location(index=0xC5, name="Aqua Hideout"),
-            Location(index=0xC6, name="Magma Hideout"),
-            Location(index=0xC7, name="Mirage Tower"),
-            Location(index=0xC8, name="Birth Island"),
-            Location(index=0xC9, name="Faraway Island"),
-            Location(index=0xCA, name="Artisan Cave"),
-            Location(index=0xCB, name="Marine Cave"),
-            Location(index=0xCC, name="Underwater (Marine Cave)"),
-            Location(index=0xCD, name="Terra Cave"),
-            Location(index=0xCE, name="Underwater (Route 105)"),
-            Location(index=0xCF, name="Underwater (Route 125)"),
-            Location(index=0xD0, name="Underwater (Route 129)"),
-            Location(index=0xD1, name="Desert Underpass"),
-            Location(index=0xD2, name="Altering Cave"),
-            Location(index=0xD3, name="Navel Rock"),
-            Location(index=0xD4, name="Trainer Hill"),
-            Location(index=0xFD, name="(gift egg)"),
-            Location(index=0xFE, name="(in-game trade)"),
-            Location(index=0xFF, name="(fateful encounter)"),
-        )
-    },
+locations = IndexedTable(
+    glitch=Location(index=0xD5, name="Glitch location"),
+    items=lambda: (
+        Location(index=0x00, name="Littleroot Town"),
+        Location(index=0x01, name="Oldale Town"),
+        Location(index=0x02, name="Dewford Town"),
+        Location(index=0x03, name="Lavaridge Town"),
+        Location(index=0x04, name="Fallarbor Town"),
+        Location(index=0x05, name="Verdanturf Town"),
+        Location(index=0x06, name="Pacifidlog Town"),
+        Location(index=0x07, name="Petalburg City"),
+        Location(index=0x08, name="Slateport City"),
+        Location(index=0x09, name="Mauville City"),
+        Location(index=0x0A, name="Rustboro City"),
+        Location(index=0x0B, name="Fortree City"),
+        Location(index=0x0C, name="Lilycove City"),
+        Location(index=0x0D, name="Mossdeep City"),
+        Location(index=0x0E, name="Sootopolis City"),
+        Location(index=0x0F, name="Ever Grande City"),
+        Location(index=0x10, name="Route 101"),
+        Location(index=0x11, name="Route 102"),
+        Location(index=0x12, name="Route 103"),
+        Location(index=0x13, name="Route 104"),
+        Location(index=0x14, name="Route 105"),
+        Location(index=0x15, name="Route 106"),
+        Location(index=0x16, name="Route 107"),
+        Location(index=0x17, name="Route 108"),
+        Location(index=0x18, name="Route 109"),
+        Location(index=0x19, name="Route 110"),
+        Location(index=0x1A, name="Route 111"),
+        Location(index=0x1B, name="Route 112"),
+        Location(index=0x1C, name="Route 113"),
+        Location(index=0x1D, name="Route 114"),
+        Location(index=0x1E, name="Route 115"),
+        Location(index=0x1F, name="Route 116"),
+        Location(index=0x20, name="Route 117"),
+        Location(index=0x21, name="Route 118"),
+        Location(index=0x22, name="Route 119"),
+        Location(index=0x23, name="Route 120"),
+        Location(index=0x24, name="Route 121"),
+        Location(index=0x25, name="Route 122"),
+        Location(index=0x26, name="Route 123"),
+        Location(index=0x27, name="Route 124"),
+        Location(index=0x28, name="Route 125"),
+        Location(index=0x29, name="Route 126"),
+        Location(index=0x2A, name="Route 127"),
+        Location(index=0x2B, name="Route 128"),
+        Location(index=0x2C, name="Route 129"),
+        Location(index=0x2D, name="Route 130"),
+        Location(index=0x2E, name="Route 131"),
+        Location(index=0x2F, name="Route 132"),
+        Location(index=0x30, name="Route 133"),
+        Location(index=0x31, name="Route 134"),
+        Location(index=0x32, name="Underwater (Route 124)"),
+        Location(index=0x33, name="Underwater (Route 126)"),
+        Location(index=0x34, name="Underwater (Route 127)"),
+        Location(index=0x35, name="Underwater (Route 128)"),
+        Location(index=0x36, name="Underwater (Sootopolis City)"),
+        Location(index=0x37, name="Granite Cave"),
+        Location(index=0x38, name="Mt. Chimney"),
+        Location(index=0x39, name="Safari Zone"),
+        Location(index=0x3A, name="Battle TowerRS/Battle FrontierE"),
+        Location(index=0x3B, name="Petalburg Woods"),
+        Location(index=0x3C, name="Rusturf Tunnel"),
+        Location(index=0x3D, name="Abandoned Ship"),
+        Location(index=0x3E, name="New Mauville"),
+        Location(index=0x3F, name="Meteor Falls"),
+        Location(index=0x40, name="Meteor Falls (unused)"),
+        Location(index=0x41, name="Mt. Pyre"),
+        Location(index=0x42, name="Hideout* (Magma HideoutR/Aqua HideoutS)"),
+        Location(index=0x43, name="Shoal Cave"),
+        Location(index=0x44, name="Seafloor Cavern"),
+        Location(index=0x45, name="Underwater (Seafloor Cavern)"),
+        Location(index=0x46, name="Victory Road"),
+        Location(index=0x47, name="Mirage Island"),
+        Location(index=0x48, name="Cave of Origin"),
+        Location(index=0x49, name="Southern Island"),
+        Location(index=0x4A, name="Fiery Path"),
+        Location(index=0x4B, name="Fiery Path (unused)"),
+        Location(index=0x4C, name="Jagged Pass"),
+        Location(index=0x4D, name="Jagged Pass (unused)"),
+        Location(index=0x4E, name="Sealed Chamber"),
+        Location(index=0x4F, name="Underwater (Route 134)"),
+        Location(index=0x50, name="Scorched Slab"),
+        Location(index=0x51, name="Island Cave"),
+        Location(index=0x52, name="Desert Ruins"),
+        Location(index=0x53, name="Ancient Tomb"),
+        Location(index=0x54, name="Inside of Truck"),
+        Location(index=0x55, name="Sky Pillar"),
+        Location(index=0x56, name="Secret Base"),
+        Location(index=0x57, name="Ferry"),
+        Location(index=0x58, name="Pallet Town"),
+        Location(index=0x59, name="Viridian City"),
+        Location(index=0x5A, name="Pewter City"),
+        Location(index=0x5B, name="Cerulean City"),
+        Location(index=0x5C, name="Lavender Town"),
+        Location(index=0x5D, name="Vermilion City"),
+        Location(index=0x5E, name="Celadon City"),
+        Location(index=0x5F, name="Fuchsia City"),
+        Location(index=0x60, name="Cinnabar Island"),
+        Location(index=0x61, name="Indigo Plateau"),
+        Location(index=0x62, name="Saffron City"),
+        Location(index=0x63, name="Route 4 (Pokémon Center)"),
+        Location(index=0x64, name="Route 10 (Pokémon Center)"),
+        Location(index=0x65, name="Route 1"),
+        Location(index=0x66, name="Route 2"),
+        Location(index=0x67, name="Route 3"),
+        Location(index=0x68, name="Route 4"),
+        Location(index=0x69, name="Route 5"),
+        Location(index=0x6A, name="Route 6"),
+        Location(index=0x6B, name="Route 7"),
+        Location(index=0x6C, name="Route 8"),
+        Location(index=0x6D, name="Route 9"),
+        Location(index=0x6E, name="Route 10"),
+        Location(index=0x6F, name="Route 11"),
+        Location(index=0x70, name="Route 12"),
+        Location(index=0x71, name="Route 13"),
+        Location(index=0x72, name="Route 14"),
+        Location(index=0x73, name="Route 15"),
+        Location(index=0x74, name="Route 16"),
+        Location(index=0x75, name="Route 17"),
+        Location(index=0x76, name="Route 18"),
+        Location(index=0x77, name="Route 19"),
+        Location(index=0x78, name="Route 20"),
+        Location(index=0x79, name="Route 21"),
+        Location(index=0x7A, name="Route 22"),
+        Location(index=0x7B, name="Route 23"),
+        Location(index=0x7C, name="Route 24"),
+        Location(index=0x7D, name="Route 25"),
+        Location(index=0x7E, name="Viridian Forest"),
+        Location(index=0x7F, name="Mt. Moon"),
+        Location(index=0x80, name="S.S. Anne"),
+        Location(index=0x81, name="Underground Path (Routes 5-6)"),
+        Location(index=0x82, name="Underground Path (Routes 7-8)"),
+        Location(index=0x83, name="Diglett's Cave"),
+        Location(index=0x84, name="Victory Road"),
+        Location(index=0x85, name="Rocket Hideout"),
+        Location(index=0x86, name="Silph Co."),
+        Location(index=0x87, name="Pokémon Mansion"),
+        Location(index=0x88, name="Safari Zone"),
+        Location(index=0x89, name="Pokémon League"),
+        Location(index=0x8A, name="Rock Tunnel"),
+        Location(index=0x8B, name="Seafoam Islands"),
+        Location(index=0x8C, name="Pokémon Tower"),
+        Location(index=0x8D, name="Cerulean Cave"),
+        Location(index=0x8E, name="Power Plant"),
+        Location(index=0x8F, name="One Island"),
+        Location(index=0x90, name="Two Island"),
+        Location(index=0x91, name="Three Island"),
+        Location(index=0x92, name="Four Island"),
+        Location(index=0x93, name="Five Island"),
+        Location(index=0x94, name="Seven Island"),
+        Location(index=0x95, name="Six Island"),
+        Location(index=0x96, name="Kindle Road"),
+        Location(index=0x97, name="Treasure Beach"),
+        Location(index=0x98, name="Cape Brink"),
+        Location(index=0x99, name="Bond Bridge"),
+        Location(index=0x9A, name="Three Isle Port"),
+        Location(index=0x9B, name="Sevii Isle 6"),
+        Location(index=0x9C, name="Sevii Isle 7"),
+        Location(index=0x9D, name="Sevii Isle 8"),
+        Location(index=0x9E, name="Sevii Isle 9"),
+        Location(index=0x9F, name="Resort Gorgeous"),
+        Location(index=0xA0, name="Water Labyrinth"),
+        Location(index=0xA1, name="Five Isle Meadow"),
+        Location(index=0xA2, name="Memorial Pillar"),
+        Location(index=0xA3, name="Outcast Island"),
+        Location(index=0xA4, name="Green Path"),
+        Location(index=0xA5, name="Water Path"),
+        Location(index=0xA6, name="Ruin Valley"),
+        Location(index=0xA7, name="Trainer Tower (exterior)"),
+        Location(index=0xA8, name="Canyon Entrance"),
+        Location(index=0xA9, name="Sevault Canyon"),
+        Location(index=0xAA, name="Tanoby Ruins"),
+        Location(index=0xAB, name="Sevii Isle 22"),
+        Location(index=0xAC, name="Sevii Isle 23"),
+        Location(index=0xAD, name="Sevii Isle 24"),
+        Location(index=0xAE, name="Navel Rock"),
+        Location(index=0xAF, name="Mt. Ember"),
+        Location(index=0xB0, name="Berry Forest"),
+        Location(index=0xB1, name="Icefall Cave"),
+        Location(index=0xB2, name="Rocket Warehouse"),
+        Location(index=0xB3, name="Trainer Tower"),
+        Location(index=0xB4, name="Dotted Hole"),
+        Location(index=0xB5, name="Lost Cave"),
+        Location(index=0xB6, name="Pattern Bush"),
+        Location(index=0xB7, name="Altering Cave"),
+        Location(index=0xB8, name="Tanoby Chambers"),
+        Location(index=0xB9, name="Three Isle Path"),
+        Location(index=0xBA, name="Tanoby Key"),
+        Location(index=0xBB, name="Birth Island"),
+        Location(index=0xBC, name="Monean Chamber"),
+        Location(index=0xBD, name="Liptoo Chamber"),
+        Location(index=0xBE, name="Weepth Chamber"),
+        Location(index=0xBF, name="Dilford Chamber"),
+        Location(index=0xC0, name="Scufib Chamber"),
+        Location(index=0xC1, name="Rixy Chamber"),
+        Location(index=0xC2, name="Viapois Chamber"),
+        Location(index=0xC3, name="Ember Spa"),
+        Location(index=0xC4, name="Celadon Dept."),
+        Location(index=0xC5, name="Aqua Hideout"),
+        Location(index=0xC6, name="Magma Hideout"),
+        Location(index=0xC7, name="Mirage Tower"),
+        Location(index=0xC8, name="Birth Island"),
+        Location(index=0xC9, name="Faraway Island"),
+        Location(index=0xCA, name="Artisan Cave"),
+        Location(index=0xCB, name="Marine Cave"),
+        Location(index=0xCC, name="Underwater (Marine Cave)"),
+        Location(index=0xCD, name="Terra Cave"),
+        Location(index=0xCE, name="Underwater (Route 105)"),
+        Location(index=0xCF, name="Underwater (Route 125)"),
+        Location(index=0xD0, name="Underwater (Route 129)"),
+        Location(index=0xD1, name="Desert Underpass"),
+        Location(index=0xD2, name="Altering Cave"),
+        Location(index=0xD3, name="Navel Rock"),
+        Location(index=0xD4, name="Trainer Hill"),
+        Location(index=0xFD, name="(gift egg)"),
+        Location(index=0xFE, name="(in-game trade)"),
+        Location(index=0xFF, name="(fateful encounter)"),
+    ),
 )
@@ -1,376 +1,373 @@
-from collections import defaultdict
 from dataclasses import dataclass
 
 from .IndexedItem import IndexedItem
+from .IndexedTable import IndexedTable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Move(IndexedItem):
     @property
     def is_glitch(self) -> bool:
         return self.index > 0x0162
 
 
-moves = defaultdict(
-    lambda: Move(index=0x0163, name="--"),
-    {
-        move.index: move
-        for move in (
-            Move(index=0x0000, name="--"),
-            Move(index=0x0001, name="Pound"),
-            Move(index=0x0002, name="Karate Chop"),
-            Move(index=0x0003, name="Double Slap"),
-            Move(index=0x0004, name="Comet Punch"),
-            Move(index=0x0005, name="Mega Punch"),
-            Move(index=0x0006, name="Pay Day"),
-            Move(index=0x0007, name="Fire Punch"),
-            Move(index=0x0008, name="Ice Punch"),
-            Move(index=0x0009, name="Thunder Punch"),
-            Move(index=0x000A, name="Scratch"),
-            Move(index=0x000B, name="Vise Grip"),
-            Move(index=0x000C, name="Guillotine"),
-            Move(index=0x000D, name="Razor Wind"),
-            Move(index=0x000E, name="Swords Dance"),
-            Move(index=0x000F, name="Cut"),
-            Move(index=0x0010, name="Gust"),
-            Move(index=0x0011, name="Wing Attack"),
-            Move(index=0x0012, name="Whirlwind"),
-            Move(index=0x0013, name="Fly"),
-            Move(index=0x0014, name="Bind"),
-            Move(index=0x0015, name="Slam"),
-            Move(index=0x0016, name="Vine Whip"),
-            Move(index=0x0017, name="Stomp"),
-            Move(index=0x0018, name="Double Kick"),
-            Move(index=0x0019, name="Mega Kick"),
-            Move(index=0x001A, name="Jump Kick"),
-            Move(index=0x001B, name="Rolling Kick"),
-            Move(index=0x001C, name="Sand Attack"),
-            Move(index=0x001D, name="Headbutt"),
-            Move(index=0x001E, name="Horn Attack"),
-            Move(index=0x001F, name="Fury Attack"),
-            Move(index=0x0020, name="Horn Drill"),
-            Move(index=0x0021, name="Tackle"),
-            Move(index=0x0022, name="Body Slam"),
-            Move(index=0x0023, name="Wrap"),
-            Move(index=0x0024, name="Take Down"),
-            Move(index=0x0025, name="Thrash"),
-            Move(index=0x0026, name="Double-Edge"),
-            Move(index=0x0027, name="Tail Whip"),
-            Move(index=0x0028, name="Poison Sting"),
-            Move(index=0x0029, name="Twineedle"),
-            Move(index=0x002A, name="Pin Missile"),
-            Move(index=0x002B, name="Leer"),
-            Move(index=0x002C, name="Bite"),
-            Move(index=0x002D, name="Growl"),
-            Move(index=0x002E, name="Roar"),
-            Move(index=0x002F, name="Sing"),
-            Move(index=0x0030, name="Supersonic"),
-            Move(index=0x0031, name="Sonic Boom"),
-            Move(index=0x0032, name="Disable"),
-            Move(index=0x0033, name="Acid"),
-            Move(index=0x0034, name="Ember"),
-            Move(index=0x0035, name="Flamethrower"),
-            Move(index=0x0036, name="Mist"),
-            Move(index=0x0037, name="Water Gun"),
-            Move(index=0x0038, name="Hydro Pump"),
-            Move(index=0x0039, name="Surf"),
-            Move(index=0x003A, name="Ice Beam"),
-            Move(index=0x003B, name="Blizzard"),
-            Move(index=0x003C, name="Psybeam"),
-            Move(index=0x003D, name="Bubble Beam"),
-            Move(index=0x003E, name="Aurora Beam"),
-            Move(index=0x003F, name="Hyper Beam"),
-            Move(index=0x0040, name="Peck"),
-            Move(index=0x0041, name="Drill Peck"),
-            Move(index=0x0042, name="Submission"),
-            Move(index=0x0043, name="Low Kick"),
-            Move(index=0x0044, name="Counter"),
-            Move(index=0x0045, name="Seismic Toss"),
-            Move(index=0x0046, name="Strength"),
-            Move(index=0x0047, name="Absorb"),
-            Move(index=0x0048, name="Mega Drain"),
-            Move(index=0x0049, name="Leech Seed"),
-            Move(index=0x004A, name="Growth"),
-            Move(index=0x004B, name="Razor Leaf"),
-            Move(index=0x004C, name="Solar Beam"),
-            Move(index=0x004D, name="Poison Powder"),
-            Move(index=0x004E, name="Stun Spore"),
-            Move(index=0x004F, name="Sleep Powder"),
-            Move(index=0x0050, name="Petal Dance"),
-            Move(index=0x0051, name="String Shot"),
-            Move(index=0x0052, name="Dragon Rage"),
-            Move(index=0x0053, name="Fire Spin"),
-            Move(index=0x0054, name="Thunder Shock"),
-            Move(index=0x0055, name="Thunderbolt"),
-            Move(index=0x0056, name="Thunder Wave"),
-            Move(index=0x0057, name="Thunder"),
-            Move(index=0x0058, name="Rock Throw"),
-            Move(index=0x0059, name="Earthquake"),
-            Move(index=0x005A, name="Fissure"),
-            Move(index=0x005B, name="Dig"),
-            Move(index=0x005C, name="Toxic"),
-            Move(index=0x005D, name="Confusion"),
-            Move(index=0x005E, name="Psychic"),
-            Move(index=0x005F, name="Hypnosis"),
-            Move(index=0x0060, name="Meditate"),
-            Move(index=0x0061, name="Agility"),
-            Move(index=0x0062, name="Quick Attack"),
-            Move(index=0x0063, name="Rage"),
-            Move(index=0x0064, name="Teleport"),
-            Move(index=0x0065, name="Night Shade"),
-            Move(index=0x0066, name="Mimic"),
-            Move(index=0x0067, name="Screech"),
-            Move(index=0x0068, name="Double Team"),
-            Move(index=0x0069, name="Recover"),
-            Move(index=0x006A, name="Harden"),
-            Move(index=0x006B, name="Minimize"),
-            Move(index=0x006C, name="Smokescreen"),
-            Move(index=0x006D, name="Confuse Ray"),
-            Move(index=0x006E, name="Withdraw"),
-            Move(index=0x006F, name="Defense Curl"),
-            Move(index=0x0070, name="Barrier"),
-            Move(index=0x0071, name="Light Screen"),
-            Move(index=0x0072, name="Haze"),
-            Move(index=0x0073, name="Reflect"),
-            Move(index=0x0074, name="Focus Energy"),
-            Move(index=0x0075, name="Bide"),
-            Move(index=0x0076, name="Metronome"),
-            Move(index=0x0077, name="Mirror Move"),
-            Move(index=0x0078, name="Self-Destruct"),
-            Move(index=0x0079, name="Egg Bomb"),
-            Move(index=0x007A, name="Lick"),
-            Move(index=0x007B, name="Smog"),
-            Move(index=0x007C, name="Sludge"),
-            Move(index=0x007D, name="Bone Club"),
-            Move(index=0x007E, name="Fire Blast"),
-            Move(index=0x007F, name="Waterfall"),
-            Move(index=0x0080, name="Clamp"),
-            Move(index=0x0081, name="Swift"),
-            Move(index=0x0082, name="Skull Bash"),
-            Move(index=0x0083, name="Spike Cannon"),
-            Move(index=0x0084, name="Constrict"),
-            Move(index=0x0085, name="Amnesia"),
-            Move(index=0x0086, name="Kinesis"),
-            Move(index=0x0087, name="Soft-Boiled"),
-            Move(index=0x0088, name="Hi Jump Kick"),
-            Move(index=0x0089, name="Glare"),
-            Move(index=0x008A, name="Dream Eater"),
-            Move(index=0x008B, name="Poison Gas"),
-            Move(index=0x008C, name="Barrage"),
-            Move(index=0x008D, name="Leech Life"),
-            Move(index=0x008E, name="Lovely Kiss"),
-            Move(index=0x008F, name="Sky Attack"),
-            Move(index=0x0090, name="Transform"),
-            Move(index=0x0091, name="Bubble"),
-            Move(index=0x0092, name="Dizzy Punch"),
-            Move(index=0x0093, name="Spore"),
-            Move(index=0x0094, name="Flash"),
-            Move(index=0x0095, name="Psywave"),
-            Move(index=0x0096, name="Splash"),
-            Move(index=0x0097, name="Acid Armor"),
-            Move(index=0x0098, name="Crabhammer"),
-            Move(index=0x0099, name="Explosion"),
-            Move(index=0x009A, name="Fury Swipes"),
-            Move(index=0x009B, name="Bonemerang"),
-            Move(index=0x009C, name="Rest"),
-            Move(index=0x009D, name="Rock Slide"),
-            Move(index=0x009E, name="Hyper Fang"),
-            Move(index=0x009F, name="Sharpen"),
-            Move(index=0x00A0, name="Conversion"),
-            Move(index=0x00A1, name="Tri Attack"),
-            Move(index=0x00A2, name="Super Fang"),
-            Move(index=0x00A3, name="Slash"),
-            Move(index=0x00A4, name="Substitute"),
-            Move(index=0x00A5, name="Struggle"),
-            Move(index=0x00A6, name="Sketch"),
-            Move(index=0x00A7, name="Triple Kick"),
-            Move(index=0x00A8, name="Thief"),
-            Move(index=0x00A9, name="Spider Web"),
-            Move(index=0x00AA, name="Mind Reader"),
-            Move(index=0x00AB, name="Nightmare"),
-            Move(index=0x00AC, name="Flame Wheel"),
-            Move(index=0x00AD, name="Snore"),
-            Move(index=0x00AE, name="Curse"),
-            Move(index=0x00AF, name="Flail"),
-            Move(index=0x00B0, name="Conversion 2"),
-            Move(index=0x00B1, name="Aeroblast"),
-            Move(index=0x00B2, name="Cotton Spore"),
-            Move(index=0x00B3, name="Reversal"),
-            Move(index=0x00B4, name="Spite"),
-            Move(index=0x00B5, name="Powder Snow"),
-            Move(index=0x00B6, name="Protect"),
-            Move(index=0x00B7, name="Mach Punch"),
-            Move(index=0x00B8, name="Scary Face"),
-            Move(index=0x00B9, name="Feint Attack"),
-            Move(index=0x00BA, name="Sweet Kiss"),
-            Move(index=0x00BB, name="Belly Drum"),
-            Move(index=0x00BC, name="Sludge Bomb"),
-            Move(index=0x00BD, name="Mud-Slap"),
-            Move(index=0x00BE, name="Octazooka"),
-            Move(index=0x00BF, name="Spikes"),
-            Move(index=0x00C0, name="Zap Cannon"),
-            Move(index=0x00C1, name="Foresight"),
-            Move(index=0x00C2, name="Destiny Bond"),
-            Move(index=0x00C3, name="Perish Song"),
-            Move(index=0x00C4, name="Icy Wind"),
-            Move(index=0x00C5, name="Detect"),
-            Move(index=0x00C6, name="Bone Rush"),
-            Move(index=0x00C7, name="Lock-On"),
-            Move(index=0x00C8, name="Outrage"),
-            Move(index=0x00C9, name="Sandstorm"),
-            Move(index=0x00CA, name="Giga Drain"),
-            Move(index=0x00CB, name="Endure"),
-            Move(index=0x00CC, name="Charm"),
-            Move(index=0x00CD, name="Rollout"),
-            Move(index=0x00CE, name="False Swipe"),
-            Move(index=0x00CF, name="Swagger"),
-            Move(index=0x00D0, name="Milk Drink"),
-            Move(index=0x00D1, name="Spark"),
-            Move(index=0x00D2, name="Fury Cutter"),
-            Move(index=0x00D3, name="Steel Wing"),
-            Move(index=0x00D4, name="Mean Look"),
-            Move(index=0x00D5, name="Attract"),
-            Move(index=0x00D6, name="Sleep Talk"),
-            Move(index=0x00D7, name="Heal Bell"),
-            Move(index=0x00D8, name="Return"),
-            Move(index=0x00D9, name="Present"),
-            Move(index=0x00DA, name="Frustration"),
-            Move(index=0x00DB, name="Safeguard"),
-            Move(index=0x00DC, name="Pain Split"),
-            Move(index=0x00DD, name="Sacred Fire"),
-            Move(index=0x00DE, name="Magnitude"),
-            Move(index=0x00DF, name="Dynamic Punch"),
-            Move(index=0x00E0, name="Megahorn"),
-            Move(index=0x00E1, name="Dragon Breath"),
-            Move(index=0x00E2, name="Baton Pass"),
-            Move(index=0x00E3, name="Encore"),
-            Move(index=0x00E4, name="Pursuit"),
-            Move(index=0x00E5, name="Rapid Spin"),
-            Move(index=0x00E6, name="Sweet Scent"),
-            Move(index=0x00E7, name="Iron Tail"),
-            Move(index=0x00E8, name="Metal Claw"),
-            Move(index=0x00E9, name="Vital Throw"),
-            Move(index=0x00EA, name="Morning Sun"),
-            Move(index=0x00EB, name="Synthesis"),
-            Move(index=0x00EC, name="Moonlight"),
-            Move(index=0x00ED, name="Hidden Power"),
-            Move(index=0x00EE, name="Cross Chop"),
-            Move(index=0x00EF, name="Twister"),
-            Move(index=0x00F0, name="Rain Dance"),
-            Move(index=0x00F1, name="Sunny Day"),
-            Move(index=0x00F2, name="Crunch"),
-            Move(index=0x00F3, name="Mirror Coat"),
-            Move(index=0x00F4, name="Psych Up"),
-            Move(index=0x00F5, name="Extreme Speed"),
-            Move(index=0x00F6, name="Ancient Power"),
-            Move(index=0x00F7, name="Shadow Ball"),
-            Move(index=0x00F8, name="Future Sight"),
-            Move(index=0x00F9, name="Rock Smash"),
-            Move(index=0x00FA, name="Whirlpool"),
-            Move(index=0x00FB, name="Beat Up"),
-            Move(index=0x00FC, name="Fake Out"),
-            Move(index=0x00FD, name="Uproar"),
-            Move(index=0x00FE, name="Stockpile"),
-            Move(index=0x00FF, name="Spit Up"),
-            Move(index=0x0100, name="Swallow"),
-            Move(index=0x0101, name="Heat Wave"),
-            Move(index=0x0102, name="Hail"),
-            Move(index=0x0103, name="Torment"),
-            Move(index=0x0104, name="Flatter"),
-            Move(index=0x0105, name="Will-O-Wisp"),
-            Move(index=0x0106, name="Memento"),
-            Move(index=0x0107, name="Facade"),
-            Move(index=0x0108, name="Focus Punch"),
-            Move(index=0x0109, name="Smelling Salts"),
-            Move(index=0x010A, name="Follow Me"),
-            Move(index=0x010B, name="Nature Power"),
-            Move(index=0x010C, name="Charge"),
-            Move(index=0x010D, name="Taunt"),
-            Move(index=0x010E, name="Helping Hand"),
-            Move(index=0x010F, name="Trick"),
-            Move(index=0x0110, name="Role Play"),
-            Move(index=0x0111, name="Wish"),
-            Move(index=0x0112, name="Assist"),
-            Move(index=0x0113, name="Ingrain"),
-            Move(index=0x0114, name="Superpower"),
-            Move(index=0x0115, name="Magic Coat"),
-            Move(index=0x0116, name="Recycle"),
-            Move(index=0x0117, name="Revenge"),
-            Move(index=0x0118, name="Brick Break"),
-            Move(index=0x0119, name="Yawn"),
-            Move(index=0x011A, name="Knock Off"),
-            Move(index=0x011B, name="Endeavor"),
-            Move(index=0x011C, name="Eruption"),
-            Move(index=0x011D, name="Skill Swap"),
-            Move(index=0x011E, name="Imprison"),
-            Move(index=0x011F, name="Refresh"),
-            Move(index=0x0120, name="Grudge"),
-            Move(index=0x0121, name="Snatch"),
-            Move(index=0x0122, name="Secret Power"),
-            Move(index=0x0123, name="Dive"),
-            Move(index=0x0124, name="Arm Thrust"),
-            Move(index=0x0125, name="Camouflage"),
-            Move(index=0x0126, name="Tail Glow"),
-            Move(index=0x0127, name="Luster Purge"),
-            Move(index=0x0128, name="Mist Ball"),
-            Move(index=0x0129, name="Feather Dance"),
-            Move(index=0x012A, name="Teeter Dance"),
-            Move(index=0x012B, name="Blaze Kick"),
-            Move(index=0x012C, name="Mud Sport"),
-            Move(index=0x012D, name="Ice Ball"),
-            Move(index=0x012E, name="Needle Arm"),
-            Move(index=0x012F, name="Slack Off"),
-            Move(index=0x0130, name="Hyper Voice"),
-            Move(index=0x0131, name="Poison Fang"),
-            Move(index=0x0132, name="Crush Claw"),
-            Move(index=0x0133, name="Blast Burn"),
-            Move(index=0x0134, name="Hydro Cannon"),
-            Move(index=0x0135, name="Meteor Mash"),
-            Move(index=0x0136, name="Astonish"),
-            Move(index=0x0137, name="Weather Ball"),
-            Move(index=0x0138, name="Aromatherapy"),
-            Move(index=0x0139, name="Fake Tears"),
-            Move(index=0x013A, name="Air Cutter"),
-            Move(index=0x013B, name="Overheat"),
-            Move(index=0x013C, name="Odor Sleuth"),
-            Move(index=0x013D, name="Rock Tomb"),
-            Move(index=0x013E, name="Silver Wind"),
-            Move(index=0x013F, name="Metal Sound"),
-            Move(index=0x0140, name="Grass Whistle"),
-            Move(index=0x0141, name="Tickle"),
-            Move(index=0x0142, name="Cosmic Power"),
-            Move(index=0x0143, name="Water Spout"),
-            Move(index=0x0144, name="Signal Beam"),
-            Move(index=0x0145, name="Shadow Punch"),
-            Move(index=0x0146, name="Extrasensory"),
-            Move(index=0x0147, name="Sky Uppercut"),
-            Move(index=0x0148, name="Sand Tomb"),
-            Move(index=0x0149, name="Sheer Cold"),
-            Move(index=0x014A, name="Muddy Water"),
-            Move(index=0x014B, name="Bullet Seed"),
-            Move(index=0x014C, name="Aerial Ace"),
-            Move(index=0x014D, name="Icicle Spear"),
-            Move(index=0x014E, name="Iron Defense"),
-            Move(index=0x014F, name="Block"),
-            Move(index=0x0150, name="Howl"),
-            Move(index=0x0151, name="Dragon Claw"),
-            Move(index=0x0152, name="Frenzy Plant"),
-            Move(index=0x0153, name="Bulk Up"),
-            Move(index=0x0154, name="Bounce"),
-            Move(index=0x0155, name="Mud Shot"),
-            Move(index=0x0156, name="Poison Tail"),
-            Move(index=0x0157, name="Covet"),
-            Move(index=0x0158, name="Volt Tackle"),
-            Move(index=0x0159, name="Magical Leaf"),
-            Move(index=0x015A, name="Water Sport"),
-            Move(index=0x015B, name="Calm Mind"),
-            Move(index=0x015C, name="Leaf Blade"),
-            Move(index=0x015D, name="Dragon Dance"),
-            Move(index=0x015E, name="Rock Blast"),
-            Move(index=0x015F, name="Shock Wave"),
-            Move(index=0x0160, name="Water Pulse"),
-            Move(index=0x0161, name="Doom Desire"),
-            Move(index=0x0162, name="Psycho Boost"),
-        )
-    },
+moves = IndexedTable(
+    glitch=Move(index=0x0163, name="--"),
+    items=lambda: (
+        Move(index=0x0000, name="--"),
+        Move(index=0x0001, name="Pound"),
+        Move(index=0x0002, name="Karate Chop"),
+        Move(index=0x0003, name="Double Slap"),
+        Move(index=0x0004, name="Comet Punch"),
+        Move(index=0x0005, name="Mega Punch"),
+        Move(index=0x0006, name="Pay Day"),
+        Move(index=0x0007, name="Fire Punch"),
+        Move(index=0x0008, name="Ice Punch"),
+        Move(index=0x0009, name="Thunder Punch"),
+        Move(index=0x000A, name="Scratch"),
+        Move(index=0x000B, name="Vise Grip"),
+        Move(index=0x000C, name="Guillotine"),
+        Move(index=0x000D, name="Razor Wind"),
+        Move(index=0x000E, name="Swords Dance"),
+        Move(index=0x000F, name="Cut"),
+        Move(index=0x0010, name="Gust"),
+        Move(index=0x0011, name="Wing Attack"),
+        Move(index=0x0012, name="Whirlwind"),
+        Move(index=0x0013, name="Fly"),
+        Move(index=0x0014, name="Bind"),
+        Move(index=0x0015, name="Slam"),
+        Move(index=0x0016, name="Vine Whip"),
+        Move(index=0x0017, name="Stomp"),
+        Move(index=0x0018, name="Double Kick"),
+        Move(index=0x0019, name="Mega Kick"),
+        Move(index=0x001A, name="Jump Kick"),
+        Move(index=0x001B, name="Rolling Kick"),
+        Move(index=0x001C, name="Sand Attack"),
+        Move(index=0x001D, name="Headbutt"),
+        Move(index=0x001E, name="Horn Attack"),
+        Move(index=0x001F, name="Fury Attack"),
+        Move(index=0x0020, name="Horn Drill"),
+        Move(index=0x0021, name="Tackle"),
+        Move(index=0x0022, name="Body Slam"),
+        Move(index=0x0023, name="Wrap"),
+        Move(index=0x0024, name="Take Down"),
+        Move(index=0x0025, name="Thrash"),
+        Move(index=0x0026, name="Double-Edge"),
+        Move(index=0x0027, name="Tail Whip"),
+        Move(index=0x0028, name="Poison Sting"),
+        Move(index=0x0029, name="Twineedle"),
+        Move(index=0x002A, name="Pin Missile"),
+        Move(index=0x002B, name="Leer"),
+        Move(index=0x002C, name="Bite"),
+        Move(index=0x002D, name="Growl"),
+        Move(index=0x002E, name="Roar"),
+        Move(index=0x002F, name="Sing"),
+        Move(index=0x0030, name="Supersonic"),
+        Move(index=0x0031, name="Sonic Boom"),
+        Move(index=0x0032, name="Disable"),
+        Move(index=0x0033, name="Acid"),
+        Move(index=0x0034, name="Ember"),
+        Move(index=0x0035, name="Flamethrower"),
+        Move(index=0x0036, name="Mist"),
+        Move(index=0x0037, name="Water Gun"),
+        Move(index=0x0038, name="Hydro Pump"),
+        Move(index=0x0039, name="Surf"),
+        Move(index=0x003A, name="Ice Beam"),
+        Move(index=0x003B, name="Blizzard"),
+        Move(index=0x003C, name="Psybeam"),
+        Move(index=0x003D, name="Bubble Beam"),
+        Move(index=0x003E, name="Aurora Beam"),
+        Move(index=0x003F, name="Hyper Beam"),
+        Move(index=0x0040, name="Peck"),
+        Move(index=0x0041, name="Drill Peck"),
+        Move(index=0x0042, name="Submission"),
+        Move(index=0x0043, name="Low Kick"),
+        Move(index=0x0044, name="Counter"),
+        Move(index=0x0045, name="Seismic Toss"),
+        Move(index=0x0046, name="Strength"),
+        Move(index=0x0047, name="Absorb"),
+        Move(index=0x0048, name="Mega Drain"),
+        Move(index=0x0049, name="Leech Seed"),
+        Move(index=0x004A, name="Growth"),
+        Move(index=0x004B, name="Razor Leaf"),
+        Move(index=0x004C, name="Solar Beam"),
+        Move(index=0x004D, name="Poison Powder"),
+        Move(index=0x004E, name="Stun Spore"),
+        Move(index=0x004F, name="Sleep Powder"),
+        Move(index=0x0050, name="Petal Dance"),
+        Move(index=0x0051, name="String Shot"),
+        Move(index=0x0052, name="Dragon Rage"),
+        Move(index=0x0053, name="Fire Spin"),
+        Move(index=0x0054, name="Thunder Shock"),
+        Move(index=0x0055, name="Thunderbolt"),
+        Move(index=0x0056, name="Thunder Wave"),
+        Move(index=0x0057, name="Thunder"),
+        Move(index=0x0058, name="Rock Throw"),
+        Move(index=0x0059, name="Earthquake"),
+        Move(index=0x005A, name="Fissure"),
+        Move(index=0x005B, name="Dig"),
+        Move(index=0x005C, name="Toxic"),
+        Move(index=0x005D, name="Confusion"),
+        Move(index=0x005E, name="Psychic"),
+        Move(index=0x005F, name="Hypnosis"),
+        Move(index=0x0060, name="Meditate"),
+        Move(index=0x0061, name="Agility"),
+        Move(index=0x0062, name="Quick Attack"),
+        Move(index=0x0063, name="Rage"),
+        Move(index=0x0064, name="Teleport"),
+        Move(index=0x0065, name="Night Shade"),
+        Move(index=0x0066, name="Mimic"),
+        Move(index=0x0067, name="Screech"),
+        Move(index=0x0068, name="Double Team"),
+        Move(index=0x0069, name="Recover"),
+        Move(index=0x006A, name="Harden"),
+        Move(index=0x006B, name="Minimize"),
+        Move(index=0x006C, name="Smokescreen"),
+        Move(index=0x006D, name="Confuse Ray"),
+        Move(index=0x006E, name="Withdraw"),
+        Move(index=0x006F, name="Defense Curl"),
+        Move(index=0x0070, name="Barrier"),
+        Move(index=0x0071, name="Light Screen"),
+        Move(index=0x0072, name="Haze"),
+        Move(index=0x0073, name="Reflect"),
+        Move(index=0x0074, name="Focus Energy"),
+        Move(index=0x0075, name="Bide"),
+        Move(index=0x0076, name="Metronome"),
+        Move(index=0x0077, name="Mirror Move"),
+        Move(index=0x0078, name="Self-Destruct"),
+        Move(index=0x0079, name="Egg Bomb"),
+        Move(index=0x007A, name="Lick"),
+        Move(index=0x007B, name="Smog"),
+        Move(index=0x007C, name="Sludge"),
+        Move(index=0x007D, name="Bone Club"),
+        Move(index=0x007E, name="Fire Blast"),
+        Move(index=0x007F, name="Waterfall"),
+        Move(index=0x0080, name="Clamp"),
+        Move(index=0x0081, name="Swift"),
+        Move(index=0x0082, name="Skull Bash"),
+        Move(index=0x0083, name="Spike Cannon"),
+        Move(index=0x0084, name="Constrict"),
+        Move(index=0x0085, name="Amnesia"),
+        Move(index=0x0086, name="Kinesis"),
+        Move(index=0x0087, name="Soft-Boiled"),
+        Move(index=0x0088, name="Hi Jump Kick"),
+        Move(index=0x0089, name="Glare"),
+        Move(index=0x008A, name="Dream Eater"),
+        Move(index=0x008B, name="Poison Gas"),
+        Move(index=0x008C, name="Barrage"),
+        Move(index=0x008D, name="Leech Life"),
+        Move(index=0x008E, name="Lovely Kiss"),
+        Move(index=0x008F, name="Sky Attack"),
+        Move(index=0x0090, name="Transform"),
+        Move(index=0x0091, name="Bubble"),
+        Move(index=0x0092, name="Dizzy Punch"),
+        Move(index=0x0093, name="Spore"),
+        Move(index=0x0094, name="Flash"),
+        Move(index=0x0095, name="Psywave"),
+        Move(index=0x0096, name="Splash"),
+        Move(index=0x0097, name="Acid Armor"),
+        Move(index=0x0098, name="Crabhammer"),
+        Move(index=0x0099, name="Explosion"),
+        Move(index=0x009A, name="Fury Swipes"),
+        Move(index=0x009B, name="Bonemerang"),
+        Move(index=0x009C, name="Rest"),
+        Move(index=0x009D, name="Rock Slide"),
+        Move(index=0x009E, name="Hyper Fang"),
+        Move(index=0x009F, name="Sharpen"),
+        Move(index=0x00A0, name="Conversion"),
+        Move(index=0x00A1, name="Tri Attack"),
+        Move(index=0x00A2, name="Super Fang"),
+        Move(index=0x00A3, name="Slash"),
+        Move(index=0x00A4, name="Substitute"),
+        Move(index=0x00A5, name="Struggle"),
+        Move(index=0x00A6, name="Sketch"),
+        Move(index=0x00A7, name="Triple Kick"),
+        Move(index=0x00A8, name="Thief"),
+        Move(index=0x00A9, name="Spider Web"),
+        Move(index=0x00AA, name="Mind Reader"),
+        Move(index=0x00AB, name="Nightmare"),
+        Move(index=0x00AC, name="Flame Wheel"),
+        Move(index=0x00AD, name="Snore"),
+        Move(index=0x00AE, name="Curse"),
+        Move(index=0x00AF, name="Flail"),
+        Move(index=0x00B0, name="Conversion 2"),
+        Move(index=0x00B1, name="Aeroblast"),
+        Move(index=0x00B2, name="Cotton Spore"),
+        Move(index=0x00B3, name="Reversal"),
+        Move(index=0x00B4, name="Spite"),
+        Move(index=0x00B5, name="Powder Snow"),
+        Move(index=0x00B6, name="Protect"),
+        Move(index=0x00B7, name="Mach Punch"),
+        Move(index=0x00B8, name="Scary Face"),
+        Move(index=0x00B9, name="Feint Attack"),
+        Move(index=0x00BA, name="Sweet Kiss"),
+        Move(index=0x00BB, name="Belly Drum"),
+        Move(index=0x00BC, name="Sludge Bomb"),
+        Move(index=0x00BD, name="Mud-Slap"),
+        Move(index=0x00BE, name="Octazooka"),
+        Move(index=0x00BF, name="Spikes"),
+        Move(index=0x00C0, name="Zap Cannon"),
+        Move(index=0x00C1, name="Foresight"),
+        Move(index=0x00C2, name="Destiny Bond"),
+        Move(index=0x00C3, name="Perish Song"),
+        Move(index=0x00C4, name="Icy Wind"),
+        Move(index=0x00C5, name="Detect"),
+        Move(index=0x00C6, name="Bone Rush"),
+        Move(index=0x00C7, name="Lock-On"),
+        Move(index=0x00C8, name="Outrage"),
+        Move(index=0x00C9, name="Sandstorm"),
+        Move(index=0x00CA, name="Giga Drain"),
+        Move(index=0x00CB, name="Endure"),
+        Move(index=0x00CC, name="Charm"),
+        Move(index=0x00CD, name="Rollout"),
+        Move(index=0x00CE, name="False Swipe"),
+        Move(index=0x00CF, name="Swagger"),
+        Move(index=0x00D0, name="Milk Drink"),
+        Move(index=0x00D1, name="Spark"),
+        Move(index=0x00D2, name="Fury Cutter"),
+        Move(index=0x00D3, name="Steel Wing"),
+        Move(index=0x00D4, name="Mean Look"),
+        Move(index=0x00D5, name="Attract"),
+        Move(index=0x00D6, name="Sleep Talk"),
+        Move(index=0x00D7, name="Heal Bell"),
+        Move(index=0x00D8, name="Return"),
+        Move(index=0x00D9, name="Present"),
+        Move(index=0x00DA, name="Frustration"),
+        Move(index=0x00DB, name="Safeguard"),
+        Move(index=0x00DC, name="Pain Split"),
+        Move(index=0x00DD, name="Sacred Fire"),
+        Move(index=0x00DE, name="Magnitude"),
+        Move(index=0x00DF, name="Dynamic Punch"),
+        Move(index=0x00E0, name="Megahorn"),
+        Move(index=0x00E1, name="Dragon Breath"),
+        Move(index=0x00E2, name="Baton Pass"),
+        Move(index=0x00E3, name="Encore"),
+        Move(index=0x00E4, name="Pursuit"),
+        Move(index=0x00E5, name="Rapid Spin"),
+        Move(index=0x00E6, name="Sweet Scent"),
+        Move(index=0x00E7, name="Iron Tail"),
+        Move(index=0x00E8, name="Metal Claw"),
+        Move(index=0x00E9, name="Vital Throw"),
+        Move(index=0x00EA, name="Morning Sun"),
+        Move(index=0x00EB, name="Synthesis"),
+        Move(index=0x00EC, name="Moonlight"),
+        Move(index=0x00ED, name="Hidden Power"),
+        Move(index=0x00EE, name="Cross Chop"),
+        Move(index=0x00EF, name="Twister"),
+        Move(index=0x00F0, name="Rain Dance"),
+        Move(index=0x00F1, name="Sunny Day"),
+        Move(index=0x00F2, name="Crunch"),
+        Move(index=0x00F3, name="Mirror Coat"),
+        Move(index=0x00F4, name="Psych Up"),
+        Move(index=0x00F5, name="Extreme Speed"),
+        Move(index=0x00F6, name="Ancient Power"),
+        Move(index=0x00F7, name="Shadow Ball"),
+        Move(index=0x00F8, name="Future Sight"),
+        Move(index=0x00F9, name="Rock Smash"),
+        Move(index=0x00FA, name="Whirlpool"),
+        Move(index=0x00FB, name="Beat Up"),
+        Move(index=0x00FC, name="Fake Out"),
+        Move(index=0x00FD, name="Uproar"),
+        Move(index=0x00FE, name="Stockpile"),
+        Move(index=0x00FF, name="Spit Up"),
+        Move(index=0x0100, name="Swallow"),
+        Move(index=0x0101, name="Heat Wave"),
+        Move(index=0x0102, name="Hail"),
+        Move(index=0x0103, name="Torment"),
+        Move(index=0x0104, name="Flatter"),
+        Move(index=0x0105, name="Will-O-Wisp"),
+        Move(index=0x0106, name="Memento"),
+        Move(index=0x0107, name="Facade"),
+        Move(index=0x0108, name="Focus Punch"),
+        Move(index=0x0109, name="Smelling Salts"),
+        Move(index=0x010A, name="Follow Me"),
+        Move(index=0x010B, name="Nature Power"),
+        Move(index=0x010C, name="Charge"),
+        Move(index=0x010D, name="Taunt"),
+        Move(index=0x010E, name="Helping Hand"),
+        Move(index=0x010F, name="Trick"),
+        Move(index=0x0110, name="Role Play"),
+        Move(index=0x0111, name="Wish"),
+        Move(index=0x0112, name="Assist"),
+        Move(index=0x0113, name="Ingrain"),
+        Move(index=0x0114, name="Superpower"),
+        Move(index=0x0115, name="Magic Coat"),
+        Move(index=0x0116, name="Recycle"),
+        Move(index=0x0117, name="Revenge"),
+        Move(index=0x0118, name="Brick Break"),
+        Move(index=0x0119, name="Yawn"),
+        Move(index=0x011A, name="Knock Off"),
+        Move(index=0x011B, name="Endeavor"),
+        Move(index=0x011C, name="Eruption"),
+        Move(index=0x011D, name="Skill Swap"),
+        Move(index=0x011E, name="Imprison"),
+        Move(index=0x011F, name="Refresh"),
+        Move(index=0x0120, name="Grudge"),
+        Move(index=0x0121, name="Snatch"),
+        Move(index=0x0122, name="Secret Power"),
+        Move(index=0x0123, name="Dive"),
+        Move(index=0x0124, name="Arm Thrust"),
+        Move(index=0x0125, name="Camouflage"),
+        Move(index=0x0126, name="Tail Glow"),
+        Move(index=0x0127, name="Luster Purge"),
+        Move(index=0x0128, name="Mist Ball"),
+        Move(index=0x0129, name="Feather Dance"),
+        Move(index=0x012A, name="Teeter Dance"),
+        Move(index=0x012B, name="Blaze Kick"),
+        Move(index=0x012C, name="Mud Sport"),
+        Move(index=0x012D, name="Ice Ball"),
+        Move(index=0x012E, name="Needle Arm"),
+        Move(index=0x012F, name="Slack Off"),
+        Move(index=0x0130, name="Hyper Voice"),
+        Move(index=0x0131, name="Poison Fang"),
+        Move(index=0x0132, name="Crush Claw"),
+        Move(index=0x0133, name="Blast Burn"),
+        Move(index=0x0134, name="Hydro Cannon"),
+        Move(index=0x0135, name="Meteor Mash"),
+        Move(index=0x0136, name="Astonish"),
+        Move(index=0x0137, name="Weather Ball"),
+        Move(index=0x0138, name="Aromatherapy"),
+        Move(index=0x0139, name="Fake Tears"),
+        Move(index=0x013A, name="Air Cutter"),
+        Move(index=0x013B, name="Overheat"),
+        Move(index=0x013C, name="Odor Sleuth"),
+        Move(index=0x013D, name="Rock Tomb"),
+        Move(index=0x013E, name="Silver Wind"),
+        Move(index=0x013F, name="Metal Sound"),
+        Move(index=0x0140, name="Grass Whistle"),
+        Move(index=0x0141, name="Tickle"),
+        Move(index=0x0142, name="Cosmic Power"),
+        Move(index=0x0143, name="Water Spout"),
+        Move(index=0x0144, name="Signal Beam"),
+        Move(index=0x0145, name="Shadow Punch"),
+        Move(index=0x0146, name="Extrasensory"),
+        Move(index=0x0147, name="Sky Uppercut"),
+        Move(index=0x0148, name="Sand Tomb"),
+        Move(index=0x0149, name="Sheer Cold"),
+        Move(index=0x014A, name="Muddy Water"),
+        Move(index=0x014B, name="Bullet Seed"),
+        Move(index=0x014C, name="Aerial Ace"),
+        Move(index=0x014D, name="Icicle Spear"),
+        Move(index=0x014E, name="Iron Defense"),
+        Move(index=0x014F, name="Block"),
+        Move(index=0x0150, name="Howl"),
+        Move(index=0x0151, name="Dragon Claw"),
+        Move(index=0x0152, name="Frenzy Plant"),
+        Move(index=0x0153, name="Bulk Up"),
+        Move(index=0x0154, name="Bounce"),
+        Move(index=0x0155, name="Mud Shot"),
+        Move(index=0x0156, name="Poison Tail"),
+        Move(index=0x0157, name="Covet"),
+        Move(index=0x0158, name="Volt Tackle"),
+        Move(index=0x0159, name="Magical Leaf"),
+        Move(index=0x015A, name="Water Sport"),
+        Move(index=0x015B, name="Calm Mind"),
+        Move(index=0x015C, name="Leaf Blade"),
+        Move(index=0x015D, name="Dragon Dance"),
+        Move(index=0x015E, name="Rock Blast"),
+        Move(index=0x015F, name="Shock Wave"),
+        Move(index=0x0160, name="Water Pulse"),
+        Move(index=0x0161, name="Doom Desire"),
+        Move(index=0x0162, name="Psycho Boost"),
+    ),
 )
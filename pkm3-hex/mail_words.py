@@ -1,9 +1,11 @@
+import itertools
 import json
 import os
 import textwrap
+from contextlib import contextmanager
 from enum import StrEnum
 from pathlib import Path
-from typing import IO, Optional, cast
+from typing import IO, Iterable, Iterator, Optional, cast
 
 import typer
 from rich.columns import Columns
@@ -15,24 +17,43 @@ from .data import easy_chat
 from .utils import (
     GameSaveBlock,
     MailWords,
+    MailWordsCache,
+    MailWordsCost,
     PcPkm,
     PkmJSONSerializer,
     PkmSubstructuresOrder,
+    dump_json_lines,
+    encode_json,
     format_hex,
+    load_json_lines,
     pretty_print,
 )
 
 app = typer.Typer()
 
+jobs_opt = typer.Option(default=1, min=1)
+
+
+class WordsInputFormat(StrEnum):
+    JSON = "json"
+    JSON_LINES = "jsonl"
+
 
 class WordsOutputFormat(StrEnum):
     JSON = "json"
+    JSON_LINES = "jsonl"
     PRETTY = "pretty"
 
 
 class PkmOutputFormat(StrEnum):
     BINARY = "binary"
     PRETTY = "pretty"
+    SAVE = "save"
+
+
+class SlotsOutputFormat(StrEnum):
+    JSON_LINES = "jsonl"
+    PRETTY = "pretty"
 
 
 @app.command()
@@ -41,19 +62,78 @@ def apply(
     save_file: Optional[typer.FileBinaryRead] = None,
     box_pos: Optional[tuple[int, int, int]] = None,
     words_file: Optional[typer.FileText] = None,
+    words_format: WordsInputFormat = WordsInputFormat.JSON,
     output_file: Path = Path("-"),
     output_format: Optional[PkmOutputFormat] = PkmOutputFormat.PRETTY,
 ) -> None:
-    (pkm_bytes, is_encrypted) = get_pkm_bytes(pkm_bytes_file, save_file, box_pos)
-    words = cast(MailWords, json.load(words_file, cls=PkmJSONSerializer))
-    pkm = words.apply_to_pkm(pkm_bytes, is_encrypted=is_encrypted)
+    all_words = read_words(words_file, words_format)
+    if output_format == PkmOutputFormat.SAVE:
+        apply_to_save(save_file, box_pos, single_words(all_words), output_file)
+        return
 
+    # Each set of words is applied to the original Pokémon, and the results
+    # are written one after the other as they're read
+    (pkm_bytes, is_encrypted) = get_pkm_bytes(pkm_bytes_file, save_file, box_pos)
     write_mode = "wb" if output_format == PkmOutputFormat.BINARY else "w"
     with typer.open_file(output_file, mode=write_mode) as output:
-        if output_format == PkmOutputFormat.BINARY:
-            output.write(pkm.data)
-        else:
-            pretty_print.pkm(pkm, output)
+        for words in all_words:
+            pkm = words.apply_to_pkm(pkm_bytes, is_encrypted=is_encrypted)
+            if output_format == PkmOutputFormat.BINARY:
+                output.write(pkm.data)
+            else:
+                pretty_print.pkm(pkm, output)
+
+
+def read_words(
+    words_file: Optional[typer.FileText], words_format: WordsInputFormat
+) -> Iterator[MailWords]:
+    if words_file is None:
+        raise typer.BadParameter(
+            "missing option --words-file.", param_hint="--words-file"
+        )
+    if words_format == WordsInputFormat.JSON_LINES:
+        return cast(Iterator[MailWords], load_json_lines(words_file))
+
+    # A list holds all the sets of words, as written by order
+    words = json.load(words_file, cls=PkmJSONSerializer)
+    return iter(words if isinstance(words, list) else [words])
+
+
+def single_words(all_words: Iterator[MailWords]) -> MailWords:
+    words = next(all_words, None)
+    if words is None or next(all_words, None) is not None:
+        raise typer.BadParameter(
+            f"expected exactly one set of words.{os.linesep}"
+            "Only one set of words can be applied with --output-format save.",
+            param_hint="--words-file",
+        )
+    return words
+
+
+def apply_to_save(
+    save_file: Optional[typer.FileBinaryRead],
+    box_pos: Optional[tuple[int, int, int]],
+    words: MailWords,
+    output_file: Path,
+):
+    if save_file is None or box_pos is None:
+        raise typer.BadParameter(
+            f"missing option --save-file or --box-pos.{os.linesep}"
+            "Options --save-file and --box-pos are mandatory with "
+            "--output-format save.",
+            param_hint=["--save-file", "--box-pos"],
+        )
+
+    box, row, col = box_pos
+    save_block = GameSaveBlock.from_file(save_file)
+    pkm_bytes = save_block.raw_pkm_bytes(box - 1, row - 1, col - 1)
+    pkm = words.apply_to_pkm(pkm_bytes, is_encrypted=True)
+    save_block.set_pkm(box - 1, row - 1, col - 1, pkm)
+
+    # Serialized before opening, in case the output is the input file
+    save_bytes = save_block.to_bytes()
+    with typer.open_file(output_file, mode="wb") as output:
+        output.write(save_bytes)
 
 
 @app.command()
@@ -62,10 +142,28 @@ def check(
     save_file: Optional[typer.FileBinaryRead] = None,
     box_pos: Optional[tuple[int, int, int]] = None,
     output_file: typer.FileTextWrite = std_stream_default_opt,
+    jobs: int = jobs_opt,
+    cache: bool = False,
+    scroll_distance_cost: int = 1,
+    changed_word_cost: int = 0,
+    unlocked_category: Optional[list[str]] = None,
+    locked_category_cost: Optional[int] = None,
+    max_cost: Optional[int] = None,
 ):
+    cost = make_cost(
+        scroll_distance_cost,
+        changed_word_cost,
+        unlocked_category,
+        locked_category_cost,
+        max_cost,
+    )
     (pkm_bytes, is_encrypted) = get_pkm_bytes(pkm_bytes_file, save_file, box_pos)
     pkm = PcPkm.from_bytes(pkm_bytes, xor_substructures=is_encrypted)
-    mail_words = list(MailWords.find_for_pkm(pkm))
+    with open_cache(cache) as words_cache:
+        best_per_order = MailWords.best_per_order(
+            pkm, jobs=jobs, cache=words_cache, cost=cost
+        )
+    mail_words = [words for best in best_per_order.values() for words in best]
 
     if not mail_words:
         print(
@@ -82,6 +180,71 @@ def check(
     print_words(mail_words, output_file, with_substructure_order=True)
 
 
+@app.command()
+def check_all(
+    save_file: typer.FileBinaryRead = std_stream_default_opt,
+    output_file: typer.FileTextWrite = std_stream_default_opt,
+    output_format: SlotsOutputFormat = SlotsOutputFormat.PRETTY,
+    jobs: int = jobs_opt,
+    cache: bool = False,
+    scroll_distance_cost: int = 1,
+    changed_word_cost: int = 0,
+    unlocked_category: Optional[list[str]] = None,
+    locked_category_cost: Optional[int] = None,
+    max_cost: Optional[int] = None,
+):
+    cost = make_cost(
+        scroll_distance_cost,
+        changed_word_cost,
+        unlocked_category,
+        locked_category_cost,
+        max_cost,
+    )
+    save_block = GameSaveBlock.from_file(save_file)
+    occupied_slots = [
+        ((box, row + 1, col + 1), pkm)
+        for box, box_data in enumerate(save_block.pc.boxes, start=1)
+        for (row, col), pkm in box_data.items()
+    ]
+
+    with open_cache(cache) as words_cache:
+        best_per_slot = MailWords.best_per_order_for_each(
+            (pkm for _, pkm in occupied_slots),
+            jobs=jobs,
+            cache=words_cache,
+            cost=cost,
+        )
+        slots = (
+            (position, pkm, best_per_order)
+            for (position, pkm), best_per_order in zip(occupied_slots, best_per_slot)
+        )
+        print_slots_report(slots, output_file, output_format)
+
+
+def print_slots_report(
+    slots: Iterable[tuple[tuple[int, int, int], PcPkm, dict[str, list[MailWords]]]],
+    output_file: IO[str],
+    output_format: SlotsOutputFormat,
+):
+    if output_format == SlotsOutputFormat.JSON_LINES:
+        for (box, row, col), pkm, best_per_order in slots:
+            record = {
+                "box": box,
+                "row": row,
+                "col": col,
+                "personality_value": pkm.personality_value,
+                "original_trainer_id": pkm.original_trainer_id,
+                "substructure_order": pkm.substructure_order.name,
+                "scroll_distances": {
+                    order: words.scroll_distance
+                    for order, [words] in best_per_order.items()
+                },
+            }
+            output_file.write(encode_json(record) + "\n")
+    else:
+        print_slots(slots, output_file)
+
+
 @app.command()
 def order(
     order: PkmSubstructuresOrder,
@@ -91,16 +254,38 @@ def order(
     output_file: typer.FileTextWrite = std_stream_default_opt,
     output_format: WordsOutputFormat = WordsOutputFormat.PRETTY,
     limit: Optional[int] = None,
+    jobs: int = jobs_opt,
+    cache: bool = False,
+    scroll_distance_cost: int = 1,
+    changed_word_cost: int = 0,
+    unlocked_category: Optional[list[str]] = None,
+    locked_category_cost: Optional[int] = None,
+    max_cost: Optional[int] = None,
 ):
+    cost = make_cost(
+        scroll_distance_cost,
+        changed_word_cost,
+        unlocked_category,
+        locked_category_cost,
+        max_cost,
+    )
     (pkm_bytes, is_encrypted) = get_pkm_bytes(pkm_bytes_file, save_file, box_pos)
     pkm = PcPkm.from_bytes(pkm_bytes, xor_substructures=is_encrypted)
-    mail_words = sorted(
-        MailWords.find_for_substructure_order(pkm, order),
-        key=lambda w: w.scroll_distance,
-    )[:limit]
+    if output_format == WordsOutputFormat.JSON_LINES and jobs == 1 and not cache:
+        # Written as the search finds them, best first
+        found = MailWords.find_for_substructure_order(pkm, order, cost=cost)
+        dump_json_lines(itertools.islice(found, limit), output_file)
+        return
 
-    if output_format == WordsOutputFormat.JSON:
-        json.dump(mail_words, output_file, cls=PkmJSONSerializer)
+    with open_cache(cache) as words_cache:
+        mail_words = MailWords.best_for_order(
+            pkm, order, limit, jobs=jobs, cache=words_cache, cost=cost
+        )
+
+    if output_format == WordsOutputFormat.JSON_LINES:
+        dump_json_lines(mail_words, output_file)
+    elif output_format == WordsOutputFormat.JSON:
+        output_file.write(encode_json(mail_words))
     else:
         if not mail_words:
             print(
@@ -118,11 +303,49 @@ def order(
         print_words(mail_words, output_file, with_substructure_order=False)
 
 
+@contextmanager
+def open_cache(enabled: bool) -> Iterator[Optional[MailWordsCache]]:
+    if not enabled:
+        yield None
+        return
+
+    with MailWordsCache() as cache:
+        yield cache
+    typer.echo(f"Mail words cache: {cache.hits} hits, {cache.misses} misses", err=True)
+
+
+def make_cost(
+    scroll_distance_cost: int,
+    changed_word_cost: int,
+    unlocked_category: Optional[list[str]],
+    locked_category_cost: Optional[int],
+    max_cost: Optional[int],
+) -> MailWordsCost:
+    unlocked_categories = None
+    if unlocked_category:
+        unlocked_categories = frozenset(name.upper() for name in unlocked_category)
+        categories = easy_chat.Word.Category.__members__
+        if unknown := sorted(unlocked_categories - categories.keys()):
+            raise typer.BadParameter(
+                f"unknown easy chat categories: {', '.join(unknown)}.{os.linesep}"
+                f"Valid categories are: {', '.join(categories).lower()}.",
+                param_hint="--unlocked-category",
+            )
+
+    return MailWordsCost(
+        scroll_distance=scroll_distance_cost,
+        changed_word=changed_word_cost,
+        locked_category=locked_category_cost,
+        unlocked_categories=unlocked_categories,
+        max_cost=max_cost,
+    )
+
+
 def get_pkm_bytes(
     pkm_bytes_file: Optional[typer.FileBinaryRead],
     save_file: Optional[typer.FileBinaryRead],
     box_pos: Optional[tuple[int, int, int]],
-) -> tuple[bytes, bool]:
+) -> tuple[bytes | memoryview, bool]:
     match (pkm_bytes_file, save_file):
         case (None, None):
             raise typer.BadParameter(
@@ -143,8 +366,8 @@ def get_pkm_bytes(
                     param_hint=["--save-file", "--box-pos"],
                 )
             box, row, col = box_pos
-            save_block = GameSaveBlock.from_bytes(save.read())
-            return (save_block.pc.boxes[box - 1].raw_pkm_bytes(row - 1, col - 1), True)
+            save_block = GameSaveBlock.from_file(save)
+            return (save_block.raw_pkm_bytes(box - 1, row - 1, col - 1), True)
 
         case (_, _):
             raise typer.BadParameter(
@@ -164,6 +387,28 @@ def print_words(
     console.print(Columns(mail_word_tables, padding=(1, 1)))
 
 
+def print_slots(
+    slots: Iterable[tuple[tuple[int, int, int], PcPkm, dict[str, list[MailWords]]]],
+    output: IO[str],
+):
+    table = Table("Box", "Row", "Col", "Species", "Order", "Reachable orders")
+    for (box, row, col), pkm, best_per_order in slots:
+        reachable_orders = ", ".join(
+            f"{order} ({words.scroll_distance})"
+            for order, [words] in best_per_order.items()
+        )
+        table.add_row(
+            str(box),
+            str(row),
+            str(col),
+            pkm.growth.species.name,
+            pkm.substructure_order.name,
+            reachable_orders or "-",
+        )
+    console = Console(file=output)
+    console.print(table)
+
+
 def make_mail_words_table(words: MailWords, with_substructure_order: bool) -> Table:
     title = words.substructures_order.name if with_substructure_order else None
     table = Table(title=title, show_header=False, show_lines=True)
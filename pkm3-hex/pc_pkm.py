@@ -1,11 +1,17 @@
+from enum import StrEnum
+
 import typer
 
-from . import std_stream_default_arg
-from .utils import GameSaveBlock, pretty_print
+from . import std_stream_default_arg, std_stream_default_opt
+from .utils import GameSaveBlock, PcPkm, PcPkmPack, expand_save_paths, pretty_print
 
 app = typer.Typer()
 
 
+class ExportFormat(StrEnum):
+    PACKED = "packed"
+
+
 @app.command()
 def dump(
     box: int,
@@ -15,17 +21,30 @@ def dump(
     save_file: typer.FileBinaryRead = std_stream_default_arg,
     output_file: typer.FileBinaryWrite = std_stream_default_arg,
 ):
-    save_block = GameSaveBlock.from_bytes(save_file.read())
-    box_data = save_block.pc.boxes[box - 1]
-    row_index, col_index = row - 1, col - 1
-    pkm_bytes = (
-        box_data[row_index, col_index].data
-        if decrypt
-        else box_data.raw_pkm_bytes(row_index, col_index)
+    save_block = GameSaveBlock.from_file(save_file)
+    pkm_bytes: bytes | bytearray | memoryview = save_block.raw_pkm_bytes(
+        box - 1, row - 1, col - 1
     )
+    if decrypt:
+        pkm_bytes = PcPkm.from_bytes(pkm_bytes, xor_substructures=True).data
     output_file.write(pkm_bytes)
 
 
+@app.command()
+def export(
+    paths: list[str],
+    output_file: typer.FileBinaryWrite = std_stream_default_opt,
+    format: ExportFormat = ExportFormat.PACKED,
+    jobs: int = typer.Option(default=1, min=1),
+):
+    save_paths = expand_save_paths(paths)
+    errors = PcPkmPack.write(output_file, save_paths, jobs=jobs)
+    for save_path, error in errors:
+        typer.echo(f"{save_path}: {error}", err=True)
+    if errors:
+        raise typer.Exit(1)
+
+
 @app.command()
 def show(
     box: int,
@@ -34,6 +53,7 @@ def show(
     save_file: typer.FileBinaryRead = std_stream_default_arg,
     output_file: typer.FileTextWrite = std_stream_default_arg,
 ):
-    save_block = GameSaveBlock.from_bytes(save_file.read())
-    pkm = save_block.pc.boxes[box - 1][row - 1, col - 1]
+    save_block = GameSaveBlock.from_file(save_file)
+    pkm_bytes = save_block.raw_pkm_bytes(box - 1, row - 1, col - 1)
+    pkm = PcPkm.from_bytes(pkm_bytes, xor_substructures=True)
     pretty_print.pkm(pkm, output_file)
@@ -0,0 +1,13 @@
+import typer
+
+from . import std_stream_default_opt
+from .utils import encode_json, scan_saves
+
+
+def scan(
+    paths: list[str],
+    output_file: typer.FileTextWrite = std_stream_default_opt,
+    jobs: int = typer.Option(default=1, min=1),
+):
+    for record in scan_saves(paths, jobs=jobs):
+        output_file.write(encode_json(record) + "\n")
@@ -1,10 +1,15 @@
+import functools
 import itertools
-from dataclasses import dataclass
+import mmap
+import struct
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal, Self
+from pathlib import Path
+from typing import BinaryIO, Iterator, Literal, Optional, Self
 
-from .bytes_handling import read_int
-from .Pkm import PcPkm
+from .bytes_handling import map_file, map_path, read_int
+from .optional_module import optional_module
+from .Pkm import PcPkm, PcPkmColumns
 
 
 @dataclass
@@ -33,7 +38,7 @@ class Section:
             self.size = size
             return self
 
-    data: bytes
+    data: memoryview
     type: Type
     checksum: int
     signature: int
@@ -46,32 +51,49 @@ class Section:
     SAVE_INDEX_OFFSET = 0x0FFC
     SAVE_INDEX_SIZE = 4
 
+    SIGNATURE = 0x08_01_20_25
+
+    # ID, checksum, signature, save index
+    FOOTER = struct.Struct("<HHII")
+
     @property
     def is_pc_start(self) -> bool:
         return self.type == self.Type.PC_A
 
+    def compute_checksum(self) -> int:
+        words = struct.unpack(f"<{len(self.data) // 4}I", self.data)
+        return self.fold_checksum(sum(words))
+
+    @staticmethod
+    def fold_checksum(words_sum: int) -> int:
+        words_sum &= 0xFF_FF_FF_FF
+        return ((words_sum >> 16) + words_sum) & 0xFF_FF
+
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
-        type = cls.Type(read_int(buffer[cls.ID_OFFSET : cls.CHECKSUM_OFFSET]))
+    def from_bytes(cls, buffer: memoryview) -> Self:
+        id, checksum, signature, save_index = cls.FOOTER.unpack_from(
+            buffer, cls.ID_OFFSET
+        )
+        type = cls.Type(id)
         return cls(
             data=buffer[cls.DATA_OFFSET : type.size],
             type=type,
-            checksum=read_int(buffer[cls.CHECKSUM_OFFSET : cls.SIGNATURE_OFFSET]),
-            signature=read_int(buffer[cls.SIGNATURE_OFFSET : cls.SAVE_INDEX_OFFSET]),
-            save_index=read_int(buffer[cls.SAVE_INDEX_OFFSET :]),
+            checksum=checksum,
+            signature=signature,
+            save_index=save_index,
         )
 
 
 @dataclass
 class Pc:
     class Box:
-        _pkm: bytes
+        _pkm: memoryview
 
         ROWS = 5
         COLS = 6
         SIZE = PcPkm.SIZE * ROWS * COLS
 
-        def __init__(self, buffer: bytes):
+        def __init__(self, buffer: memoryview):
             self._pkm = buffer
 
         def __getitem__(self, pos: tuple[int, int]) -> PcPkm:
@@ -80,8 +102,19 @@ class Pc:
                 self.raw_pkm_bytes(row, col), xor_substructures=True
             )
 
-        def raw_pkm_bytes(self, row: int, col: int) -> bytes:
-            start = row * self.COLS + col * PcPkm.SIZE
+        def decode_all(self) -> PcPkmColumns:
+            return PcPkmColumns.from_bytes(self._pkm)
+
+        def items(self) -> Iterator[tuple[tuple[int, int], PcPkm]]:
+            for row, col in itertools.product(range(self.ROWS), range(self.COLS)):
+                if not self.is_empty(row, col):
+                    yield (row, col), self[row, col]
+
+        def is_empty(self, row: int, col: int) -> bool:
+            return not any(self.raw_pkm_bytes(row, col))
+
+        def raw_pkm_bytes(self, row: int, col: int) -> memoryview:
+            start = (row * self.COLS + col) * PcPkm.SIZE
             return self._pkm[start : start + PcPkm.SIZE]
 
     current_box: int
@@ -97,23 +130,29 @@ class Pc:
     BOX_NAME_SIZE = 9
 
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
+    def pkm_offset(cls, box: int, row: int, col: int) -> int:
+        slot = (box * cls.Box.ROWS + row) * cls.Box.COLS + col
+        return cls.PKMN_OFFSET + slot * PcPkm.SIZE
+
+    def decode_all(self) -> PcPkmColumns:
+        # Positions are box * Box.ROWS * Box.COLS + row * Box.COLS + col
+        return PcPkmColumns.from_bytes(b"".join(box._pkm for box in self.boxes))
+
+    @classmethod
+    def from_bytes(cls, buffer: memoryview) -> Self:
         return cls(
             current_box=read_int(buffer[cls.CURRENT_BOX_OFFSET : cls.PKMN_OFFSET]),
             boxes=[
-                cls.Box(bytes(b))
-                for b in itertools.batched(
-                    buffer[cls.PKMN_OFFSET : cls.BOX_NAMES_OFFSET], cls.Box.SIZE
-                )
+                cls.Box(buffer[start : start + cls.Box.SIZE])
+                for start in range(cls.PKMN_OFFSET, cls.BOX_NAMES_OFFSET, cls.Box.SIZE)
             ],
             box_names=[
-                bytes(name)
-                for name in itertools.batched(
-                    buffer[cls.BOX_NAMES_OFFSET : cls.WALLPAPERS_OFFSET],
-                    cls.BOX_NAME_SIZE,
+                bytes(buffer[start : start + cls.BOX_NAME_SIZE])
+                for start in range(
+                    cls.BOX_NAMES_OFFSET, cls.WALLPAPERS_OFFSET, cls.BOX_NAME_SIZE
                 )
             ],
-            wallpapers=buffer[cls.WALLPAPERS_OFFSET :],
+            wallpapers=bytes(buffer[cls.WALLPAPERS_OFFSET :]),
         )
 
 
@@ -122,7 +161,20 @@ class GameSaveBlock:
     type Slot = Literal["A", "B"]
 
     slot: Slot
-    pc: Pc
+    _save_file: memoryview = field(repr=False)
+
+    # Edits go to a private copy of the save, and the checksums of the
+    # sections they touch are recomputed once, when the save is written.
+    _is_copy: bool = field(default=False, repr=False, compare=False)
+    _edited_sections: set[Section.Type] = field(
+        default_factory=set, repr=False, compare=False
+    )
+
+    # Positions of the sections of each slot that failed validation, if the
+    # save was validated when loaded
+    corrupt_sections: Optional[dict[Slot, list[int]]] = field(
+        default=None, compare=False
+    )
 
     A_BLOCK_OFFSET = 0x000000
     B_BLOCK_OFFSET = 0x00E000
@@ -131,39 +183,185 @@ class GameSaveBlock:
     SECTION_COUNT = 14
     SECTION_SIZE = 4 * (2**10)
 
+    PC_SECTION_TYPES = [
+        Section.Type(id)
+        for id in range(Section.Type.PC_A.value, Section.Type.PC_I.value + 1)
+    ]
+
+    @functools.cached_property
+    def section_offsets(self) -> dict[Section.Type, int]:
+        # Sections are rotated on every save, so they're indexed by their ID
+        return {
+            Section.Type(
+                read_int(
+                    self._slot_bytes[
+                        start + Section.ID_OFFSET : start + Section.CHECKSUM_OFFSET
+                    ]
+                )
+            ): start
+            for start in range(0, self.BLOCK_SIZE, self.SECTION_SIZE)
+        }
+
+    @functools.cached_property
+    def pc(self) -> Pc:
+        # Pokémon records straddle section boundaries, so the PC sections have
+        # to be joined. That is the only copy: everything else is a view.
+        pc_bytes = b"".join(self.section(type).data for type in self.PC_SECTION_TYPES)
+        return Pc.from_bytes(memoryview(pc_bytes))
+
+    def section(self, type: Section.Type) -> Section:
+        start = self.section_offsets[type]
+        return Section.from_bytes(self._slot_bytes[start : start + self.SECTION_SIZE])
+
+    def raw_pkm_bytes(self, box: int, row: int, col: int) -> bytes | memoryview:
+        start = Pc.pkm_offset(box, row, col)
+        views = [view for _, view in self._pc_views(start, start + PcPkm.SIZE)]
+
+        # Only records split across two sections need to be copied
+        return views[0] if len(views) == 1 else b"".join(views)
+
+    def set_pkm(self, box: int, row: int, col: int, pkm: PcPkm) -> None:
+        self.set_raw_pkm_bytes(box, row, col, pkm.to_bytes())
+
+    def set_raw_pkm_bytes(self, box: int, row: int, col: int, pkm_bytes: bytes):
+        if not self._is_copy:
+            self._save_file = memoryview(bytearray(self._save_file))
+            self._is_copy = True
+
+        start = Pc.pkm_offset(box, row, col)
+        written = 0
+        for type, view in self._pc_views(start, start + PcPkm.SIZE):
+            view[:] = pkm_bytes[written : written + len(view)]
+            written += len(view)
+            self._edited_sections.add(type)
+        self.__dict__.pop("pc", None)
+
+    def update_checksums(self) -> None:
+        for type in self._edited_sections:
+            start = self.section_offsets[type] + Section.CHECKSUM_OFFSET
+            checksum = self.section(type).compute_checksum()
+            self._slot_bytes[start : start + 2] = checksum.to_bytes(
+                length=2, byteorder="little"
+            )
+        self._edited_sections.clear()
+
+    def to_bytes(self) -> bytes:
+        self.update_checksums()
+        return bytes(self._save_file)
+
+    @property
+    def _slot_bytes(self) -> memoryview:
+        start = self.A_BLOCK_OFFSET if self.slot == "A" else self.B_BLOCK_OFFSET
+        return self._save_file[start : start + self.BLOCK_SIZE]
+
+    def _pc_views(
+        self, start: int, end: int
+    ) -> Iterator[tuple[Section.Type, memoryview]]:
+        section_start = 0
+        for type in self.PC_SECTION_TYPES:
+            section_end = section_start + type.size
+            if start < section_end and section_start < end:
+                # Where PC offset 0 would be if this section started the PC
+                base = self.section_offsets[type] + Section.DATA_OFFSET - section_start
+                view_start = base + max(start, section_start)
+                view_end = base + min(end, section_end)
+                yield type, self._slot_bytes[view_start:view_end]
+            section_start = section_end
+
     @classmethod
-    def from_bytes(cls, save_file: bytes) -> Self:
-        (slot_bytes, slot) = cls._find_slot(save_file)
-        sections = [
-            Section.from_bytes(bytes(section_bytes))
-            for section_bytes in itertools.batched(slot_bytes, cls.SECTION_SIZE)
-        ]
+    def from_bytes(
+        cls, save_file: bytes | mmap.mmap, *, validate: bool = False
+    ) -> Self:
+        save_file_view = memoryview(save_file)
+        slot = cls._find_slot(save_file_view)
+        if not validate:
+            return cls(slot, save_file_view)
+
+        # Like the game, fall back to the older slot if the newest is damaged
+        corrupt_sections = cls.validate(save_file_view)
+        other_slot: GameSaveBlock.Slot = "B" if slot == "A" else "A"
+        if corrupt_sections[slot] and not corrupt_sections[other_slot]:
+            slot = other_slot
+        return cls(slot, save_file_view, corrupt_sections=corrupt_sections)
+
+    @classmethod
+    def from_file(cls, save_file: BinaryIO, *, validate: bool = False) -> Self:
+        return cls.from_bytes(map_file(save_file), validate=validate)
+
+    @classmethod
+    def open(cls, path: Path, *, validate: bool = False) -> Self:
+        return cls.from_bytes(map_path(path), validate=validate)
 
-        pc_sections = itertools.islice(
-            itertools.dropwhile(lambda s: not s.is_pc_start, itertools.cycle(sections)),
-            0,
-            Section.Type.PC_I.value - Section.Type.PC_A.value + 1,
+    @classmethod
+    def validate(
+        cls, save_file: bytes | mmap.mmap | memoryview
+    ) -> dict[Slot, list[int]]:
+        save_file_view = memoryview(save_file)
+        section_starts = range(
+            cls.A_BLOCK_OFFSET, cls.B_BLOCK_OFFSET + cls.BLOCK_SIZE, cls.SECTION_SIZE
         )
+        footers = [
+            Section.FOOTER.unpack_from(save_file_view, start + Section.ID_OFFSET)
+            for start in section_starts
+        ]
+        types = [
+            Section.Type(id) if id < len(Section.Type) else None
+            for id, _, _, _ in footers
+        ]
+
+        # Sections with an unknown ID are corrupt whatever their checksum
+        data_sizes = [Section.Type.PC_I.size if t is None else t.size for t in types]
+        checksums = cls._section_checksums(save_file_view, data_sizes)
+
+        corrupt_sections: dict[GameSaveBlock.Slot, list[int]] = {"A": [], "B": []}
+        slot_starts: list[tuple[GameSaveBlock.Slot, int]] = [
+            ("A", 0),
+            ("B", cls.SECTION_COUNT),
+        ]
+        for slot, first in slot_starts:
+            slot_types = types[first : first + cls.SECTION_COUNT]
+            for position, type in enumerate(slot_types):
+                _, checksum, signature, _ = footers[first + position]
+                if (
+                    type is None
+                    or slot_types.count(type) > 1
+                    or signature != Section.SIGNATURE
+                    or checksum != checksums[first + position]
+                ):
+                    corrupt_sections[slot].append(position)
+        return corrupt_sections
 
-        pc_bytes = bytes(
-            itertools.chain.from_iterable(pc_section.data for pc_section in pc_sections)
+    @classmethod
+    def _section_checksums(
+        cls, save_file: memoryview, data_sizes: list[int]
+    ) -> list[int]:
+        game_save_block_vectorized = optional_module(
+            ".game_save_block_vectorized", __package__
         )
+        if game_save_block_vectorized is not None:
+            return game_save_block_vectorized.section_checksums(
+                save_file, section_size=cls.SECTION_SIZE, data_sizes=data_sizes
+            )
 
-        return cls(slot, pc=Pc.from_bytes(pc_bytes))
+        return [
+            Section.fold_checksum(
+                sum(
+                    struct.unpack_from(
+                        f"<{data_size // 4}I", save_file, index * cls.SECTION_SIZE
+                    )
+                )
+            )
+            for index, data_size in enumerate(data_sizes)
+        ]
 
     @classmethod
-    def _find_slot(cls, save_file: bytes) -> tuple[bytes, Slot]:
+    def _find_slot(cls, save_file: memoryview) -> Slot:
         save_index_a = cls._save_index(cls.A_BLOCK_OFFSET, save_file)
         save_index_b = cls._save_index(cls.B_BLOCK_OFFSET, save_file)
-        start, slot = (
-            (cls.A_BLOCK_OFFSET, "A")
-            if save_index_a > save_index_b
-            else (cls.B_BLOCK_OFFSET, "B")
-        )
-        return save_file[start : start + cls.BLOCK_SIZE], slot
+        return "A" if save_index_a > save_index_b else "B"
 
     @classmethod
-    def _save_index(cls, block_start: int, save_file: bytes) -> int:
+    def _save_index(cls, block_start: int, save_file: memoryview) -> int:
         last_section_offset = cls.SECTION_SIZE * (cls.SECTION_COUNT - 1)
         start = block_start + last_section_offset + Section.SAVE_INDEX_OFFSET
         save_index_bytes = save_file[start : start + Section.SAVE_INDEX_SIZE]
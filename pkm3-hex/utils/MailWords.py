@@ -1,11 +1,33 @@
+import bisect
+import functools
+import heapq
 import itertools
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterator, Self
+from typing import Iterable, Iterator, NamedTuple, Optional, Self
 
 from ..data import easy_chat
+from .MailWordsCache import Combination, MailWordsCache
+from .MailWordsCost import MailWordsCost
+from .optional_module import optional_module
 from .Pkm import PcPkm, PkmSubstructuresOrder
 
 
+class _WordPair(NamedTuple):
+    cost: int
+    pv: int
+    tid: int
+
+
+type _WordPairsByResidue = dict[int, list[_WordPair]]
+
+
+class _WordPairs(NamedTuple):
+    high: _WordPairsByResidue
+    low: _WordPairsByResidue
+    original: tuple[int, int, int, int]
+
+
 @dataclass
 class MailWords:
     top_left: easy_chat.Word | int
@@ -16,20 +38,20 @@ class MailWords:
     substructures_order: PkmSubstructuresOrder
     scroll_distance: int
 
-    def apply_to_pkm(self, pkm_bytes: bytes, *, is_encrypted: bool = False) -> PcPkm:
-        pkm_bytes = (
-            pkm_bytes if isinstance(pkm_bytes, bytearray) else bytearray(pkm_bytes)
-        )
+    def apply_to_pkm(
+        self, pkm_bytes: bytes | bytearray | memoryview, *, is_encrypted: bool = False
+    ) -> PcPkm:
+        edited = bytearray(pkm_bytes)
         if not is_encrypted:
-            PcPkm.xor_substructures(pkm_bytes)
+            PcPkm.xor_substructures(edited)
 
-        self._set_word(pkm_bytes, self.top_left, at=PcPkm.PV_OFFSET)
-        self._set_word(pkm_bytes, self.top_right, at=PcPkm.PV_OFFSET + 2)
-        self._set_word(pkm_bytes, self.bottom_left, at=PcPkm.OT_ID_OFFSET)
-        self._set_word(pkm_bytes, self.bottom_right, at=PcPkm.OT_ID_OFFSET + 2)
+        self._set_word(edited, self.top_left, at=PcPkm.PV_OFFSET)
+        self._set_word(edited, self.top_right, at=PcPkm.PV_OFFSET + 2)
+        self._set_word(edited, self.bottom_left, at=PcPkm.OT_ID_OFFSET)
+        self._set_word(edited, self.bottom_right, at=PcPkm.OT_ID_OFFSET + 2)
 
         # Decrypt with new encryption key
-        return PcPkm.from_bytes(pkm_bytes, xor_substructures=True)
+        return PcPkm.from_bytes(edited, xor_substructures=True)
 
     @classmethod
     def from_indices(
@@ -58,58 +80,322 @@ class MailWords:
 
     @classmethod
     def find_for_substructure_order(
-        cls, pkm: PcPkm, order: PkmSubstructuresOrder
+        cls,
+        pkm: PcPkm,
+        order: PkmSubstructuresOrder,
+        *,
+        cost: MailWordsCost = MailWordsCost(),
     ) -> Iterator[Self]:
-        return (
-            words
-            for words in cls._words_with_same_encryption_key(pkm)
-            if words.substructures_order.name == order.name
+        word_pairs = cls._word_pairs(
+            (pkm.personality_value, pkm.original_trainer_id), (0, 1), cost
         )
+        combinations = cls._sorted_combinations(word_pairs, order.mod24, cost)
+        return (cls._from_combination(combination) for combination in combinations)
 
     @classmethod
     def find_for_pkm(cls, pkm: PcPkm) -> Iterator[Self]:
-        mail_words = sorted(
-            cls._words_with_same_encryption_key(pkm),
-            key=lambda w: (w.substructures_order.name, w.scroll_distance),
+        return (words for [words] in cls.best_per_order(pkm).values())
+
+    @classmethod
+    def best_for_order(
+        cls,
+        pkm: PcPkm,
+        order: PkmSubstructuresOrder,
+        k: Optional[int] = None,
+        *,
+        jobs: int = 1,
+        cache: Optional[MailWordsCache] = None,
+        cost: MailWordsCost = MailWordsCost(),
+    ) -> list[Self]:
+        best_per_order = cls.best_per_order(
+            pkm, k, orders=[order], jobs=jobs, cache=cache, cost=cost
         )
-        return (
-            next(words)
-            for _, words in itertools.groupby(
-                mail_words, key=lambda w: w.substructures_order.name
-            )
+        return best_per_order.get(order.name, [])
+
+    @classmethod
+    def best_per_order(
+        cls,
+        pkm: PcPkm,
+        k: Optional[int] = 1,
+        *,
+        orders: Iterable[PkmSubstructuresOrder] = PkmSubstructuresOrder,
+        jobs: int = 1,
+        cache: Optional[MailWordsCache] = None,
+        cost: MailWordsCost = MailWordsCost(),
+    ) -> dict[str, list[Self]]:
+        orders = sorted(orders, key=lambda o: o.name)
+        mod24s = tuple(order.mod24 for order in orders)
+        pv_otid = (pkm.personality_value, pkm.original_trainer_id)
+
+        best = {} if cache is None else cache.lookup(pv_otid, mod24s, k, cost)
+        if missing := tuple(mod24 for mod24 in mod24s if mod24 not in best):
+            found = dict(zip(missing, cls._search(pv_otid, missing, k, jobs, cost)))
+            if cache is not None:
+                cache.store(pv_otid, k, found, cost)
+            best |= found
+        return cls._to_best_per_order(orders, best)
+
+    @classmethod
+    def best_per_order_for_each(
+        cls,
+        pkms: Iterable[PcPkm],
+        k: Optional[int] = 1,
+        *,
+        jobs: int = 1,
+        cache: Optional[MailWordsCache] = None,
+        cost: MailWordsCost = MailWordsCost(),
+    ) -> Iterator[dict[str, list[Self]]]:
+        orders = sorted(PkmSubstructuresOrder, key=lambda o: o.name)
+        mod24s = tuple(order.mod24 for order in orders)
+        pvs_otids = [(pkm.personality_value, pkm.original_trainer_id) for pkm in pkms]
+
+        cached = [
+            {} if cache is None else cache.lookup(pv_otid, mod24s, k, cost)
+            for pv_otid in pvs_otids
+        ]
+        found = cls._search_each(
+            [
+                pv_otid
+                for pv_otid, best in zip(pvs_otids, cached)
+                if len(best) < len(mod24s)
+            ],
+            mod24s,
+            k,
+            jobs,
+            cost,
         )
 
+        for pv_otid, best in zip(pvs_otids, cached):
+            if len(best) < len(mod24s):
+                best = dict(zip(mod24s, next(found)))
+                if cache is not None:
+                    cache.store(pv_otid, k, best, cost)
+            yield cls._to_best_per_order(orders, best)
+
     @classmethod
-    def _words_with_same_encryption_key(cls, pkm: PcPkm) -> Iterator[Self]:
-        pkm_pv_high, pkm_pv_low = cls._split_into_u16(pkm.personality_value)
-        pkm_tid_high, pkm_tid_low = cls._split_into_u16(pkm.original_trainer_id)
+    def _search(
+        cls,
+        pv_otid: tuple[int, int],
+        mod24s: tuple[int, ...],
+        k: Optional[int],
+        jobs: int,
+        cost: MailWordsCost,
+    ) -> list[list[Combination]]:
+        search = functools.partial(
+            cls._best_combinations, pv_otid, mod24s, k, cost=cost
+        )
+        if jobs == 1:
+            return search((0, 1))
 
-        high_word_pairs = cls._replacement_words(pkm_pv_high, pkm_tid_high)
-        low_word_pairs = cls._replacement_words(pkm_pv_low, pkm_tid_low)
-        combinations = itertools.product(high_word_pairs, low_word_pairs)
+        # Each worker searches a slice of the high word pairs
+        from concurrent.futures import ProcessPoolExecutor
 
-        return (
-            cls.from_indices(
-                top_left=low_pv,
-                top_right=high_pv,
-                bottom_left=low_tid,
-                bottom_right=high_tid,
+        with ProcessPoolExecutor(jobs) as executor:
+            chunks = list(executor.map(search, ((i, jobs) for i in range(jobs))))
+        return [
+            list(itertools.islice(heapq.merge(*order_chunks), k))
+            for order_chunks in zip(*chunks)
+        ]
+
+    @classmethod
+    def _search_each(
+        cls,
+        pvs_otids: list[tuple[int, int]],
+        mod24s: tuple[int, ...],
+        k: Optional[int],
+        jobs: int,
+        cost: MailWordsCost,
+    ) -> Iterator[list[list[Combination]]]:
+        search = functools.partial(
+            cls._best_combinations, mod24s=mod24s, k=k, chunk=(0, 1), cost=cost
+        )
+        if jobs == 1:
+            yield from map(search, pvs_otids)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(jobs) as executor:
+            chunksize = max(1, len(pvs_otids) // (jobs * 4))
+            yield from executor.map(search, pvs_otids, chunksize=chunksize)
+
+    @classmethod
+    def _to_best_per_order(
+        cls, orders: list[PkmSubstructuresOrder], best: dict[int, list[Combination]]
+    ) -> dict[str, list[Self]]:
+        return {
+            order.name: [cls._from_combination(c) for c in combinations]
+            for order in orders
+            if (combinations := best.get(order.mod24))
+        }
+
+    @classmethod
+    def _best_combinations(
+        cls,
+        pv_otid: tuple[int, int],
+        mod24s: tuple[int, ...],
+        k: Optional[int],
+        chunk: tuple[int, int],
+        cost: MailWordsCost,
+    ) -> list[list[Combination]]:
+        mail_words_vectorized = optional_module(".mail_words_vectorized", __package__)
+        if mail_words_vectorized is not None:
+            combinations = mail_words_vectorized.Combinations(
+                *pv_otid, chunk=chunk, cost=cost
+            )
+            return [combinations.best_for_order(mod24, k) for mod24 in mod24s]
+
+        word_pairs = cls._word_pairs(pv_otid, chunk, cost)
+        return [
+            list(itertools.islice(cls._sorted_combinations(word_pairs, mod24, cost), k))
+            for mod24 in mod24s
+        ]
+
+    @classmethod
+    def _word_pairs(
+        cls, pv_otid: tuple[int, int], chunk: tuple[int, int], cost: MailWordsCost
+    ) -> _WordPairs:
+        pv_high, pv_low = cls._split_into_u16(pv_otid[0])
+        tid_high, tid_low = cls._split_into_u16(pv_otid[1])
+        chunk_index, chunk_count = chunk
+        high = cls._word_pairs_by_residue(pv_high, tid_high, 16, cost)
+        low = cls._word_pairs_by_residue(pv_low, tid_low, 0, cost)
+
+        bounds = cost.pair_bounds(cls._min_cost(high), cls._min_cost(low))
+        if bounds is not None:
+            high_bound, low_bound = bounds
+            high = cls._pairs_within(high, high_bound)
+            low = cls._pairs_within(low, low_bound)
+
+        return _WordPairs(
+            high={
+                residue: pairs[chunk_index::chunk_count]
+                for residue, pairs in high.items()
+            },
+            low=low,
+            original=(pv_high, tid_high, pv_low, tid_low),
+        )
+
+    @classmethod
+    def _sorted_combinations(
+        cls, word_pairs: _WordPairs, mod24: int, cost: MailWordsCost
+    ) -> Iterator[Combination]:
+        # PV % 24 == ((high << 16) % 24 + low % 24) % 24, so high and low word
+        # pairs can be bucketed by residue and only compatible buckets joined.
+        combinations = heapq.merge(
+            *(
+                cls._sorted_cost_sums(
+                    high_pairs,
+                    word_pairs.low.get((mod24 - residue) % 24, []),
+                    cost.max_cost,
+                )
+                for residue, high_pairs in word_pairs.high.items()
             )
-            for (high_pv, high_tid), (low_pv, low_tid) in combinations
-            if (high_pv, high_tid, low_pv, low_tid)
-            != (pkm_pv_high, pkm_tid_high, pkm_pv_low, pkm_tid_low)
         )
 
+        return (
+            (combination_cost, high, low)
+            for combination_cost, high, low in combinations
+            if (high.pv, high.tid, low.pv, low.tid) != word_pairs.original
+        )
+
+    @classmethod
+    def _from_combination(cls, combination: Combination) -> Self:
+        _, (_, high_pv, high_tid), (_, low_pv, low_tid) = combination
+        return cls.from_indices(
+            top_left=low_pv,
+            top_right=high_pv,
+            bottom_left=low_tid,
+            bottom_right=high_tid,
+        )
+
+    @classmethod
+    def _word_pairs_by_residue(
+        cls, i0: int, i1: int, shift: int, cost: MailWordsCost
+    ) -> _WordPairsByResidue:
+        word_pairs: defaultdict[int, list[_WordPair]] = defaultdict(list)
+        for pv, tid in cls._replacement_words(i0, i1):
+            pv_cost = cost.word_cost(pv, i0)
+            tid_cost = cost.word_cost(tid, i1)
+            if pv_cost is None or tid_cost is None:
+                continue
+            pair = _WordPair(pv_cost + tid_cost, pv, tid)
+            word_pairs[(pv << shift) % 24].append(pair)
+
+        for pairs in word_pairs.values():
+            pairs.sort()
+        return word_pairs
+
+    @staticmethod
+    def _sorted_cost_sums(
+        high_pairs: list[_WordPair],
+        low_pairs: list[_WordPair],
+        max_cost: Optional[int],
+    ) -> Iterator[tuple[int, _WordPair, _WordPair]]:
+        if not high_pairs or not low_pairs:
+            return
+
+        # Both lists are sorted, so (i, j) is only pushed after (i, j - 1), or
+        # (i - 1, 0) when j == 0, has been yielded. Costs never decrease along
+        # either direction, hence a pair over max_cost bounds all that follow.
+        def push(i: int, j: int):
+            pair_cost = high_pairs[i].cost + low_pairs[j].cost
+            if max_cost is None or pair_cost <= max_cost:
+                heapq.heappush(frontier, (pair_cost, i, j))
+
+        frontier: list[tuple[int, int, int]] = []
+        push(0, 0)
+        while frontier:
+            pair_cost, i, j = heapq.heappop(frontier)
+            yield pair_cost, high_pairs[i], low_pairs[j]
+
+            if j == 0 and i + 1 < len(high_pairs):
+                push(i + 1, 0)
+            if j + 1 < len(low_pairs):
+                push(i, j + 1)
+
+    @staticmethod
+    def _min_cost(word_pairs: _WordPairsByResidue) -> int:
+        return min((pairs[0].cost for pairs in word_pairs.values()), default=0)
+
     @staticmethod
-    def _replacement_words(i0: int, i1: int) -> Iterator[tuple[int, int]]:
+    def _pairs_within(
+        word_pairs: _WordPairsByResidue, max_cost: int
+    ) -> _WordPairsByResidue:
+        return {
+            residue: pairs[
+                : bisect.bisect_right(pairs, max_cost, key=lambda pair: pair.cost)
+            ]
+            for residue, pairs in word_pairs.items()
+        }
+
+    @classmethod
+    def _replacement_words(cls, i0: int, i1: int) -> Iterator[tuple[int, int]]:
         yield (i0, i1)
-        xor = i0 ^ i1
-        for word in easy_chat.words.values():
-            try:
-                companion_word = easy_chat.words[word.index ^ xor]
-                yield (word.index, companion_word.index)
-            except KeyError:
-                pass
+        yield from (pair for pair in cls._companion_words(i0 ^ i1) if pair != (i0, i1))
+
+    @staticmethod
+    @functools.cache
+    def _companion_words(xor: int) -> tuple[tuple[int, int], ...]:
+        # Two indices can only XOR to xor if their high bytes XOR to its high
+        # byte, so only the word blocks paired that way need to be probed.
+        blocks = MailWords._words_by_high_byte()
+        xor_high = xor >> 8
+        return tuple(
+            (index, index ^ xor)
+            for high, indices in blocks.items()
+            if high ^ xor_high in blocks
+            for index in indices
+            if index ^ xor in easy_chat.words
+        )
+
+    @staticmethod
+    @functools.cache
+    def _words_by_high_byte() -> dict[int, list[int]]:
+        blocks: defaultdict[int, list[int]] = defaultdict(list)
+        for index in easy_chat.words:
+            blocks[index >> 8].append(index)
+        return dict(blocks)
 
     @staticmethod
     def _set_word(pkm_bytes: bytearray, word: easy_chat.Word | int, *, at: int):
@@ -0,0 +1,212 @@
+import json
+import os
+import time
+from dataclasses import asdict
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterable, Optional, Self
+
+from ..data import easy_chat
+from .MailWordsCost import MailWordsCost
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# (cost, high pair, low pair), with pairs as (cost, pv, tid)
+type Combination = tuple[int, tuple[int, int, int], tuple[int, int, int]]
+
+
+class MailWordsCache:
+    hits: int
+    misses: int
+
+    _connection: "sqlite3.Connection"
+    _max_entries: int
+
+    # Bump when the format of the stored combinations or keys changes
+    SCHEMA_VERSION = 3
+
+    DEFAULT_MAX_ENTRIES = 100_000
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        path = self.default_path() if path is None else path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._max_entries = max_entries
+
+        # Only imported when a cache is opened, as most commands don't use one
+        import sqlite3
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        with self._connection:
+            self._invalidate_if_stale()
+            self._create_tables()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def lookup(
+        self,
+        pv_otid: tuple[int, int],
+        mod24s: Iterable[int],
+        k: Optional[int],
+        cost: MailWordsCost = MailWordsCost(),
+    ) -> dict[int, list[Combination]]:
+        pv, otid = pv_otid
+        cost_model = self._cost_model(cost)
+        rows = self._connection.execute(
+            "SELECT substructures_order, k, combinations FROM results "
+            "WHERE pv = ? AND otid = ? AND cost_model = ?",
+            (pv, otid, cost_model),
+        ).fetchall()
+        stored = {
+            mod24: (stored_k, combinations) for mod24, stored_k, combinations in rows
+        }
+
+        found: dict[int, list[Combination]] = {}
+        for mod24 in mod24s:
+            if mod24 not in stored:
+                continue
+            stored_k, combinations_json = stored[mod24]
+            combinations = self._decode(combinations_json)
+            is_complete = stored_k is None or len(combinations) < stored_k
+            if is_complete or (k is not None and k <= stored_k):
+                found[mod24] = combinations[:k]
+
+        self.hits += len(found)
+        self.misses += sum(1 for mod24 in mod24s if mod24 not in found)
+        if found:
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE results SET last_used = ? WHERE pv = ? AND otid = ? "
+                    "AND cost_model = ? AND substructures_order = ?",
+                    ((time.time_ns(), pv, otid, cost_model, mod24) for mod24 in found),
+                )
+        return found
+
+    def store(
+        self,
+        pv_otid: tuple[int, int],
+        k: Optional[int],
+        best: dict[int, list[Combination]],
+        cost: MailWordsCost = MailWordsCost(),
+    ) -> None:
+        pv, otid = pv_otid
+        cost_model = self._cost_model(cost)
+        last_used = time.time_ns()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results "
+                "(pv, otid, cost_model, substructures_order, k, combinations, "
+                "last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        pv,
+                        otid,
+                        cost_model,
+                        mod24,
+                        k,
+                        json.dumps(combinations),
+                        last_used,
+                    )
+                    for mod24, combinations in best.items()
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM results WHERE rowid IN ("
+                "SELECT rowid FROM results ORDER BY last_used DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    @staticmethod
+    def default_path() -> Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(cache_home) / "pkm3-hex" / "mail-words.sqlite3"
+
+    def _create_tables(self) -> None:
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "pv INTEGER NOT NULL, "
+            "otid INTEGER NOT NULL, "
+            "cost_model TEXT NOT NULL, "
+            "substructures_order INTEGER NOT NULL, "
+            "k INTEGER, "
+            "combinations TEXT NOT NULL, "
+            "last_used INTEGER NOT NULL, "
+            "PRIMARY KEY (pv, otid, cost_model, substructures_order))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+        )
+
+    def _invalidate_if_stale(self) -> None:
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        version = self._words_version()
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'words_version'"
+        ).fetchone()
+        if row is None or row[0] != version:
+            # The table layout may have changed along with the schema version
+            self._connection.execute("DROP TABLE IF EXISTS results")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) "
+                "VALUES ('words_version', ?)",
+                (version,),
+            )
+
+    @classmethod
+    def _words_version(cls) -> str:
+        import hashlib
+
+        words_data = Path(easy_chat.SNAPSHOT_PATH).read_bytes()
+        return hashlib.sha256(
+            repr(cls.SCHEMA_VERSION).encode() + words_data
+        ).hexdigest()
+
+    @staticmethod
+    def _cost_model(cost: MailWordsCost) -> str:
+        # Sorted, as the order of a frozenset changes between processes
+        unlocked_categories = cost.unlocked_categories
+        return json.dumps(
+            {
+                **asdict(cost),
+                "unlocked_categories": (
+                    None if unlocked_categories is None else sorted(unlocked_categories)
+                ),
+            },
+            sort_keys=True,
+        )
+
+    @staticmethod
+    def _decode(combinations_json: str) -> list[Combination]:
+        return [
+            (cost, tuple(high), tuple(low))
+            for cost, high, low in json.loads(combinations_json)
+        ]
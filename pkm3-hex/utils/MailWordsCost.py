@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from ..data import easy_chat
+
+
+@dataclass(frozen=True)
+class MailWordsCost:
+    # Weights of each objective. The cost of a set of mail words is the sum of
+    # the cost of its four words, which lets the search rank word pairs first.
+    scroll_distance: int = 1
+    changed_word: int = 0
+    locked_category: Optional[int] = None
+
+    # Categories of words that can be used. None means all of them, while words
+    # in any other category cost locked_category, or can't be used if None.
+    unlocked_categories: Optional[frozenset[str]] = None
+
+    # Combinations that cost more than this are pruned from the search
+    max_cost: Optional[int] = None
+
+    def word_cost(self, index: int, original_index: int) -> Optional[int]:
+        word = easy_chat.words.get(index)
+        cost = 0 if index == original_index else self.changed_word
+
+        if word is None:
+            return cost
+
+        cost += self.scroll_distance * word.scroll_distance
+        if self.is_unlocked(word.category):
+            return cost
+        if self.locked_category is None:
+            return None
+        return cost + self.locked_category
+
+    def pair_bounds(
+        self, min_high_cost: int, min_low_cost: int
+    ) -> Optional[tuple[int, int]]:
+        # A pair can only be part of a combination within the budget if it is
+        # within the budget when combined with the cheapest other pair.
+        if self.max_cost is None:
+            return None
+        return self.max_cost - min_low_cost, self.max_cost - min_high_cost
+
+    def is_unlocked(self, category: easy_chat.Word.Category) -> bool:
+        return (
+            self.unlocked_categories is None
+            or category.name in self.unlocked_categories
+        )
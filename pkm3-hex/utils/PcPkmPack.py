@@ -0,0 +1,184 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Self
+
+from .bytes_handling import map_path
+from .GameSaveBlock import GameSaveBlock, Pc
+from .save_scan import map_saves
+
+
+class _PackedSave(NamedTuple):
+    records: bytes
+    error: Optional[str]
+
+
+class PcPkmPack:
+    class Record(NamedTuple):
+        save_path: str
+        slot: GameSaveBlock.Slot
+        box: int
+        row: int
+        col: int
+        personality_value: int
+        original_trainer_id: int
+        species: int
+        held_item: int
+        experience: int
+        ivs_egg_ability: int
+        is_bad_egg: bool
+
+    save_paths: list[str]
+
+    # Fixed width records, as little endian, from records_offset to the end
+    records: memoryview
+
+    # Magic, version, record size, save count, records offset, followed by the
+    # NUL separated save paths
+    HEADER = struct.Struct("<4sHHII")
+    MAGIC = b"PKPC"
+    VERSION = 1
+
+    # PV, OTID, species, held item, experience, IVs/egg/ability word, save
+    # index, position in the PC, slot index and flags. Species and items are
+    # indices as stored, and positions are as in PcPkmColumns.
+    RECORD = struct.Struct("<IIHHIIIHBB")
+    SLOTS: list[GameSaveBlock.Slot] = ["A", "B"]
+    IS_BAD_EGG = 0x01
+
+    def __init__(self, save_paths: list[str], records: memoryview):
+        self.save_paths = save_paths
+        self.records = records
+
+    def __getitem__(self, index: int) -> Record:
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return self._make_record(
+            self.RECORD.unpack_from(self.records, index * self.RECORD.size)
+        )
+
+    def __iter__(self) -> Iterator[Record]:
+        return map(self._make_record, self.RECORD.iter_unpack(self.records))
+
+    def __len__(self) -> int:
+        return len(self.records) // self.RECORD.size
+
+    def _make_record(self, fields: tuple[int, ...]) -> Record:
+        (
+            pv,
+            otid,
+            species,
+            held_item,
+            experience,
+            ivs_egg_ability,
+            save,
+            position,
+            slot,
+            flags,
+        ) = fields
+        box, box_position = divmod(position, Pc.Box.ROWS * Pc.Box.COLS)
+        row, col = divmod(box_position, Pc.Box.COLS)
+        return self.Record(
+            self.save_paths[save],
+            self.SLOTS[slot],
+            box + 1,
+            row + 1,
+            col + 1,
+            pv,
+            otid,
+            species,
+            held_item,
+            experience,
+            ivs_egg_ability,
+            bool(flags & self.IS_BAD_EGG),
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes | mmap.mmap) -> Self:
+        view = memoryview(buffer)
+        magic, version, record_size, save_count, records_offset = (
+            cls.HEADER.unpack_from(view)
+        )
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"unsupported packed PC file (version {version})")
+        if (
+            record_size != cls.RECORD.size
+            or (len(view) - records_offset) % record_size != 0
+        ):
+            raise ValueError("truncated or corrupt packed PC file")
+
+        save_paths_bytes = bytes(view[cls.HEADER.size : records_offset])
+        save_paths = save_paths_bytes.split(b"\0") if save_count else []
+        return cls(list(map(os.fsdecode, save_paths)), view[records_offset:])
+
+    @classmethod
+    def open(cls, path: Path) -> Self:
+        return cls.from_bytes(map_path(path))
+
+    @classmethod
+    def write(
+        cls, output: BinaryIO, save_paths: Iterable[Path], *, jobs: int = 1
+    ) -> list[tuple[Path, str]]:
+        # Records are written as each save is decoded. Saves that can't be read
+        # keep their path, have no records, and are returned with the error.
+        save_paths = list(save_paths)
+        save_paths_bytes = b"\0".join(map(os.fsencode, save_paths))
+        records_offset = cls.HEADER.size + len(save_paths_bytes)
+        output.write(
+            cls.HEADER.pack(
+                cls.MAGIC,
+                cls.VERSION,
+                cls.RECORD.size,
+                len(save_paths),
+                records_offset,
+            )
+        )
+        output.write(save_paths_bytes)
+
+        errors = []
+        packed_saves = map_saves(cls._pack_save, enumerate(save_paths), jobs=jobs)
+        for save_path, packed_save in zip(save_paths, packed_saves):
+            output.write(packed_save.records)
+            if packed_save.error is not None:
+                errors.append((save_path, packed_save.error))
+        return errors
+
+    @classmethod
+    def _pack_save(cls, save: tuple[int, Path]) -> _PackedSave:
+        save_index, save_path = save
+        try:
+            save_block = GameSaveBlock.open(save_path, validate=True)
+            columns = save_block.pc.decode_all()
+        except (OSError, ValueError, struct.error) as error:
+            return _PackedSave(records=b"", error=str(error))
+
+        slot = cls.SLOTS.index(save_block.slot)
+        records = bytearray(len(columns) * cls.RECORD.size)
+        for offset, pv, otid, species, item, exp, ivs, position, bad_egg in zip(
+            range(0, len(records), cls.RECORD.size),
+            columns.personality_value,
+            columns.original_trainer_id,
+            columns.species,
+            columns.held_item,
+            columns.experience,
+            columns.ivs_egg_ability,
+            columns.positions,
+            columns.is_bad_egg,
+        ):
+            flags = cls.IS_BAD_EGG if bad_egg else 0
+            cls.RECORD.pack_into(
+                records,
+                offset,
+                pv,
+                otid,
+                species,
+                item,
+                exp,
+                ivs,
+                save_index,
+                position,
+                slot,
+                flags,
+            )
+        return _PackedSave(records=bytes(records), error=None)
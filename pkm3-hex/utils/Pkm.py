@@ -1,8 +1,9 @@
-import itertools
-import operator
+import functools
+import struct
+from array import array
 from dataclasses import dataclass
 from enum import StrEnum, auto
-from typing import Iterable, Literal, Self
+from typing import Literal, Self
 
 from .. import data
 from ..data.items import Item
@@ -10,6 +11,7 @@ from ..data.locations import Location
 from ..data.moves import Move
 from ..data.pkm_species import PkmSpecies
 from .bytes_handling import read_int
+from .optional_module import optional_module
 
 
 class PkmSubstructuresOrder(StrEnum):
@@ -71,19 +73,21 @@ class PkmGrowth:
     PP_OFFSET = 0x8
     FRIENDSHIP_OFFSET = 0x9
 
+    # species, held item, experience, PP ups, friendship
+    LAYOUT = struct.Struct("<HHIBBxx")
+
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
+    def from_bytes(cls, buffer: bytes, offset: int = 0) -> Self:
+        species, held_item, experience, pp_ups_byte, friendship = (
+            cls.LAYOUT.unpack_from(buffer, offset)
+        )
         return cls(
-            species=data.pkm_species[
-                read_int(buffer[cls.SPECIES_OFFSET : cls.HELD_ITEM_OFFSET])
-            ],
-            held_item=data.items[
-                read_int(buffer[cls.HELD_ITEM_OFFSET : cls.EXP_OFFSET])
-            ],
-            experience=read_int(buffer[cls.EXP_OFFSET : cls.PP_OFFSET]),
-            friendship=buffer[cls.FRIENDSHIP_OFFSET],
-            data=buffer,
-            pp_ups_byte=buffer[cls.PP_OFFSET],
+            species=data.pkm_species[species],
+            held_item=data.items[held_item],
+            experience=experience,
+            friendship=friendship,
+            data=buffer[offset : offset + cls.LAYOUT.size],
+            pp_ups_byte=pp_ups_byte,
         )
 
 
@@ -111,18 +115,24 @@ class PkmAttacks:
     PP3_OFFSET = 0xA
     PP4_OFFSET = 0xB
 
+    # Moves, then their PPs
+    LAYOUT = struct.Struct("<4H4B")
+
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
+    def from_bytes(cls, buffer: bytes, offset: int = 0) -> Self:
+        move1, move2, move3, move4, pp1, pp2, pp3, pp4 = cls.LAYOUT.unpack_from(
+            buffer, offset
+        )
         return cls(
-            move1=data.moves[read_int(buffer[cls.MOVE1_OFFSET : cls.MOVE2_OFFSET])],
-            move2=data.moves[read_int(buffer[cls.MOVE2_OFFSET : cls.MOVE3_OFFSET])],
-            move3=data.moves[read_int(buffer[cls.MOVE3_OFFSET : cls.MOVE4_OFFSET])],
-            move4=data.moves[read_int(buffer[cls.MOVE4_OFFSET : cls.PP1_OFFSET])],
-            pp1=buffer[cls.PP1_OFFSET],
-            pp2=buffer[cls.PP2_OFFSET],
-            pp3=buffer[cls.PP3_OFFSET],
-            pp4=buffer[cls.PP4_OFFSET],
-            data=buffer,
+            move1=data.moves[move1],
+            move2=data.moves[move2],
+            move3=data.moves[move3],
+            move4=data.moves[move4],
+            pp1=pp1,
+            pp2=pp2,
+            pp3=pp3,
+            pp4=pp4,
+            data=buffer[offset : offset + cls.LAYOUT.size],
         )
 
 
@@ -158,22 +168,39 @@ class PkmEvsAndConditions:
     TOUGHNESS_OFFSET = 0xA
     FEEL_OFFSET = 0xB
 
+    # EVs, then conditions
+    LAYOUT = struct.Struct("<12B")
+
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
+    def from_bytes(cls, buffer: bytes, offset: int = 0) -> Self:
+        (
+            hp_evs,
+            atk_evs,
+            def_evs,
+            speed_evs,
+            sp_atk_evs,
+            sp_def_evs,
+            coolness,
+            beauty,
+            cuteness,
+            smartness,
+            toughness,
+            feel,
+        ) = cls.LAYOUT.unpack_from(buffer, offset)
         return cls(
-            hp_evs=read_int(buffer[cls.HP_EVS_OFFSET : cls.ATK_EVS_OFFSET]),
-            atk_evs=read_int(buffer[cls.ATK_EVS_OFFSET : cls.DEF_EVS_OFFSET]),
-            def_evs=read_int(buffer[cls.DEF_EVS_OFFSET : cls.SPEED_EVS_OFFSET]),
-            speed_evs=read_int(buffer[cls.SPEED_EVS_OFFSET : cls.SP_ATK_EVS_OFFSET]),
-            sp_atk_evs=read_int(buffer[cls.SP_ATK_EVS_OFFSET : cls.SP_DEF_EVS_OFFSET]),
-            sp_def_evs=read_int(buffer[cls.SP_DEF_EVS_OFFSET : cls.COOLNESS_OFFSET]),
-            coolness=read_int(buffer[cls.COOLNESS_OFFSET : cls.BEAUTY_OFFSET]),
-            beauty=read_int(buffer[cls.BEAUTY_OFFSET : cls.CUTENESS_OFFSET]),
-            cuteness=read_int(buffer[cls.CUTENESS_OFFSET : cls.SMARTNESS_OFFSET]),
-            smartness=read_int(buffer[cls.SMARTNESS_OFFSET : cls.TOUGHNESS_OFFSET]),
-            toughness=read_int(buffer[cls.TOUGHNESS_OFFSET : cls.FEEL_OFFSET]),
-            feel=read_int(buffer[cls.FEEL_OFFSET :]),
-            data=buffer,
+            hp_evs=hp_evs,
+            atk_evs=atk_evs,
+            def_evs=def_evs,
+            speed_evs=speed_evs,
+            sp_atk_evs=sp_atk_evs,
+            sp_def_evs=sp_def_evs,
+            coolness=coolness,
+            beauty=beauty,
+            cuteness=cuteness,
+            smartness=smartness,
+            toughness=toughness,
+            feel=feel,
+            data=buffer[offset : offset + cls.LAYOUT.size],
         )
 
 
@@ -258,17 +285,21 @@ class PkmMisc:
     IVS_EGG_ABILITY_OFFSET = 0x4
     RIBBONS_OBEDIENCE_OFFSET = 0x8
 
+    # Pokérus, met location, origin, IVs/egg/ability, ribbons/obedience
+    LAYOUT = struct.Struct("<BBHII")
+
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> Self:
+    def from_bytes(cls, buffer: bytes, offset: int = 0) -> Self:
+        pkrs_byte, met_location, origin, ivs_egg_ability, ribbons_obedience = (
+            cls.LAYOUT.unpack_from(buffer, offset)
+        )
         return cls(
-            pkrs_byte=buffer[cls.PKRS_OFFSET],
-            met_location=data.locations[buffer[cls.MET_LOCATION_OFFSET]],
-            origin=read_int(buffer[cls.ORIGINS_OFFSET : cls.IVS_EGG_ABILITY_OFFSET]),
-            ivs_egg_ability=read_int(
-                buffer[cls.IVS_EGG_ABILITY_OFFSET : cls.RIBBONS_OBEDIENCE_OFFSET]
-            ),
-            ribbons_obedience=read_int(buffer[cls.RIBBONS_OBEDIENCE_OFFSET :]),
-            data=buffer,
+            pkrs_byte=pkrs_byte,
+            met_location=data.locations[met_location],
+            origin=origin,
+            ivs_egg_ability=ivs_egg_ability,
+            ribbons_obedience=ribbons_obedience,
+            data=buffer[offset : offset + cls.LAYOUT.size],
         )
 
 
@@ -277,10 +308,11 @@ class PcPkm:
     # Parsed
     personality_value: int
     original_trainer_id: int
-    nickname: bytes
+    nickname: bytearray
     language: int
     is_bad_egg: bool
-    original_trainer_name: bytes
+    misc_flags: int
+    original_trainer_name: bytearray
     markings: int
     checksum: int
 
@@ -293,7 +325,7 @@ class PcPkm:
     misc: PkmMisc
 
     # Bytes
-    data: bytes
+    data: bytearray
 
     PV_OFFSET = 0x00
     OT_ID_OFFSET = 0x04
@@ -307,43 +339,83 @@ class PcPkm:
     SIZE = 80
 
     @classmethod
-    def from_bytes(cls, buffer: bytes, *, xor_substructures: bool = True) -> Self:
-        buffer = bytearray(buffer)
+    def from_bytes(
+        cls, buffer: bytes | bytearray | memoryview, *, xor_substructures: bool = True
+    ) -> Self:
+        pkm_bytes = bytearray(buffer)
 
-        substructures = cls._Substructures.from_bytes(buffer, xor=xor_substructures)
+        substructures = cls._Substructures.from_bytes(pkm_bytes, xor=xor_substructures)
         if xor_substructures:
-            substructures.write_into(buffer)
+            substructures.write_into(pkm_bytes)
 
-        # Verify bad egg
-        checksum = read_int(buffer[cls.CHECKSUM_OFFSET :], 2)
+        # Verify bad egg. The flag is set in data, as the game does, but the
+        # flags as stored are kept to be written back.
+        misc_flags = pkm_bytes[cls.MISC_OFFSET]
+        checksum = read_int(pkm_bytes[cls.CHECKSUM_OFFSET :], 2)
         if substructures.data_sum() & 0xFF_FF != checksum:
-            buffer[cls.MISC_OFFSET] |= 0x01
+            pkm_bytes[cls.MISC_OFFSET] |= 0x01
 
         return cls(
             personality_value=substructures.pv,
             original_trainer_id=substructures.otid,
-            nickname=buffer[cls.NICKNAME_OFFSET : cls.LANGUAGE_OFFSET],
-            language=buffer[cls.LANGUAGE_OFFSET],
-            is_bad_egg=buffer[cls.MISC_OFFSET] & 0x01 == 0x01,
-            original_trainer_name=buffer[cls.OT_NAME_OFFSET : cls.MARKINGS_OFFSET],
-            markings=buffer[cls.MARKINGS_OFFSET],
+            nickname=pkm_bytes[cls.NICKNAME_OFFSET : cls.LANGUAGE_OFFSET],
+            language=pkm_bytes[cls.LANGUAGE_OFFSET],
+            is_bad_egg=pkm_bytes[cls.MISC_OFFSET] & 0x01 == 0x01,
+            misc_flags=misc_flags,
+            original_trainer_name=pkm_bytes[cls.OT_NAME_OFFSET : cls.MARKINGS_OFFSET],
+            markings=pkm_bytes[cls.MARKINGS_OFFSET],
             checksum=checksum,
             substructure_order=substructures.order,
             substructure_encryption_key=substructures.encryption_key,
-            growth=PkmGrowth.from_bytes(substructures.get_substructure_bytes("G")),
-            attacks=PkmAttacks.from_bytes(substructures.get_substructure_bytes("A")),
+            growth=PkmGrowth.from_bytes(
+                substructures.data, substructures.get_substructure_offset("G")
+            ),
+            attacks=PkmAttacks.from_bytes(
+                substructures.data, substructures.get_substructure_offset("A")
+            ),
             evs_and_conditions=PkmEvsAndConditions.from_bytes(
-                substructures.get_substructure_bytes("E")
+                substructures.data, substructures.get_substructure_offset("E")
+            ),
+            misc=PkmMisc.from_bytes(
+                substructures.data, substructures.get_substructure_offset("M")
             ),
-            misc=PkmMisc.from_bytes(substructures.get_substructure_bytes("M")),
-            data=buffer,
+            data=pkm_bytes,
         )
 
+    def to_bytes(self) -> bytes:
+        # Encrypted, as stored in the PC, with the checksum of the current data
+        buffer = bytearray(self.data)
+        buffer[self.MISC_OFFSET] = self.misc_flags
+        substructures = self._Substructures.from_bytes(buffer, xor=False)
+        checksum = substructures.data_sum() & 0xFF_FF
+        buffer[self.CHECKSUM_OFFSET : self.CHECKSUM_OFFSET + 2] = checksum.to_bytes(
+            length=2, byteorder="little"
+        )
+        self.xor_substructures(buffer)
+        return bytes(buffer)
+
     @classmethod
-    def xor_substructures(cls, pkm_bytes: bytearray):
+    def xor_substructures(cls, pkm_bytes: bytearray | memoryview):
         substructures = cls._Substructures.from_bytes(pkm_bytes, xor=True)
         pkm_bytes[cls._Substructures.OFFSET :] = substructures.data
 
+    @classmethod
+    def xor_all_substructures(cls, buffer: bytes | memoryview) -> bytes:
+        # buffer holds consecutive records, as in a PC box
+        pkm_vectorized = optional_module(".pkm_vectorized", __package__)
+        if pkm_vectorized is not None:
+            return pkm_vectorized.xor_substructures(
+                buffer,
+                record_size=cls.SIZE,
+                offset=cls._Substructures.OFFSET,
+                size=cls._Substructures.SIZE,
+            )
+
+        records = bytearray(buffer)
+        for start in range(0, len(records), cls.SIZE):
+            cls.xor_substructures(memoryview(records)[start : start + cls.SIZE])
+        return bytes(records)
+
     @dataclass
     class _Substructures:
         # Computed data
@@ -361,41 +433,150 @@ class PcPkm:
         SINGLE_SUBSTRUCTURE_SIZE = 12
         SIZE = SINGLE_SUBSTRUCTURE_SIZE * 4
 
+        PV_OTID = struct.Struct("<II")
+        DATA_WORDS = struct.Struct(f"<{SIZE // 2}H")
+
+        # Multiplying a 32-bit key by this repeats it over all the substructures
+        KEY_REPEAT = sum(1 << 32 * i for i in range(SIZE // 4))
+
         def get_substructure_bytes(
             self,
             substructure: Literal["G", "A", "E", "M"],
         ) -> bytes:
-            pos = self.order.value.index(substructure.lower())
-            start_index = pos * self.SINGLE_SUBSTRUCTURE_SIZE
+            start_index = self.get_substructure_offset(substructure)
             return self.data[start_index : start_index + self.SINGLE_SUBSTRUCTURE_SIZE]
 
-        def write_into(self, pkm_bytes: bytearray):
+        def get_substructure_offset(
+            self,
+            substructure: Literal["G", "A", "E", "M"],
+        ) -> int:
+            pos = self.order.value.index(substructure.lower())
+            return pos * self.SINGLE_SUBSTRUCTURE_SIZE
+
+        def write_into(self, pkm_bytes: bytearray | memoryview):
             pkm_bytes[self.OFFSET :] = self.data
 
         def data_sum(self) -> int:
-            return sum(read_int(bytes(n)) for n in itertools.batched(self.data, 2))
+            return sum(self.DATA_WORDS.unpack(self.data))
 
         @classmethod
-        def from_bytes(cls, pkm_bytes: bytes, *, xor: bool) -> Self:
-            pv_bytes = pkm_bytes[PcPkm.PV_OFFSET : PcPkm.OT_ID_OFFSET]
-            otid_bytes = pkm_bytes[PcPkm.OT_ID_OFFSET : PcPkm.NICKNAME_OFFSET]
-            encryption_key_bytes = cls._pairwise_xor(pv_bytes, otid_bytes)
-
-            pv = read_int(pv_bytes)
+        def from_bytes(
+            cls, pkm_bytes: bytes | bytearray | memoryview, *, xor: bool
+        ) -> Self:
+            pv, otid = cls.PV_OTID.unpack_from(pkm_bytes, PcPkm.PV_OFFSET)
+            encryption_key = pv ^ otid
             order = PkmSubstructuresOrder(pv % 24)
 
-            data = pkm_bytes[cls.OFFSET : cls.OFFSET + cls.SIZE]
+            data = bytes(pkm_bytes[cls.OFFSET : cls.OFFSET + cls.SIZE])
             if xor:
-                data = cls._pairwise_xor(itertools.cycle(encryption_key_bytes), data)
+                data = cls.xor(data, encryption_key)
 
             return cls(
-                encryption_key=read_int(encryption_key_bytes),
+                encryption_key=encryption_key,
                 order=order,
                 data=data,
                 pv=pv,
-                otid=read_int(otid_bytes),
+                otid=otid,
+            )
+
+        @classmethod
+        def xor(cls, data: bytes, encryption_key: int) -> bytes:
+            words = int.from_bytes(data, byteorder="little")
+            words ^= encryption_key * cls.KEY_REPEAT
+            return words.to_bytes(cls.SIZE, byteorder="little")
+
+
+@dataclass
+class PcPkmColumns:
+    # Index of each record in the decoded buffer. Empty records are skipped.
+    positions: array
+
+    personality_value: array
+    original_trainer_id: array
+    substructure_order: array
+    checksum: array
+    is_bad_egg: array
+
+    # Growth, with indices as stored rather than looked up in the data tables
+    species: array
+    held_item: array
+    experience: array
+    friendship: array
+
+    # Misc
+    ivs_egg_ability: array
+
+    _CHECKSUM = struct.Struct("<H")
+    _EMPTY = bytes(PcPkm.SIZE)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes | memoryview) -> Self:
+        columns = cls(
+            positions=array("H"),
+            personality_value=array("L"),
+            original_trainer_id=array("L"),
+            substructure_order=array("B"),
+            checksum=array("H"),
+            is_bad_egg=array("B"),
+            species=array("H"),
+            held_item=array("H"),
+            experience=array("L"),
+            friendship=array("B"),
+            ivs_egg_ability=array("L"),
+        )
+        offsets = cls._substructure_offsets()
+        decrypted = PcPkm.xor_all_substructures(buffer)
+        Substructures = PcPkm._Substructures
+
+        for position, start in enumerate(range(0, len(buffer), PcPkm.SIZE)):
+            if buffer[start : start + PcPkm.SIZE] == cls._EMPTY:
+                continue
+
+            pv, otid = Substructures.PV_OTID.unpack_from(decrypted, start)
+            (checksum,) = cls._CHECKSUM.unpack_from(
+                decrypted, start + PcPkm.CHECKSUM_OFFSET
+            )
+            substructures_start = start + Substructures.OFFSET
+            data_sum = sum(
+                Substructures.DATA_WORDS.unpack_from(decrypted, substructures_start)
+            )
+            is_bad_egg = (
+                decrypted[start + PcPkm.MISC_OFFSET] & 0x01 == 0x01
+                or data_sum & 0xFF_FF != checksum
+            )
+
+            growth_offset, misc_offset = offsets[pv % 24]
+            species, held_item, experience, _, friendship = (
+                PkmGrowth.LAYOUT.unpack_from(
+                    decrypted, substructures_start + growth_offset
+                )
+            )
+            _, _, _, ivs_egg_ability, _ = PkmMisc.LAYOUT.unpack_from(
+                decrypted, substructures_start + misc_offset
             )
 
-        @staticmethod
-        def _pairwise_xor(b0: Iterable[int], b1: Iterable[int]) -> bytes:
-            return bytes(itertools.starmap(operator.xor, zip(b0, b1)))
+            columns.positions.append(position)
+            columns.personality_value.append(pv)
+            columns.original_trainer_id.append(otid)
+            columns.substructure_order.append(pv % 24)
+            columns.checksum.append(checksum)
+            columns.is_bad_egg.append(is_bad_egg)
+            columns.species.append(species)
+            columns.held_item.append(held_item)
+            columns.experience.append(experience)
+            columns.friendship.append(friendship)
+            columns.ivs_egg_ability.append(ivs_egg_ability)
+
+        return columns
+
+    @staticmethod
+    @functools.cache
+    def _substructure_offsets() -> dict[int, tuple[int, int]]:
+        size = PcPkm._Substructures.SINGLE_SUBSTRUCTURE_SIZE
+        return {
+            order.mod24: (order.value.index("g") * size, order.value.index("m") * size)
+            for order in PkmSubstructuresOrder
+        }
@@ -1,5 +1,25 @@
+from typing import Any
+
 from .bytes_handling import NumberByteSize, format_bytes, format_hex
 from .GameSaveBlock import GameSaveBlock
-from .json import PkmJSONSerializer
+from .json import PkmJSONSerializer, dump_json_lines, encode_json, load_json_lines
 from .MailWords import MailWords
-from .Pkm import PcPkm, PkmSubstructuresOrder
+from .MailWordsCache import MailWordsCache
+from .MailWordsCost import MailWordsCost
+from .PcPkmPack import PcPkmPack
+from .Pkm import PcPkm, PcPkmColumns, PkmSubstructuresOrder
+from .save_scan import expand_save_paths, scan_saves
+
+ASYNC_EXPORTS = {"ScanError", "ScannedPkm", "aiter_pc"}
+
+
+# Imported on first use, as asyncio takes about as long to import as the rest
+# of the package
+def __getattr__(name: str) -> Any:
+    if name not in ASYNC_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import save_scan_async
+
+    value = globals()[name] = getattr(save_scan_async, name)
+    return value
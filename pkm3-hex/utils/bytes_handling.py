@@ -1,4 +1,7 @@
-from typing import Literal, Optional
+import io
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Literal, Optional
 
 type NumberByteSize = Literal[1, 2, 4]
 
@@ -10,10 +13,28 @@ def format_hex(
     return f"{'0x' if prefix else ''}{format_bytes(buffer, separator=separator)}"
 
 
-def format_bytes(buffer: bytes, *, separator: str = " ") -> str:
+def format_bytes(
+    buffer: bytes | bytearray | memoryview, *, separator: str = " "
+) -> str:
     return separator.join(f"{b:02X}" for b in buffer)
 
 
-def read_int(buffer: bytes, size: Optional[Literal[2, 4]] = None) -> int:
+def read_int(
+    buffer: bytes | bytearray | memoryview, size: Optional[Literal[2, 4]] = None
+) -> int:
     b = buffer if size is None else buffer[:size]
     return int.from_bytes(b, byteorder="little")
+
+
+def map_file(file: BinaryIO) -> bytes | mmap.mmap:
+    # Regular files are mapped, so that only the pages actually read are
+    # loaded. The mapping outlives the file, and is released with the last view.
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return file.read()
+
+
+def map_path(path: Path) -> bytes | mmap.mmap:
+    with open(path, "rb") as file:
+        return map_file(file)
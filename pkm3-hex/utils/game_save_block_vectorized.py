@@ -0,0 +1,17 @@
+import numpy as np
+
+
+def section_checksums(
+    buffer: memoryview, *, section_size: int, data_sizes: list[int]
+) -> list[int]:
+    # One row per section, one column per 32-bit word
+    words = np.frombuffer(
+        buffer, dtype="<u4", count=len(data_sizes) * section_size // 4
+    ).reshape(len(data_sizes), section_size // 4)
+
+    # Each section sums a different number of words, so the sums are read from
+    # the running totals at the end of each section's data
+    sums = np.cumsum(words, axis=1, dtype=np.uint64)
+    sums = sums[np.arange(len(data_sizes)), np.array(data_sizes) // 4 - 1]
+    sums &= 0xFF_FF_FF_FF
+    return (((sums >> 16) + sums) & 0xFF_FF).tolist()
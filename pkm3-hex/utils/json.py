@@ -1,9 +1,11 @@
+import functools
 import inspect
-from json import JSONDecoder, JSONEncoder
-from typing import Any, Callable
+from json import JSONDecoder, JSONEncoder, dumps
+from typing import IO, Any, Callable, Iterable, Iterator, NamedTuple
 
 from ..data import easy_chat
 from .MailWords import MailWords
+from .optional_module import optional_module
 
 type KwArgs = dict[str, Any]
 
@@ -11,6 +13,14 @@ type JSONObject = dict[str, Any]
 type JSONObjectHook = Callable[[JSONObject], Any]
 
 
+class _WordIndex(NamedTuple):
+    by_category_and_text: dict[tuple[str, str], easy_chat.Word]
+
+    # Some texts are in several categories, e.g. Pokémon names. Without a
+    # matching category, the first word with the text is used.
+    by_text: dict[str, easy_chat.Word]
+
+
 class PkmJSONSerializer(JSONDecoder, JSONEncoder):
     def __init__(self, *args: Any, **kwargs: Any):
         super(PkmJSONSerializer, self).__init__(
@@ -19,20 +29,7 @@ class PkmJSONSerializer(JSONDecoder, JSONEncoder):
         super(JSONDecoder, self).__init__(**constructor_kwargs(JSONEncoder, kwargs))
 
     def default(self, o: Any) -> Any:
-        if o is None:
-            return None
-
-        if isinstance(o, easy_chat.Word):
-            return {"text": o.text, "category": o.category.name}
-
-        if isinstance(o, MailWords):
-            return {
-                "top_left": self.default(o.top_left),
-                "top_right": self.default(o.top_right),
-                "bottom_left": self.default(o.bottom_left),
-                "bottom_right": self.default(o.bottom_right),
-            }
-        return o
+        return to_json_object(o)
 
     @classmethod
     def _object_hook(cls, o: JSONObject) -> Any:
@@ -42,26 +39,28 @@ class PkmJSONSerializer(JSONDecoder, JSONEncoder):
 
     @staticmethod
     def _parse_easy_chat_Word(o: JSONObject) -> easy_chat.Word | JSONObject:
-        try:
-            text = o["text"].lower()
-            category = easy_chat.Word.Category[o["category"].upper()]
-            return next(
-                word
-                for word in easy_chat.words.values()
-                if category == category and text == word.text.lower()
-            )
-        except StopIteration:
-            return o
+        text = o["text"].lower()
+        category = o["category"].upper()
+        word_index = _word_index()
+        word = word_index.by_category_and_text.get((category, text))
+        if word is None:
+            word = word_index.by_text.get(text)
+        return o if word is None else word
 
     @classmethod
     def _parse_mail_words(cls, o: JSONObject) -> MailWords:
         return MailWords.from_indices(
-            top_left=o["top_left"],
-            top_right=o["top_right"],
-            bottom_left=o["bottom_left"],
-            bottom_right=o["bottom_right"],
+            top_left=cls._index_of(o["top_left"]),
+            top_right=cls._index_of(o["top_right"]),
+            bottom_left=cls._index_of(o["bottom_left"]),
+            bottom_right=cls._index_of(o["bottom_right"]),
         )
 
+    @staticmethod
+    def _index_of(word: easy_chat.Word | int) -> int:
+        # Words are decoded before the mail words that contain them
+        return word.index if isinstance(word, easy_chat.Word) else word
+
     @staticmethod
     def _try_until_no_key_error(o: JSONObject, *object_hooks: JSONObjectHook) -> Any:
         for hook in object_hooks:
@@ -73,6 +72,100 @@ class PkmJSONSerializer(JSONDecoder, JSONEncoder):
             return o
 
 
+@functools.cache
+def _word_index() -> _WordIndex:
+    word_index = _WordIndex(by_category_and_text={}, by_text={})
+    for word in easy_chat.words.values():
+        text = word.text.lower()
+        word_index.by_category_and_text[word.category.name, text] = word
+        word_index.by_text.setdefault(text, word)
+    return word_index
+
+
+# Laid out as the standard library encoder would write it
+MAIL_WORDS_JSON = (
+    '{{"top_left": {}, "top_right": {}, "bottom_left": {}, "bottom_right": {}}}'
+)
+
+
+def encode_json(o: Any) -> str:
+    # Mail words make up most of the reports, so they're written straight from
+    # each word's JSON text, which is only built once
+    if isinstance(o, MailWords):
+        return _mail_words_json(o)
+    if isinstance(o, list) and all(isinstance(item, MailWords) for item in o):
+        return "[" + ", ".join(map(_mail_words_json, o)) + "]"
+
+    orjson = optional_module("orjson", None)
+    if orjson is not None:
+        # Otherwise orjson writes every dataclass field itself
+        options = orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(o, default=to_json_object, option=options).decode()
+
+    # Laid out like orjson, so the output doesn't depend on which is installed
+    return dumps(o, default=to_json_object, separators=(",", ":"), ensure_ascii=False)
+
+
+def to_json_object(o: Any) -> Any:
+    if isinstance(o, MailWords):
+        return {
+            "top_left": _word_json(o.top_left),
+            "top_right": _word_json(o.top_right),
+            "bottom_left": _word_json(o.bottom_left),
+            "bottom_right": _word_json(o.bottom_right),
+        }
+
+    if isinstance(o, easy_chat.Word):
+        return _word_json(o)
+    return o
+
+
+def _mail_words_json(words: MailWords) -> str:
+    return MAIL_WORDS_JSON.format(
+        _word_json_text(words.top_left),
+        _word_json_text(words.top_right),
+        _word_json_text(words.bottom_left),
+        _word_json_text(words.bottom_right),
+    )
+
+
+def _word_json(word: easy_chat.Word | int) -> JSONObject | int:
+    return _word_json_by_index(word.index) if isinstance(word, easy_chat.Word) else word
+
+
+def _word_json_text(word: easy_chat.Word | int) -> str:
+    if isinstance(word, easy_chat.Word):
+        return _word_json_text_by_index(word.index)
+    return dumps(word)
+
+
+# There are few enough words that each one's JSON form is only built once
+@functools.cache
+def _word_json_by_index(index: int) -> JSONObject:
+    word = easy_chat.words[index]
+    return {"text": word.text, "category": word.category.name}
+
+
+@functools.cache
+def _word_json_text_by_index(index: int) -> str:
+    return dumps(_word_json_by_index(index))
+
+
+# Newline-delimited JSON, a document per line, so that long result streams can
+# be written and read without holding them all in memory
+def dump_json_lines(objects: Iterable[Any], output: IO[str]) -> None:
+    for o in objects:
+        output.write(encode_json(o))
+        output.write("\n")
+
+
+def load_json_lines(input: IO[str]) -> Iterator[Any]:
+    decoder = PkmJSONSerializer()
+    for line in input:
+        if line.strip():
+            yield decoder.decode(line)
+
+
 def constructor_kwargs(type: type, kwargs: KwArgs) -> KwArgs:
     arg_names = inspect.signature(type.__init__).parameters.keys()
     return {k: v for k, v in kwargs.items() if k in arg_names}
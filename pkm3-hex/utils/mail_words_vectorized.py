@@ -0,0 +1,207 @@
+import functools
+from typing import NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data import easy_chat
+from .MailWordsCost import MailWordsCost
+
+type U8Array = npt.NDArray[np.uint8]
+type U16Array = npt.NDArray[np.uint16]
+type I64Array = npt.NDArray[np.int64]
+type IndexArray = npt.NDArray[np.intp]
+
+type WordPair = tuple[int, int, int]
+type Combination = tuple[int, WordPair, WordPair]
+
+
+class _WordTables(NamedTuple):
+    indices: U16Array
+    is_word: npt.NDArray[np.bool_]
+    scroll_distances: U8Array
+
+
+class _CostTables(NamedTuple):
+    # Cost of each index, regardless of whether it's changed
+    costs: I64Array
+    is_usable: npt.NDArray[np.bool_]
+
+
+class _WordPairs(NamedTuple):
+    pv: U16Array
+    tid: U16Array
+    costs: I64Array
+    residues: U8Array
+    original: int
+
+
+class Combinations:
+    _high: _WordPairs
+    _low: _WordPairs
+    _max_cost: Optional[int]
+
+    def __init__(
+        self,
+        pv: int,
+        otid: int,
+        *,
+        chunk: tuple[int, int] = (0, 1),
+        cost: MailWordsCost = MailWordsCost(),
+    ):
+        high = _word_pairs(pv >> 16 & 0xFF_FF, otid >> 16 & 0xFF_FF, 16, cost)
+        low = _word_pairs(pv & 0xFF_FF, otid & 0xFF_FF, 0, cost)
+
+        bounds = cost.pair_bounds(_min_cost(high), _min_cost(low))
+        if bounds is not None:
+            high_bound, low_bound = bounds
+            high = _take(high, np.flatnonzero(high.costs <= high_bound))
+            low = _take(low, np.flatnonzero(low.costs <= low_bound))
+
+        chunk_index, chunk_count = chunk
+        self._high = _take(high, np.arange(chunk_index, len(high.pv), chunk_count))
+        self._low = low
+        self._max_cost = cost.max_cost
+
+    def best_for_order(self, mod24: int, k: Optional[int]) -> list[Combination]:
+        high_rows, low_rows = self._rows_for_order(mod24, k)
+        costs = self._high.costs[high_rows] + self._low.costs[low_rows]
+
+        if self._max_cost is not None:
+            within = np.flatnonzero(costs <= self._max_cost)
+            high_rows, low_rows, costs = (
+                high_rows[within],
+                low_rows[within],
+                costs[within],
+            )
+
+        if k is not None and k < len(costs):
+            kth_cost = np.partition(costs, k - 1)[k - 1]
+            within = np.flatnonzero(costs <= kth_cost)
+            high_rows, low_rows, costs = (
+                high_rows[within],
+                low_rows[within],
+                costs[within],
+            )
+
+        # Pairs are sorted, so breaking ties by row yields the same order as the
+        # heap-based search
+        ranking = np.lexsort((low_rows, high_rows, costs))[:k]
+        high_rows, low_rows = high_rows[ranking], low_rows[ranking]
+        high_pairs = zip(
+            self._high.costs[high_rows].tolist(),
+            self._high.pv[high_rows].tolist(),
+            self._high.tid[high_rows].tolist(),
+        )
+        low_pairs = zip(
+            self._low.costs[low_rows].tolist(),
+            self._low.pv[low_rows].tolist(),
+            self._low.tid[low_rows].tolist(),
+        )
+        return [
+            (combination_cost, high, low)
+            for combination_cost, high, low in zip(
+                costs[ranking].tolist(), high_pairs, low_pairs
+            )
+        ]
+
+    def _rows_for_order(
+        self, mod24: int, k: Optional[int]
+    ) -> tuple[IndexArray, IndexArray]:
+        # Rows are sorted, so the k best combinations of each residue block are
+        # within its first k rows, plus one in case the original is excluded.
+        rows_limit = None if k is None else k + 1
+
+        high_rows: list[IndexArray] = []
+        low_rows: list[IndexArray] = []
+        for residue in np.unique(self._high.residues).tolist():
+            high = np.flatnonzero(self._high.residues == residue)[:rows_limit]
+            low = np.flatnonzero(self._low.residues == (mod24 - residue) % 24)
+            low = low[:rows_limit]
+            high_rows.append(np.repeat(high, len(low)))
+            low_rows.append(np.tile(low, len(high)))
+
+        if not high_rows:
+            no_rows = np.empty(0, dtype=np.intp)
+            return no_rows, no_rows
+
+        high_rows_array = np.concatenate(high_rows)
+        low_rows_array = np.concatenate(low_rows)
+        is_original = (high_rows_array == self._high.original) & (
+            low_rows_array == self._low.original
+        )
+        return high_rows_array[~is_original], low_rows_array[~is_original]
+
+
+def _word_pairs(i0: int, i1: int, shift: int, cost: MailWordsCost) -> _WordPairs:
+    tables = _word_tables()
+    cost_tables = _cost_tables(cost)
+    companions = tables.indices ^ np.uint16(i0 ^ i1)
+    is_valid = tables.is_word[companions] & ~(
+        (tables.indices == i0) & (companions == i1)
+    )
+
+    pv = np.concatenate(([i0], tables.indices[is_valid])).astype(np.uint16)
+    tid = np.concatenate(([i1], companions[is_valid])).astype(np.uint16)
+    is_usable = cost_tables.is_usable[pv] & cost_tables.is_usable[tid]
+    costs = cost_tables.costs[pv] + cost_tables.costs[tid]
+    costs += cost.changed_word * ((pv != i0).astype(np.int64) + (tid != i1))
+
+    rows = np.flatnonzero(is_usable)
+    sorting = rows[np.lexsort((tid[rows], pv[rows], costs[rows]))]
+    pv = pv[sorting]
+    original = np.flatnonzero(sorting == 0)
+    return _WordPairs(
+        pv=pv,
+        tid=tid[sorting],
+        costs=costs[sorting],
+        residues=((pv.astype(np.uint32) << shift) % 24).astype(np.uint8),
+        original=int(original[0]) if len(original) else -1,
+    )
+
+
+def _take(pairs: _WordPairs, rows: IndexArray) -> _WordPairs:
+    original = np.flatnonzero(rows == pairs.original)
+    return _WordPairs(
+        pv=pairs.pv[rows],
+        tid=pairs.tid[rows],
+        costs=pairs.costs[rows],
+        residues=pairs.residues[rows],
+        original=int(original[0]) if len(original) else -1,
+    )
+
+
+def _min_cost(pairs: _WordPairs) -> int:
+    return int(pairs.costs.min()) if len(pairs.costs) else 0
+
+
+@functools.lru_cache(maxsize=16)
+def _cost_tables(cost: MailWordsCost) -> _CostTables:
+    tables = _word_tables()
+    costs = cost.scroll_distance * tables.scroll_distances.astype(np.int64)
+    is_usable = np.ones(2**16, dtype=np.bool_)
+
+    locked = [
+        word.index
+        for word in easy_chat.words.values()
+        if not cost.is_unlocked(word.category)
+    ]
+    if cost.locked_category is None:
+        is_usable[locked] = False
+    else:
+        costs[locked] += cost.locked_category
+    return _CostTables(costs=costs, is_usable=is_usable)
+
+
+@functools.cache
+def _word_tables() -> _WordTables:
+    indices = np.fromiter(easy_chat.words.keys(), dtype=np.uint16)
+    is_word = np.zeros(2**16, dtype=np.bool_)
+    is_word[indices] = True
+    scroll_distances = np.zeros(2**16, dtype=np.uint8)
+    scroll_distances[indices] = np.fromiter(
+        (word.scroll_distance for word in easy_chat.words.values()), dtype=np.uint8
+    )
+    return _WordTables(
+        indices=indices, is_word=is_word, scroll_distances=scroll_distances
+    )
@@ -0,0 +1,14 @@
+import functools
+import importlib
+from types import ModuleType
+from typing import Optional
+
+
+@functools.cache
+def optional_module(name: str, package: Optional[str]) -> Optional[ModuleType]:
+    # Optional backends are only imported when first needed, since numpy alone
+    # takes longer to import than anything a single command does
+    try:
+        return importlib.import_module(name, package)
+    except ImportError:
+        return None
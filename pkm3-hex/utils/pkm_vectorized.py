@@ -0,0 +1,11 @@
+import numpy as np
+
+
+def xor_substructures(
+    buffer: bytes, *, record_size: int, offset: int, size: int
+) -> bytes:
+    # One row per record, one column per 32-bit word
+    records = np.frombuffer(buffer, dtype="<u4").reshape(-1, record_size // 4).copy()
+    encryption_keys = records[:, 0] ^ records[:, 1]
+    records[:, offset // 4 : (offset + size) // 4] ^= encryption_keys[:, np.newaxis]
+    return records.tobytes()
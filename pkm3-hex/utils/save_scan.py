@@ -0,0 +1,93 @@
+import glob
+import struct
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .. import data
+from .GameSaveBlock import GameSaveBlock, Pc
+from .Pkm import PkmSubstructuresOrder
+
+type ScanRecord = dict[str, Any]
+
+
+# Saves submitted per worker before waiting for the oldest one, so that only a
+# few saves' worth of records are held in memory at any time.
+IN_FLIGHT_PER_JOB = 2
+
+SAVE_FILE_PATTERN = "*.sav"
+
+
+def scan_saves(paths: Iterable[str | Path], *, jobs: int = 1) -> Iterator[ScanRecord]:
+    for records in map_saves(scan_save, expand_save_paths(paths), jobs=jobs):
+        yield from records
+
+
+def map_saves[T, R](
+    function: Callable[[T], R], saves: Iterable[T], *, jobs: int = 1
+) -> Iterator[R]:
+    # Results are yielded in the order of the saves
+    if jobs == 1:
+        yield from map(function, saves)
+        return
+
+    # Like multiprocessing, which it loads, only imported when it's used
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: deque[Future[R]] = deque()
+        try:
+            for save in saves:
+                pending.append(executor.submit(function, save))
+                if len(pending) >= jobs * IN_FLIGHT_PER_JOB:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def scan_save(save_path: Path) -> list[ScanRecord]:
+    try:
+        save_block = GameSaveBlock.open(save_path, validate=True)
+        columns = save_block.pc.decode_all()
+    except (OSError, ValueError, struct.error) as error:
+        return [{"save_path": str(save_path), "error": str(error)}]
+
+    slots_per_box = Pc.Box.ROWS * Pc.Box.COLS
+    return [
+        {
+            "save_path": str(save_path),
+            "slot": save_block.slot,
+            "box": position // slots_per_box + 1,
+            "row": position % slots_per_box // Pc.Box.COLS + 1,
+            "col": position % Pc.Box.COLS + 1,
+            "species": data.pkm_species[species].name,
+            "personality_value": pv,
+            "original_trainer_id": otid,
+            "is_bad_egg": bool(is_bad_egg),
+            "substructure_order": PkmSubstructuresOrder(mod24).name,
+        }
+        for position, species, pv, otid, is_bad_egg, mod24 in zip(
+            columns.positions,
+            columns.species,
+            columns.personality_value,
+            columns.original_trainer_id,
+            columns.is_bad_egg,
+            columns.substructure_order,
+        )
+    ]
+
+
+def expand_save_paths(paths: Iterable[str | Path]) -> Iterator[Path]:
+    # Directories are searched recursively, and glob patterns expanded. Other
+    # paths are kept even if they don't exist, so that they're reported as
+    # unreadable rather than skipped.
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob(SAVE_FILE_PATTERN))
+        elif not path.is_file() and glob.has_magic(str(path)):
+            yield from map(Path, sorted(glob.iglob(str(path), recursive=True)))
+        else:
+            yield path
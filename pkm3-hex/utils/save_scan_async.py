@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+import struct
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional, Sequence
+
+from .GameSaveBlock import GameSaveBlock
+from .Pkm import PcPkm
+from .save_scan import expand_save_paths
+
+
+@dataclass
+class ScannedPkm:
+    save_path: Path
+    slot: GameSaveBlock.Slot
+    box: int
+    row: int
+    col: int
+    pkm: PcPkm
+
+
+@dataclass
+class ScanError:
+    save_path: Path
+    error: str
+
+
+async def aiter_pc(
+    paths: Iterable[str | Path],
+    *,
+    concurrency: int = 4,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[ScannedPkm | ScanError]:
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+
+    # Decoded saves wait here to be consumed. When it's full, decoding saves
+    # keep holding the semaphore, so no more files are read until the consumer
+    # catches up.
+    queue: asyncio.Queue[Sequence[ScannedPkm | ScanError]] = asyncio.Queue(
+        maxsize=concurrency
+    )
+    producer = asyncio.create_task(_produce_pc(paths, semaphore, queue, executor))
+
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait((getter, producer), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                break
+            for scanned_pkm in getter.result():
+                yield scanned_pkm
+
+        # Saves that can't be read or decoded are yielded as a ScanError, like
+        # the error records of scan_saves, so this only raises on a bug
+        producer.result()
+        while not queue.empty():
+            for scanned_pkm in queue.get_nowait():
+                yield scanned_pkm
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+async def _produce_pc(
+    paths: Iterable[str | Path],
+    semaphore: asyncio.BoundedSemaphore,
+    queue: asyncio.Queue[Sequence[ScannedPkm | ScanError]],
+    executor: Optional[Executor],
+) -> None:
+    loop = asyncio.get_running_loop()
+
+    async def read_and_decode(save_path: Path):
+        try:
+            save_bytes = await asyncio.to_thread(save_path.read_bytes)
+            save_pkm = await loop.run_in_executor(
+                executor, decode_pc, save_path, save_bytes
+            )
+        except (OSError, ValueError, struct.error) as error:
+            await queue.put([ScanError(save_path=save_path, error=str(error))])
+        else:
+            await queue.put(save_pkm)
+        finally:
+            semaphore.release()
+
+    # Expanding globs lists directories, so it's kept off the event loop too
+    save_paths = expand_save_paths(paths)
+    async with asyncio.TaskGroup() as tasks:
+        while save_path := await asyncio.to_thread(next, save_paths, None):
+            await semaphore.acquire()
+            tasks.create_task(read_and_decode(save_path))
+
+
+def decode_pc(save_path: Path, save_bytes: bytes) -> list[ScannedPkm]:
+    save_block = GameSaveBlock.from_bytes(save_bytes, validate=True)
+    return [
+        ScannedPkm(
+            save_path=save_path,
+            slot=save_block.slot,
+            box=box,
+            row=row + 1,
+            col=col + 1,
+            pkm=pkm,
+        )
+        for box, box_data in enumerate(save_block.pc.boxes, start=1)
+        for (row, col), pkm in box_data.items()
+    ]
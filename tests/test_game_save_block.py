@@ -0,0 +1,52 @@
+import importlib
+
+game_save_block = importlib.import_module("pkm3-hex.utils.GameSaveBlock")
+GameSaveBlock = game_save_block.GameSaveBlock
+Section = game_save_block.Section
+PcPkm = importlib.import_module("pkm3-hex.utils.Pkm").PcPkm
+
+PV = 0x414C_303C
+OTID = 0xC386_3A44
+MISC_FLAGS = 0x02
+
+
+def blank_save() -> bytes:
+    save = bytearray(0x20000)
+    for block in (GameSaveBlock.A_BLOCK_OFFSET, GameSaveBlock.B_BLOCK_OFFSET):
+        for id in range(GameSaveBlock.SECTION_COUNT):
+            start = block + id * GameSaveBlock.SECTION_SIZE
+            Section.FOOTER.pack_into(
+                save, start + Section.ID_OFFSET, id, 0, Section.SIGNATURE, 1
+            )
+    return bytes(save)
+
+
+def encrypted_pkm() -> bytes:
+    record = bytearray(PcPkm.SIZE)
+    PcPkm._Substructures.PV_OTID.pack_into(record, PcPkm.PV_OFFSET, PV, OTID)
+    record[PcPkm.MISC_OFFSET] = MISC_FLAGS
+    PcPkm.xor_substructures(record)
+    return bytes(record)
+
+
+def test_edited_pkm_is_written_back_valid() -> None:
+    save_block = GameSaveBlock.from_bytes(blank_save())
+    save_block.set_raw_pkm_bytes(0, 0, 0, encrypted_pkm())
+    pkm = save_block.pc.boxes[0][0, 0]
+    assert not pkm.is_bad_egg
+
+    # Decrypted data edited in place, so its checksum is stale when decoded
+    edited = bytearray(pkm.data)
+    growth = PcPkm._Substructures.from_bytes(edited, xor=False)
+    experience_offset = (
+        PcPkm._Substructures.OFFSET + growth.get_substructure_offset("G") + 0x4
+    )
+    edited[experience_offset : experience_offset + 4] = (1000).to_bytes(4, "little")
+    save_block.set_pkm(0, 0, 0, PcPkm.from_bytes(edited, xor_substructures=False))
+
+    written = GameSaveBlock.from_bytes(save_block.to_bytes()).pc.boxes[0][0, 0]
+    substructures = PcPkm._Substructures.from_bytes(written.data, xor=False)
+    assert not written.is_bad_egg
+    assert written.data[PcPkm.MISC_OFFSET] == MISC_FLAGS
+    assert written.checksum == substructures.data_sum() & 0xFF_FF
+    assert written.growth.experience == 1000
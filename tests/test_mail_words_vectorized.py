@@ -0,0 +1,48 @@
+import importlib
+import itertools
+
+import pytest
+
+pytest.importorskip("numpy")
+
+MailWords = importlib.import_module("pkm3-hex.utils.MailWords").MailWords
+MailWordsCost = importlib.import_module("pkm3-hex.utils.MailWordsCost").MailWordsCost
+mail_words_vectorized = importlib.import_module("pkm3-hex.utils.mail_words_vectorized")
+
+PVS_OTIDS = [
+    (0x414C_303C, 0xC386_3A44),
+    (0x0611_102A, 0x1601_4A30),
+    (0x24AD_24C4, 0x2A03_0C1B),
+    (0x4E09_0770, 0x98D7_0037),
+    (0xB8EC_8191, 0x188A_C292),
+]
+
+COSTS = [
+    MailWordsCost(),
+    MailWordsCost(max_cost=25),
+    MailWordsCost(
+        changed_word=3,
+        unlocked_categories=frozenset({"POKEMON", "MISC"}),
+        locked_category=10,
+    ),
+    MailWordsCost(
+        unlocked_categories=frozenset({"POKEMON", "POKEMON_2", "MISC"}),
+        locked_category=5,
+        max_cost=40,
+    ),
+]
+
+
+@pytest.mark.parametrize("pv_otid", PVS_OTIDS)
+@pytest.mark.parametrize("cost", COSTS)
+@pytest.mark.parametrize("k", [1, 5, None])
+def test_backends_agree(
+    pv_otid: tuple[int, int], cost: MailWordsCost, k: int | None
+) -> None:
+    combinations = mail_words_vectorized.Combinations(*pv_otid, cost=cost)
+    word_pairs = MailWords._word_pairs(pv_otid, (0, 1), cost)
+    for mod24 in range(24):
+        expected = list(
+            itertools.islice(MailWords._sorted_combinations(word_pairs, mod24, cost), k)
+        )
+        assert combinations.best_for_order(mod24, k) == expected
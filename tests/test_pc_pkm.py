@@ -0,0 +1,18 @@
+import importlib
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+pc_pkm = importlib.import_module("pkm3-hex.pc_pkm")
+
+
+def test_export_fails_on_missing_save(tmp_path: Path) -> None:
+    missing = tmp_path / "missing.sav"
+    output = tmp_path / "pc.pack"
+    result = CliRunner().invoke(
+        pc_pkm.app,
+        ["export", str(missing), "--format", "packed", "--output-file", str(output)],
+    )
+
+    assert result.exit_code == 1
+    assert str(missing) in result.output
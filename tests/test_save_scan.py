@@ -0,0 +1,17 @@
+import importlib
+from pathlib import Path
+
+save_scan = importlib.import_module("pkm3-hex.utils.save_scan")
+
+
+def test_missing_save_is_reported(tmp_path: Path) -> None:
+    missing = tmp_path / "missing.sav"
+    assert list(save_scan.expand_save_paths([missing])) == [missing]
+
+    [record] = save_scan.scan_saves([missing])
+    assert record["save_path"] == str(missing)
+    assert "error" in record
+
+
+def test_glob_without_matches_is_empty(tmp_path: Path) -> None:
+    assert list(save_scan.expand_save_paths([tmp_path / "*.sav"])) == []